@@ -0,0 +1,133 @@
+"""Base58 and Base58Check, mirroring src/Base58.sol and the legacy address
+checks of BitcoinUtils.validateBitcoinAddress.
+
+Strings are decoded as one big integer instead of the 32-bit limb loop
+of Base58.decode, and the double SHA-256 checksums are cached, so
+validating exports with repeated addresses hashes each payload once.
+"""
+
+import hashlib
+from functools import lru_cache
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Digit of every ASCII character, -1 for characters outside the alphabet.
+DIGITS = [-1] * 128
+for _digit, _char in enumerate(ALPHABET):
+    DIGITS[ord(_char)] = _digit
+
+CHECKSUM_CACHE_SIZE = 1 << 16
+
+# BitcoinNetworkEncoder.Network order
+NETWORKS = ("mainnet", "testnet", "regtest", "simnet")
+
+# Leading characters from BitcoinNetworkEncoder.getBtcBase58_P2PKH/P2SH. They
+# are characters, not version bytes, and the testnet and regtest ones are
+# swapped ('2' is P2SH, 'm' is P2PKH), which does not matter since both are
+# accepted.
+P2PKH_PREFIXES = ("1", "2", "2", "S")
+P2SH_PREFIXES = ("3", "m", "m", "s")
+
+# Version bytes of P2PKH and P2SH addresses of every network. Simnet P2SH
+# addresses (0x7b) start with 'r', so the contract rejects them.
+P2PKH_VERSIONS = (0x00, 0x6f, 0x6f, 0x3f)
+P2SH_VERSIONS = (0x05, 0xc4, 0xc4, 0x7b)
+
+# Prefixes from BitcoinNetworkEncoder.getBtcBech32Prefix
+BECH32_PREFIXES = ("bc1", "tb1", "bcrt1", "sb1")
+
+# Decoded size of a legacy address: version, 20-byte hash, 4-byte checksum.
+ADDRESS_SIZE = 25
+MIN_ADDRESS_LENGTH = 26
+MAX_ADDRESS_LENGTH = 35
+
+REASON_PREFIX = "not a base58 address of the network"
+REASON_LENGTH = "invalid address length"
+REASON_ALPHABET = "invalid base58 character"
+REASON_SIZE = "invalid decoded size"
+REASON_CHECKSUM = "invalid checksum"
+REASON_VERSION = "unexpected version byte"
+
+
+def encode(data):
+    """Base58 string of bytes, leading zero bytes become '1'."""
+    n = int.from_bytes(data, "big")
+    out = []
+    while n:
+        n, digit = divmod(n, 58)
+        out.append(ALPHABET[digit])
+    zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * zeros + "".join(reversed(out))
+
+
+def decode(string):
+    """Bytes of a base58 string, raises ValueError for characters outside the alphabet."""
+    n = 0
+    for char in string.encode("utf-8", "surrogateescape"):
+        digit = DIGITS[char] if char < 128 else -1
+        if digit < 0:
+            raise ValueError("invalid base58 digit")
+        n = n * 58 + digit
+    zeros = len(string) - len(string.lstrip("1"))
+    return bytes(zeros) + n.to_bytes((n.bit_length() + 7) // 8, "big")
+
+
+@lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def checksum(payload):
+    """First 4 bytes of the double SHA-256 of payload."""
+    return hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+
+
+def encode_check(version, payload):
+    """Base58Check string of a version byte and payload."""
+    data = bytes([version]) + payload
+    return encode(data + checksum(data))
+
+
+def decode_check(string):
+    """(version, payload) of a Base58Check string, raises ValueError."""
+    data = decode(string)
+    if len(data) < 5:
+        raise ValueError("too short for a checksum")
+    if checksum(data[:-4]) != data[-4:]:
+        raise ValueError("invalid checksum")
+    return data[0], data[1:-4]
+
+
+def validate_address(network, address, strict=False):
+    """Return (version, hash, reason) for one legacy address of a network index.
+
+    Mirrors the base58 branch of BitcoinUtils.validateBitcoinAddress and
+    its checks in the same order. The contract only checks the leading
+    character, with strict the version byte must also be the P2PKH or P2SH
+    version of the network.
+    """
+    first = address[:1]
+    if not (first == P2PKH_PREFIXES[network] or
+            first == P2SH_PREFIXES[network] and not address.startswith(BECH32_PREFIXES[network])):
+        return (None, None, REASON_PREFIX)
+    if not MIN_ADDRESS_LENGTH <= len(address) <= MAX_ADDRESS_LENGTH:
+        return (None, None, REASON_LENGTH)
+    try:
+        data = decode(address)
+    except ValueError:
+        return (None, None, REASON_ALPHABET)
+    if len(data) != ADDRESS_SIZE:
+        return (None, None, REASON_SIZE)
+    if checksum(data[:21]) != data[21:]:
+        return (None, None, REASON_CHECKSUM)
+    if strict and data[0] not in (P2PKH_VERSIONS[network], P2SH_VERSIONS[network]):
+        return (None, None, REASON_VERSION)
+    return (data[0], data[1:21], "")
+
+
+def validate_many(network, addresses, strict=False):
+    """validate_address for every address of an iterable, repeated addresses are validated once."""
+    seen = {}
+    out = []
+    for address in addresses:
+        result = seen.get(address)
+        if result is None:
+            result = seen[address] = validate_address(network, address, strict)
+        out.append(result)
+    return out
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+"""Throughput and allocation benchmarks for segwit_addr.
+
+Every benchmark runs one segwit_addr function over a corpus: the
+VALID_ADDRESS/INVALID_ADDRESS vectors from tests.py and synthetic P2WPKH
+(20-byte) and P2TR (32-byte) program sets. For each one the best time
+per call over several rounds is reported, and tracemalloc measures the
+peak and retained bytes of one pass over the corpus.
+
+Usage:
+    python3 bench_segwit_addr.py -o baseline.json
+    python3 bench_segwit_addr.py --compare baseline.json --threshold 10
+The comparison exits with status 1 if any benchmark got more than
+threshold percent slower, or allocates more than threshold percent more
+at peak, than in the baseline.
+
+    python3 bench_segwit_addr.py --profiling --compare baseline.json decode encode
+runs the benchmarks with segwit_addr profiling enabled and then disabled
+again, and prints the overhead and the stage counters. It checks that
+disabling restored the original function objects. With --compare, e.g.
+against a baseline written before profiling was added, it also exits
+with status 1 if a benchmark with profiling disabled regressed against
+that baseline.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import segwit_addr
+from tests import INVALID_ADDRESS, VALID_ADDRESS
+
+SYNTHETIC_SIZE = 1000
+MIN_TIME = 0.2
+ROUNDS = 5
+THRESHOLD = 10.0
+
+
+def synthetic_programs(length, n=SYNTHETIC_SIZE):
+    """n random witness programs of a given length, the same on every run."""
+    rnd = random.Random(length)
+    return [bytes(rnd.randrange(256) for _ in range(length)) for _ in range(n)]
+
+
+def corpora():
+    """Named lists of (hrp, witver, program, address) for valid addresses and invalid address strings."""
+    valid = []
+    for address, script in VALID_ADDRESS:
+        hrp = address[:address.rfind("1")].lower()
+        script = bytes.fromhex(script)
+        witver = script[0] - 0x50 if script[0] else 0
+        valid.append((hrp, witver, script[2:], address))
+    synthetic = {}
+    for name, hrp, witver, length in (("p2wpkh", "bc", 0, 20), ("p2tr", "tb", 1, 32)):
+        synthetic[name] = [(hrp, witver, program, segwit_addr.encode(hrp, witver, program))
+                           for program in synthetic_programs(length)]
+    return {"valid": valid, **synthetic}, INVALID_ADDRESS
+
+
+def benchmarks():
+    """List of (name, function, argument tuples)."""
+    valid, invalid = corpora()
+    out = []
+    for corpus, entries in valid.items():
+        decoded = [segwit_addr.bech32_decode(address) for _, _, _, address in entries]
+        fivebit = [data[1:] for _, data, _ in decoded]
+        out += [
+            (f"bech32_polymod/{corpus}", segwit_addr.bech32_polymod,
+             [(segwit_addr.bech32_hrp_expand(hrp) + data,) for hrp, data, _ in decoded]),
+            (f"convertbits_8_to_5/{corpus}", segwit_addr.convertbits,
+             [(list(program), 8, 5) for _, _, program, _ in entries]),
+            (f"convertbits_5_to_8/{corpus}", segwit_addr.convertbits,
+             [(data, 5, 8, False) for data in fivebit]),
+            (f"bech32_decode/{corpus}", segwit_addr.bech32_decode,
+             [(address,) for _, _, _, address in entries]),
+            (f"decode/{corpus}", segwit_addr.decode,
+             [(hrp, address) for hrp, _, _, address in entries]),
+            (f"encode/{corpus}", segwit_addr.encode,
+             [(hrp, witver, list(program)) for hrp, witver, program, _ in entries]),
+        ]
+    out += [
+        ("bech32_decode/invalid", segwit_addr.bech32_decode, [(address,) for address in invalid]),
+        ("decode/invalid", segwit_addr.decode,
+         [(hrp, address) for address in invalid for hrp in ("bc", "tb")]),
+    ]
+    return out
+
+
+def _run(func, cases):
+    for args in cases:
+        func(*args)
+
+
+def measure_time(func, cases, min_time=MIN_TIME, rounds=ROUNDS):
+    """Best nanoseconds per call over rounds of at least min_time / rounds each."""
+    started = time.perf_counter_ns()
+    _run(func, cases)
+    passes = max(1, int(min_time / rounds * 1e9 / max(1, time.perf_counter_ns() - started)))
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter_ns()
+        for _ in range(passes):
+            _run(func, cases)
+        elapsed = (time.perf_counter_ns() - started) / (passes * len(cases))
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_allocations(func, cases):
+    """(peak, retained) bytes per call of one pass, results are kept alive."""
+    _run(func, cases)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        results = [func(*args) for args in cases]
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del results
+    return (peak - start) / len(cases), (current - start) / len(cases)
+
+
+def run_benchmarks(selected=None, min_time=MIN_TIME, rounds=ROUNDS):
+    """Run the benchmarks whose name starts with one of selected, return the result dict."""
+    results = {}
+    for name, func, cases in benchmarks():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        peak, retained = measure_allocations(func, cases)
+        results[name] = {
+            "calls": len(cases),
+            "ns_per_call": measure_time(func, cases, min_time, rounds),
+            "peak_bytes_per_call": peak,
+            "retained_bytes_per_call": retained,
+        }
+    return {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+
+
+def measure_profiling_overhead(selected=None, min_time=MIN_TIME, rounds=ROUNDS):
+    """(results with profiling on, results after disabling it, profile of the run with profiling on).
+
+    Raises AssertionError if disabling did not restore the original functions.
+    """
+    originals = {name: getattr(segwit_addr, name) for name in segwit_addr.PROFILED_FUNCTIONS}
+    segwit_addr.reset_profile()
+    # benchmarks() is called inside, so the outermost calls are instrumented too
+    with segwit_addr.profiling():
+        enabled = run_benchmarks(selected, min_time, rounds)
+    profile = segwit_addr.profile_snapshot()
+    restored = {name: getattr(segwit_addr, name) for name in segwit_addr.PROFILED_FUNCTIONS}
+    assert all(restored[name] is func for name, func in originals.items()), "profiling left wrappers behind"
+    disabled = run_benchmarks(selected, min_time, rounds)
+    return enabled, disabled, profile
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Lines describing regressions of more than threshold percent against baseline."""
+    regressions = []
+    limit = 1 + threshold / 100
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        for key in ("ns_per_call", "peak_bytes_per_call"):
+            if before[key] > 0 and now[key] > before[key] * limit:
+                regressions.append(f"{name}: {key} {before[key]:.1f} -> {now[key]:.1f} "
+                                   f"(+{(now[key] / before[key] - 1) * 100:.1f}%)")
+    return regressions
+
+
+def profiling_overhead(args, baseline=None):
+    """--profiling: print the overhead table and the stage counters.
+
+    Exits with status 1 if a benchmark with profiling disabled regressed against baseline.
+    """
+    enabled, disabled, profile = measure_profiling_overhead(args.benchmarks, args.min_time, args.rounds)
+    print(f"{'benchmark':32} {'off ns':>10} {'on ns':>10} {'on':>8}" + (f" {'off vs base':>12}" if baseline else ""))
+    for name, result in disabled["results"].items():
+        off = result["ns_per_call"]
+        on = enabled["results"][name]["ns_per_call"]
+        line = f"{name:32} {off:10.0f} {on:10.0f} {(on / off - 1) * 100:+7.1f}%"
+        before = baseline["results"].get(name) if baseline else None
+        if before:
+            line += f" {(off / before['ns_per_call'] - 1) * 100:+11.1f}%"
+        print(line)
+    print(f"\n{'stage':24} {'calls':>12} {'bytes':>14} {'ns/call':>10}")
+    for stage, counters in profile.items():
+        ns = counters["ns"] / counters["calls"] if counters["calls"] else 0.0
+        print(f"{stage:24} {counters['calls']:12} {counters['bytes']:14} {ns:10.0f}")
+    if baseline:
+        regressions = compare(baseline, disabled, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION with profiling disabled {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark segwit_addr.")
+    parser.add_argument("-o", "--output", help="write results as JSON, e.g. a new baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="fail on regressions against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed regression in percent")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="seconds per benchmark")
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--profiling", action="store_true",
+                        help="measure segwit_addr profiling on and off instead, see above")
+    parser.add_argument("benchmarks", nargs="*", help="only run benchmarks starting with these names")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    if args.profiling:
+        profiling_overhead(args, baseline)
+        return
+
+    current = run_benchmarks(args.benchmarks, args.min_time, args.rounds)
+
+    print(f"{'benchmark':32} {'ns/call':>10} {'peak B':>9} {'kept B':>9}" +
+          (f" {'vs base':>8}" if baseline else ""))
+    for name, result in current["results"].items():
+        line = (f"{name:32} {result['ns_per_call']:10.0f} {result['peak_bytes_per_call']:9.0f} "
+                f"{result['retained_bytes_per_call']:9.0f}")
+        before = baseline["results"].get(name) if baseline else None
+        if before:
+            line += f" {(result['ns_per_call'] / before['ns_per_call'] - 1) * 100:+7.1f}%"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if baseline:
+        regressions = compare(baseline, current, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+
+"""Extract segwit outputs from Bitcoin Core blk*.dat files, one file per core.
+
+A block file is a sequence of records
+    network magic (4 bytes) | block size (uint32 little-endian) | block
+followed by zero bytes where bitcoind preallocated space. Every file is
+memory-mapped and its blocks and transactions are walked by offset: no
+objects are built per transaction, inputs and witnesses are only
+skipped, and the txid is only hashed for transactions with a matching
+output. Files XORed with blocks/xor.dat are deobfuscated one block at a
+time. Matching outputs are witness scriptPubKeys, the inverse of
+segwit_scriptpubkey in tests.py, of the selected witness versions.
+
+Every hit is a tuple (txid, vout, witver, program, value) with the txid
+in RPC byte order, the program as bytes and the value in satoshi.
+
+Usage:
+    python3 blk_parser.py ~/.bitcoin/regtest/blocks/blk*.dat --hrp bcrt
+    python3 blk_parser.py blk*.dat --xor-key blocks/xor.dat --filter deposits.xor --index deposits.idx
+Output lines are tab separated txid, vout, witver, program hex, value
+and, with --hrp, the address.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import deposit_index
+import program_filter
+import segwit_addr
+
+# pchMessageStart of each network
+MAGICS = {
+    "main": bytes.fromhex("f9beb4d9"),
+    "testnet3": bytes.fromhex("0b110907"),
+    "testnet4": bytes.fromhex("1c163f28"),
+    "signet": bytes.fromhex("0a03cf40"),
+    "regtest": bytes.fromhex("fabfb5da"),
+}
+
+WITVERS = (0, 1)
+HEADER_SIZE = 80
+ADDRESS_BATCH_SIZE = 4096
+XOR_CHUNK_SIZE = 1 << 16
+
+# Workers keep the filter of a path open between files.
+_filters = {}
+
+
+def read_xor_key(path):
+    """Key of blocks/xor.dat, which bitcoind 28+ XORs into block files."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _deobfuscate(data, key, offset=0, chunk_size=XOR_CHUNK_SIZE):
+    """data at file offset XOR the key repeated from file offset 0, in chunks of about chunk_size."""
+    n = len(data)
+    shift = offset % len(key)
+    key = key[shift:] + key[:shift]
+    step = len(key) * max(1, chunk_size // len(key))
+    pad = key * (step // len(key))
+    out = bytearray(n)
+    for lo in range(0, n, step):
+        chunk = data[lo:lo + step]
+        m = len(chunk)
+        out[lo:lo + m] = (int.from_bytes(chunk, "little") ^ int.from_bytes(pad[:m], "little")).to_bytes(m, "little")
+    return bytes(out)
+
+
+def _txid(buf, start, body, outputs_end, end):
+    """Double SHA-256 of a transaction without marker, flag and witnesses, in RPC byte order."""
+    h = hashlib.sha256(buf[start:start + 4])
+    h.update(buf[body:outputs_end])
+    h.update(buf[end - 4:end])
+    return hashlib.sha256(h.digest()).digest()[::-1]
+
+
+def scan_block(buf, pos, witvers=WITVERS, out=None):
+    """Append the witness outputs of the block at buf[pos:] to out and return it."""
+    if out is None:
+        out = []
+    witver_opcodes = {(witver + 0x50 if witver else 0): witver for witver in witvers}
+    pos += HEADER_SIZE
+    ntx = buf[pos]
+    pos += 1
+    if ntx >= 0xfd:
+        ntx, pos = _varint_rest(buf, pos, ntx)
+    for _ in range(ntx):
+        start = pos
+        pos += 4
+        segwit = buf[pos] == 0
+        if segwit:
+            pos += 2
+        body = pos
+        nin = buf[pos]
+        pos += 1
+        if nin >= 0xfd:
+            nin, pos = _varint_rest(buf, pos, nin)
+        for _ in range(nin):
+            n = buf[pos + 36]
+            pos += 37
+            if n >= 0xfd:
+                n, pos = _varint_rest(buf, pos, n)
+            pos += n + 4
+        nout = buf[pos]
+        pos += 1
+        if nout >= 0xfd:
+            nout, pos = _varint_rest(buf, pos, nout)
+        hits = None
+        for vout in range(nout):
+            n = buf[pos + 8]
+            script = pos + 9
+            if n >= 0xfd:
+                n, script = _varint_rest(buf, script, n)
+            # OP_n <push of n - 2 bytes>, programs of 2 to 40 bytes
+            if 4 <= n <= 42 and buf[script + 1] == n - 2 and buf[script] in witver_opcodes:
+                if hits is None:
+                    hits = []
+                hits.append((vout, witver_opcodes[buf[script]], bytes(buf[script + 2:script + n]),
+                             int.from_bytes(buf[pos:pos + 8], "little")))
+            pos = script + n
+        outputs_end = pos
+        if segwit:
+            for _ in range(nin):
+                nitems = buf[pos]
+                pos += 1
+                if nitems >= 0xfd:
+                    nitems, pos = _varint_rest(buf, pos, nitems)
+                for _ in range(nitems):
+                    n = buf[pos]
+                    pos += 1
+                    if n >= 0xfd:
+                        n, pos = _varint_rest(buf, pos, n)
+                    pos += n
+        pos += 4
+        if hits is not None:
+            txid = _txid(buf, start, body, outputs_end, pos)
+            out += [(txid,) + hit for hit in hits]
+    return out
+
+
+def _varint_rest(buf, pos, first):
+    """Value and end of a CompactSize whose first byte (0xfd-0xff) was read."""
+    size = 2 if first == 0xfd else 4 if first == 0xfe else 8
+    return int.from_bytes(buf[pos:pos + size], "little"), pos + size
+
+
+def blocks(buf, magics=tuple(MAGICS.values()), xor_key=None):
+    """(offset, size) of the blocks of a block file, up to padding or a truncated block.
+
+    With xor_key, buf is an obfuscated file and the record headers are deobfuscated.
+    """
+    pos = 0
+    end = len(buf)
+    while pos + 8 <= end:
+        record = buf[pos:pos + 8]
+        if xor_key:
+            record = _deobfuscate(record, xor_key, pos)
+        magic = bytes(record[:4])
+        if magic not in magics:
+            break
+        size = int.from_bytes(record[4:8], "little")
+        if pos + 8 + size > end:
+            break
+        yield pos + 8, size
+        pos += 8 + size
+
+
+def scan_file(path, witvers=WITVERS, xor_key=None, filter_path=None):
+    """Worker: (hits, bytes of blocks, number of blocks) of one block file.
+
+    With filter_path, only hits whose program is in that ProgramFilter are kept.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            xor_key = xor_key if xor_key and any(xor_key) else None
+            out = []
+            nbytes = 0
+            nblocks = 0
+            # Indexing mmap and bytes is faster than indexing a memoryview.
+            for offset, size in blocks(mm, xor_key=xor_key):
+                if xor_key:
+                    scan_block(_deobfuscate(mm[offset:offset + size], xor_key, offset), 0, witvers, out)
+                else:
+                    scan_block(mm, offset, witvers, out)
+                nbytes += size + 8
+                nblocks += 1
+    if filter_path is not None:
+        xor_filter = _filters.get(filter_path)
+        if xor_filter is None:
+            xor_filter = _filters[filter_path] = program_filter.ProgramFilter.open(filter_path)
+        out = [hit for hit in out if len(hit[3]) == 32 and hit[3] in xor_filter]
+    return out, nbytes, nblocks
+
+
+def scan_files(paths, workers=None, witvers=WITVERS, xor_key=None, filter_path=None, stats=None):
+    """Hits of many block files, in file order, with one file per worker process.
+
+    stats, if given, is a dict that receives the totals "bytes" and "blocks".
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    totals = {"bytes": 0, "blocks": 0}
+
+    def collect(future):
+        hits, nbytes, nblocks = future.result()
+        totals["bytes"] += nbytes
+        totals["blocks"] += nblocks
+        return hits
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in paths:
+            pending.append(pool.submit(scan_file, path, witvers, xor_key, filter_path))
+            if len(pending) >= 2 * workers:
+                yield from collect(pending.popleft())
+        while pending:
+            yield from collect(pending.popleft())
+    if stats is not None:
+        stats.update(totals)
+
+
+def with_addresses(hits, hrp, batch_size=ADDRESS_BATCH_SIZE):
+    """Hook that appends segwit_addr.encode(hrp, witver, program) to every hit.
+
+    Hits are encoded in batches with segwit_addr.encode_many, one call
+    per witness version, which gives the same addresses as encode.
+    """
+    hits = iter(hits)
+    while True:
+        batch = list(islice(hits, batch_size))
+        if not batch:
+            return
+        addresses = [None] * len(batch)
+        positions = {}
+        for i, hit in enumerate(batch):
+            positions.setdefault(hit[2], []).append(i)
+        for witver, indexes in positions.items():
+            programs = [batch[i][3] for i in indexes]
+            for i, address in zip(indexes, segwit_addr.encode_many(hrp, witver, programs)):
+                addresses[i] = address
+        for hit, address in zip(batch, addresses):
+            yield hit + (address,)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract segwit outputs from blk*.dat files.")
+    parser.add_argument("files", nargs="+", help="block files")
+    parser.add_argument("--hrp", help="also print the address with this HRP")
+    parser.add_argument("--witver", type=int, action="append", help="witness version, can be repeated (default: 0, 1)")
+    parser.add_argument("--xor-key", help="blocks/xor.dat of the datadir")
+    parser.add_argument("--filter", help="only keep programs in this program_filter.py file")
+    parser.add_argument("--index", help="only keep programs in this deposit_index.py file")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    xor_key = read_xor_key(args.xor_key) if args.xor_key else None
+    filter_path = os.path.abspath(args.filter) if args.filter else None
+    stats = {}
+    started = time.perf_counter()
+    hits = scan_files([os.path.abspath(path) for path in args.files], args.workers,
+                      tuple(args.witver or WITVERS), xor_key, filter_path, stats)
+    index = deposit_index.DepositIndex(args.index) if args.index else None
+    try:
+        if index is not None:
+            hits = (hit for hit in hits if hit[3] in index)
+        if args.hrp:
+            hits = with_addresses(hits, args.hrp)
+        nhits = 0
+        out = sys.stdout
+        for hit in hits:
+            nhits += 1
+            fields = [hit[0].hex(), str(hit[1]), str(hit[2]), hit[3].hex(), str(hit[4])]
+            if len(hit) > 5:
+                fields.append(hit[5] or "")
+            out.write("\t".join(fields) + "\n")
+        out.flush()
+    finally:
+        if index is not None:
+            index.close()
+    elapsed = time.perf_counter() - started
+    rate = stats.get("bytes", 0) / elapsed / 1e6 if elapsed > 0 else 0.0
+    print(f"{stats.get('blocks', 0)} blocks, {nhits} outputs in {elapsed:.2f}s ({rate:.1f} MB/s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""On-disk reverse index from deposit address to getBTCDepositAddress(index).
+
+File layout (all integers big-endian):
+    header:  magic "BTCDIDX1" | uint64 number of sorted records | hrp, 16 bytes NUL padded
+    records: 32-byte witness program | uint32 index
+The first records are sorted by witness program and searched in place
+through mmap. Records appended after them (newly minted indexes) form an
+unsorted tail that is loaded into a dict on open; compact() merges the
+tail back into the sorted part.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+
+import deriver
+import segwit_addr
+
+MAGIC = b"BTCDIDX1"
+HEADER = struct.Struct(">8sQ16s")
+RECORD_SIZE = 36
+PROGRAM_SIZE = 32
+
+# Records sorted in memory at once by build_index before merging runs.
+RUN_SIZE = 1 << 20
+
+
+def _record(index, program):
+    """Pack one record."""
+    if len(program) != PROGRAM_SIZE:
+        raise ValueError("witness program must be 32 bytes")
+    return bytes(program) + index.to_bytes(4, "big")
+
+
+def _write_header(f, nsorted, hrp):
+    """Write the header: magic "BTCDIDX1" | uint64 number of sorted records | hrp, 16 bytes NUL padded."""
+    hrp_bytes = hrp.encode()
+    if len(hrp_bytes) > 16:
+        raise ValueError("hrp is too long")
+    f.write(HEADER.pack(MAGIC, nsorted, hrp_bytes))
+
+
+def _sorted_runs(records, run_size, tmpdir):
+    """Sort records in runs of run_size, spilling runs to temporary files."""
+    runs = []
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= run_size:
+            runs.append(_spill(sorted(batch), tmpdir))
+            batch = []
+    if not runs:
+        return [sorted(batch)]
+    if batch:
+        runs.append(_spill(sorted(batch), tmpdir))
+    return [_read_run(path) for path in runs]
+
+
+def _spill(batch, tmpdir):
+    """Write a sorted batch of records to a temporary file in tmpdir, return its path."""
+    fd, path = tempfile.mkstemp(dir=tmpdir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"".join(batch))
+    return path
+
+
+def _read_run(path):
+    """Yield the records of a spilled run and delete its file when done."""
+    with open(path, "rb") as f:
+        while True:
+            record = f.read(RECORD_SIZE)
+            if not record:
+                break
+            yield record
+    os.unlink(path)
+
+
+def _write_sorted(path, hrp, runs):
+    """Merge sorted runs into a new index file, replacing path atomically."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        _write_header(f, 0, hrp)
+        n = 0
+        for record in heapq.merge(*runs):
+            f.write(record)
+            n += 1
+        f.seek(0)
+        _write_header(f, n, hrp)
+    os.replace(tmp, path)
+
+
+def build_index(path, hrp, entries, run_size=RUN_SIZE):
+    """Write an index of (index, program) entries to path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.TemporaryDirectory(dir=directory) as tmpdir:
+        records = (_record(index, program) for index, program in entries)
+        _write_sorted(path, hrp, _sorted_runs(records, run_size, tmpdir))
+
+
+def derived_entries(seed_address, start, stop):
+    """(hrp, iterator of (index, program)) of getBTCDepositAddress(index) for index in range(start, stop)."""
+    hrp, _, _ = segwit_addr.bech32_decode(seed_address)
+    if hrp is None:
+        raise ValueError(f"cannot parse btc address {seed_address!r}")
+    px, py = deriver.parse_btc_taproot_address(hrp, seed_address)
+    chain_code = deriver.derive_chain_code(px, py)
+
+    def entries():
+        for lo in range(start, stop, deriver.DERIVE_BATCH_SIZE):
+            indexes = range(lo, min(stop, lo + deriver.DERIVE_BATCH_SIZE))
+            programs = deriver.derive_receiving_programs(px, py, indexes, chain_code)
+            yield from zip(indexes, programs)
+
+    return hrp, entries()
+
+
+def build_index_from_seed(path, seed_address, start, stop):
+    """Index getBTCDepositAddress(index) for index in range(start, stop)."""
+    hrp, entries = derived_entries(seed_address, start, stop)
+    build_index(path, hrp, entries)
+
+
+class DepositIndex:
+    """Read and append access to an index file, see the module docstring.
+
+    The file is opened read-only unless writable is set, which append and
+    compact need.
+    """
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        self.writable = writable
+        self._open()
+
+    def _open(self):
+        self._file = open(self.path, "r+b" if self.writable else "rb")
+        magic, self._nsorted, hrp = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a deposit index")
+        self.hrp = hrp.rstrip(b"\0").decode()
+        sorted_end = HEADER.size + self._nsorted * RECORD_SIZE
+        self._mm = mmap.mmap(self._file.fileno(), sorted_end, access=mmap.ACCESS_READ)
+        self._file.seek(sorted_end)
+        tail = self._file.read()
+        tail = tail[:len(tail) - len(tail) % RECORD_SIZE]
+        self._tail = {tail[i:i + PROGRAM_SIZE]: int.from_bytes(tail[i + PROGRAM_SIZE:i + RECORD_SIZE], "big")
+                      for i in range(0, len(tail), RECORD_SIZE)}
+        self._file.seek(sorted_end + len(tail))
+
+    @classmethod
+    def create(cls, path, hrp):
+        """Create an empty index file and open it."""
+        build_index(path, hrp, ())
+        return cls(path, writable=True)
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._nsorted + len(self._tail)
+
+    def _program_at(self, i):
+        offset = HEADER.size + i * RECORD_SIZE
+        return self._mm[offset:offset + PROGRAM_SIZE]
+
+    def _search(self, program):
+        """Position of program in the sorted part, or -1.
+
+        Programs are uniformly distributed hashes, so interpolation on the
+        first 8 bytes lands close to the target; after a few probes it
+        falls back to plain binary search.
+        """
+        lo, hi = 0, self._nsorted - 1
+        key = int.from_bytes(program[:8], "big")
+        probes = 0
+        while lo <= hi:
+            if probes < 4 and hi - lo > 8:
+                vlo = int.from_bytes(self._program_at(lo)[:8], "big")
+                vhi = int.from_bytes(self._program_at(hi)[:8], "big")
+                if key < vlo or key > vhi:
+                    return -1
+                mid = lo if vhi == vlo else lo + (key - vlo) * (hi - lo) // (vhi - vlo)
+                probes += 1
+            else:
+                mid = (lo + hi) // 2
+            found = self._program_at(mid)
+            if found == program:
+                return mid
+            if found < program:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return -1
+
+    def lookup_program(self, program):
+        """Index whose witness program is program, or None."""
+        program = bytes(program)
+        if len(program) != PROGRAM_SIZE:
+            return None
+        pos = self._search(program)
+        if pos >= 0:
+            offset = HEADER.size + pos * RECORD_SIZE + PROGRAM_SIZE
+            return int.from_bytes(self._mm[offset:offset + 4], "big")
+        return self._tail.get(program)
+
+    def __contains__(self, program):
+        return self.lookup_program(program) is not None
+
+    def lookup(self, address):
+        """Index of a deposit address, or None."""
+        witver, witprog = segwit_addr.decode(self.hrp, address)
+        if witver != 1:
+            return None
+        return self.lookup_program(witprog)
+
+    def _check_writable(self):
+        if not self.writable:
+            raise ValueError(f"{self.path} is opened read-only")
+
+    def append(self, index, program):
+        """Add a newly minted index at the end of the file."""
+        self._check_writable()
+        record = _record(index, program)
+        self._file.write(record)
+        self._file.flush()
+        self._tail[record[:PROGRAM_SIZE]] = index
+
+    def compact(self):
+        """Merge the appended tail into the sorted part and reopen."""
+        self._check_writable()
+        sorted_end = HEADER.size + self._nsorted * RECORD_SIZE
+        sorted_part = (self._mm[i:i + RECORD_SIZE] for i in range(HEADER.size, sorted_end, RECORD_SIZE))
+        tail = sorted(_record(index, program) for program, index in self._tail.items())
+        _write_sorted(self.path, self.hrp, [sorted_part, tail])
+        self.close()
+        self._open()
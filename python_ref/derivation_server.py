@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+"""Local JSON-over-HTTP service for getBTCDepositAddress(index).
+
+Derives receiving addresses off-chain with deriver.py instead of an RPC
+call per lookup. Endpoints:
+    POST /derive  {"seed": "<taproot address>", "index": 5, "hrp": "tb"}
+                  -> {"address": "tb1p..."}
+                  hrp is optional and defaults to the HRP of the seed
+    GET  /stats   -> cache counters and latency histograms
+
+Concurrent requests for the same (seed, index, hrp) share one
+computation, results are kept in a size-bounded LRU cache, and the
+elliptic curve work runs on a process pool so the event loop never
+blocks on it.
+
+Usage:
+    python3 derivation_server.py --port 8737
+    python3 derivation_server.py --unix /run/deriver.sock
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import deriver
+import secp256k1
+import segwit_addr
+
+CACHE_SIZE = 1 << 16
+# Not 8545, which anvil's JSON-RPC listens on (env-anvil).
+PORT = 8737
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is +Inf.
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+MAX_BODY_SIZE = 1 << 16
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+@lru_cache(maxsize=64)
+def _parse_seed(seed):
+    """Parent pubkey of a seed address, cached per worker process."""
+    seed_hrp, _, _ = segwit_addr.bech32_decode(seed)
+    if seed_hrp is None:
+        raise ValueError(f"cannot parse btc address {seed!r}")
+    return deriver.parse_btc_taproot_address(seed_hrp, seed)
+
+
+def derive_address(seed, index, hrp):
+    """Worker: deriveReceivingAddressFromIndex for the pubkey of seed."""
+    px, py = _parse_seed(seed)
+    return deriver.derive_receiving_address_from_index(px, py, index, hrp)
+
+
+def make_executor(workers=None):
+    """Process pool for derive_address.
+
+    Workers come from a forkserver: a forked worker would inherit the
+    sockets of open client connections and keep them open after the
+    server closed them. The G table is built when a worker starts.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"),
+                               initializer=secp256k1.g_table)
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+
+    def snapshot(self):
+        cumulative = []
+        acc = 0
+        for bound, n in zip(self.buckets + ("+Inf",), self.counts):
+            acc += n
+            cumulative.append([bound, acc])
+        return {"buckets": cumulative, "count": acc, "sum": self.total}
+
+
+class DerivationService:
+    """Coalescing, caching front of derive_address."""
+
+    def __init__(self, executor=None, cache_size=CACHE_SIZE):
+        self.executor = executor
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.request_latency = Histogram()
+        self.derive_latency = Histogram()
+
+    async def derive(self, seed, index, hrp=None):
+        """Address for (seed, index, hrp), raises ValueError for bad input."""
+        if not isinstance(seed, str) or not isinstance(index, int) or isinstance(index, bool):
+            raise ValueError("seed must be a string and index an integer")
+        if not 0 <= index < deriver.HARDENED_KEY_START:
+            raise ValueError("Index must be less than HARDENED_KEY_START")
+        if hrp is None:
+            hrp = seed[:seed.rfind("1")].lower()
+        elif not isinstance(hrp, str):
+            raise ValueError("hrp must be a string")
+        key = (seed, index, hrp)
+        address = self._cache.get(key)
+        if address is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return address
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The request that was deriving it got cancelled, derive it here.
+            return await self.derive(seed, index, hrp)
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        started = time.perf_counter()
+        try:
+            address = await asyncio.get_running_loop().run_in_executor(
+                self.executor, derive_address, seed, index, hrp)
+        except Exception as e:
+            self.errors += 1
+            future.set_exception(e)
+            # Retrieved here so a failure without waiters is not reported as unhandled.
+            future.exception()
+            raise
+        else:
+            future.set_result(address)
+        finally:
+            # Cancelling this request resolves nothing above, release the coalesced requests.
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+            self.derive_latency.observe(time.perf_counter() - started)
+        self._cache[key] = address
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return address
+
+    def stats(self):
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "cache_size": len(self._cache),
+            "cache_capacity": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "request_latency_seconds": self.request_latency.snapshot(),
+            "derive_latency_seconds": self.derive_latency.snapshot(),
+        }
+
+    async def handle(self, method, path, body):
+        """Return (status, response object) for one HTTP request."""
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, self.stats()
+        if path != "/derive":
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        started = time.perf_counter()
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            address = await self.derive(request.get("seed"), request.get("index"), request.get("hrp"))
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            self.request_latency.observe(time.perf_counter() - started)
+        return 200, {"address": address}
+
+    async def serve_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it is closed."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get("content-length", "0")
+                length = int(length) if length.isdigit() else -1
+                if not 0 <= length <= MAX_BODY_SIZE:
+                    status, response = 413, {"error": "invalid or too large request body"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self.handle(method, target.split("?", 1)[0], body)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                payload = json.dumps(response).encode()
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service, host="127.0.0.1", port=PORT, unix_path=None):
+    """Start the HTTP server, on a TCP port or a Unix socket."""
+    if unix_path is not None:
+        return await asyncio.start_unix_server(service.serve_connection, path=unix_path)
+    return await asyncio.start_server(service.serve_connection, host, port)
+
+
+async def _main(args):
+    with make_executor(args.workers) as executor:
+        service = DerivationService(executor, args.cache_size)
+        server = await serve(service, args.host, args.port, args.unix)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve off-chain getBTCDepositAddress over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--unix", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE, help="cached addresses")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
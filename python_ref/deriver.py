@@ -0,0 +1,224 @@
+"""Off-chain mirror of src/Deriver.sol and BTCDepositAddressDeriver.sol.
+
+Every function reproduces its Solidity counterpart bit for bit, so
+addresses can be derived locally instead of calling
+BTCDepositAddressDeriver.getBTCDepositAddress(index) over RPC.
+"""
+
+import hashlib
+
+import segwit_addr
+from hmac_sha512 import HmacSha512
+from secp256k1 import (PP, NN, INFINITY, ec_add, ec_mul, g_mul, lift_x, derive_y,
+                       batch_to_affine, g_mul_jacobian, jac_add_affine, jac_mul_joint)
+
+# HardenedKeyStart, only normal child keys can be derived from a pubkey.
+HARDENED_KEY_START = 0x80000000
+
+# Indexes derived per batch_to_affine call in derive_range.
+DERIVE_BATCH_SIZE = 1024
+
+# sha256("TapTweak")
+SHA256_TAP_TWEAK = bytes.fromhex("e80fe1639c9ca050e3af1b39c143c63e429cbceb15d940fbb5c5a1f4af57c5e9")
+
+
+def serialize_pubkey(x, y):
+    """33-byte compressed pubkey, abi.encodePacked(prefix, bytes32(x))."""
+    return (b"\x03" if y % 2 == 1 else b"\x02") + x.to_bytes(32, "big")
+
+
+def parse_btc_taproot_address(hrp, address):
+    """Pubkey (x, y) of a taproot address, same as BTCDepositAddressDeriver.parseBTCTaprootAddress."""
+    witver, witprog = segwit_addr.decode(hrp, address)
+    if witver is None:
+        raise ValueError(f"cannot parse btc address {address!r} with hrp {hrp!r}")
+    if witver != 1 or len(witprog) != 32:
+        raise ValueError(f"unsupported btc address {address!r}")
+    x = int.from_bytes(bytes(witprog), "big")
+    if x == 0 or x >= PP:
+        raise ValueError(f"unsupported btc address {address!r}")
+    return (x, lift_x(x))
+
+
+def parse_eth_address(address):
+    """20 address bytes of a 0x-prefixed hex Ethereum address, the checksum case is not verified."""
+    if len(address) != 42 or address[:2] not in ("0x", "0X"):
+        raise ValueError(f"invalid eth address {address!r}")
+    try:
+        return bytes.fromhex(address[2:])
+    except ValueError:
+        raise ValueError(f"invalid eth address {address!r}") from None
+
+
+def parse_pubkey(data):
+    """Point (x, y) of a 33-byte compressed or 64/65-byte uncompressed pubkey."""
+    if len(data) == 33 and data[0] in (2, 3):
+        x = int.from_bytes(data[1:], "big")
+        return (x, derive_y(data[0], x))
+    if len(data) == 65 and data[0] == 4:
+        data = data[1:]
+    if len(data) == 64:
+        return (int.from_bytes(data[:32], "big"), int.from_bytes(data[32:], "big"))
+    raise ValueError("pubkey must be 33, 64 or 65 bytes")
+
+
+def get_coefficient(x, y, eth_addr):
+    """sha256(abi.encode(x, y, addr)) as an integer, same as Deriver.getCoefficient.
+
+    abi.encode pads every argument to a 32-byte word, the address is left
+    padded with zeros.
+    """
+    data = x.to_bytes(32, "big") + y.to_bytes(32, "big") + bytes(12) + eth_addr
+    return int.from_bytes(hashlib.sha256(data).digest(), "big")
+
+
+def get_combined_pubkey(p1x, p1y, p2x, p2y, c1, c2):
+    """c1 * P1 + c2 * P2, same as Deriver.getCombinedPubkey."""
+    x1, y1 = ec_mul(c1, p1x, p1y)
+    x2, y2 = ec_mul(c2, p2x, p2y)
+    return ec_add(x1, y1, x2, y2)
+
+
+def get_pubkey_from_address(p1x, p1y, p2x, p2y, eth_addr):
+    """Per-user pubkey, same as Deriver.getPubkeyFromAddress."""
+    c1 = get_coefficient(p1x, p1y, eth_addr)
+    c2 = get_coefficient(p2x, p2y, eth_addr)
+    return get_combined_pubkey(p1x, p1y, p2x, p2y, c1, c2)
+
+
+def get_btc_taproot_addr_from_pubkey(x, hrp):
+    """Taproot address for an x-only pubkey, same as Deriver.getBtcTaprootAddrFromPubkey."""
+    return segwit_addr.encode(hrp, 1, x.to_bytes(32, "big"))
+
+
+def tap_tweak(x):
+    """TaggedHash("TapTweak", x) as an integer."""
+    return int.from_bytes(hashlib.sha256(SHA256_TAP_TWEAK + SHA256_TAP_TWEAK + x.to_bytes(32, "big")).digest(), "big")
+
+
+def compute_taproot_key_no_script(x, y):
+    """Tweak a pubkey with no script path, same as Deriver.computeTaprootKeyNoScript."""
+    x1, y1 = g_mul(tap_tweak(x))
+    return ec_add(x, y, x1, y1)
+
+
+def get_btc_address_taproot_no_script_from_eth(p1x, p1y, p2x, p2y, hrp, eth_addr):
+    """Address of an Ethereum user, same as Deriver.getBtcAddressTaprootNoScriptFromEth."""
+    x, y = get_pubkey_from_address(p1x, p1y, p2x, p2y, eth_addr)
+    if y % 2 == 1:
+        y = PP - y
+    x_tweaked, _ = compute_taproot_key_no_script(x, y)
+    return get_btc_taproot_addr_from_pubkey(x_tweaked, hrp)
+
+
+def eth_programs(p1x, p1y, p2x, p2y, eth_addrs):
+    """Witness programs for many Ethereum addresses.
+
+    Same as get_btc_address_taproot_no_script_from_eth for each. The
+    combined key is one joint multiplication using the cached window
+    tables of P1 and P2, and the combined and tweaked keys are kept in
+    Jacobian coordinates and converted with one batch inversion each.
+    """
+    combined = batch_to_affine([
+        jac_mul_joint(get_coefficient(p1x, p1y, eth_addr), p1x, p1y,
+                      get_coefficient(p2x, p2y, eth_addr), p2x, p2y)
+        for eth_addr in eth_addrs])
+    tweaked = []
+    for x, y in combined:
+        if y % 2 == 1:
+            y = PP - y
+        tweaked.append(jac_add_affine(g_mul_jacobian(tap_tweak(x)), x, y))
+    return [x.to_bytes(32, "big") for x, _ in batch_to_affine(tweaked)]
+
+
+def derive_chain_code(x, y):
+    """Chain code of a parent pubkey, sha256 of its serialized form."""
+    return hashlib.sha256(serialize_pubkey(x, y)).digest()
+
+
+def child_tweak_context(serialized_parent, chain_code):
+    """HMAC context keyed with chain_code with the serialized parent absorbed."""
+    return HmacSha512(chain_code).with_prefix(serialized_parent)
+
+
+def derive_child_tweak(serialized_parent, chain_code, index, context=None):
+    """The il scalar of BIP32 child derivation, checked like deriveChildPubkeyBip32.
+
+    context from child_tweak_context saves the HMAC key schedule when
+    deriving many indexes of one parent.
+    """
+    if index >= HARDENED_KEY_START:
+        raise ValueError("Index must be less than HARDENED_KEY_START")
+    if context is None:
+        context = child_tweak_context(serialized_parent, chain_code)
+    il = int.from_bytes(context.digest(index.to_bytes(4, "big"))[:32], "big")
+    if il >= NN:
+        raise ValueError("il must be less than NN")
+    return il
+
+
+def derive_child_pubkey_bip32(px, py, chain_code, index):
+    """Non-hardened BIP32 child pubkey, same as Deriver.deriveChildPubkeyBip32."""
+    il = derive_child_tweak(serialize_pubkey(px, py), chain_code, index)
+    ilx, ily = g_mul(il)
+    child = ec_add(px, py, ilx, ily)
+    if child == INFINITY:
+        raise ValueError("child pubkey is point at infinity")
+    return child
+
+
+def derive_receiving_program(px, py, index, chain_code=None):
+    """32-byte witness program of the receiving address for index."""
+    if chain_code is None:
+        chain_code = derive_chain_code(px, py)
+    child_x, child_y = derive_child_pubkey_bip32(px, py, chain_code, index)
+    if child_y % 2 == 1:
+        child_y = PP - child_y
+    x_tweaked, _ = compute_taproot_key_no_script(child_x, child_y)
+    return x_tweaked.to_bytes(32, "big")
+
+
+def derive_receiving_programs(px, py, indexes, chain_code=None):
+    """Witness programs for many indexes, same as derive_receiving_program for each.
+
+    Points stay in Jacobian coordinates and each of the two affine
+    conversions (child keys, then tweaked keys) is one batch inversion.
+    """
+    if chain_code is None:
+        chain_code = derive_chain_code(px, py)
+    serialized = serialize_pubkey(px, py)
+    context = child_tweak_context(serialized, chain_code)
+    children = batch_to_affine([
+        jac_add_affine(g_mul_jacobian(derive_child_tweak(serialized, chain_code, index, context)), px, py)
+        for index in indexes])
+    tweaked = []
+    for child_x, child_y in children:
+        if (child_x, child_y) == INFINITY:
+            raise ValueError("child pubkey is point at infinity")
+        if child_y % 2 == 1:
+            child_y = PP - child_y
+        tweaked.append(jac_add_affine(g_mul_jacobian(tap_tweak(child_x)), child_x, child_y))
+    return [x.to_bytes(32, "big") for x, _ in batch_to_affine(tweaked)]
+
+
+def derive_receiving_address_from_index(px, py, index, hrp):
+    """Receiving address for index, same as Deriver.deriveReceivingAddressFromIndex."""
+    return segwit_addr.encode(hrp, 1, derive_receiving_program(px, py, index))
+
+
+def derive_range(parent_addr, start, stop):
+    """Yield getBTCDepositAddress(index) for index in range(start, stop).
+
+    parent_addr is the seed taproot address passed to setSeed, its HRP
+    selects the network. Parent-side values are computed once.
+    """
+    hrp, _, _ = segwit_addr.bech32_decode(parent_addr)
+    if hrp is None:
+        raise ValueError(f"cannot parse btc address {parent_addr!r}")
+    px, py = parse_btc_taproot_address(hrp, parent_addr)
+    chain_code = derive_chain_code(px, py)
+    encode_hrp = segwit_addr.make_encoder(hrp)
+    for lo in range(start, stop, DERIVE_BATCH_SIZE):
+        indexes = range(lo, min(stop, lo + DERIVE_BATCH_SIZE))
+        for program in derive_receiving_programs(px, py, indexes, chain_code):
+            yield encode_hrp(1, program)
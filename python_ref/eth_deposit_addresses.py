@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""Derive getBtcAddressTaprootNoScriptFromEth for Ethereum addresses on all cores.
+
+Reads Ethereum addresses from a file or stdin, one per line. Every output
+line is tab separated:
+    eth_address  btc_address  failure_reason
+with an empty btc address for lines that are not Ethereum addresses
+and the reason "empty line" for blank lines. Output keeps the input
+order with one line per input line and is written as chunks complete, so
+memory use does not grow with the input.
+
+Usage:
+    python3 eth_deposit_addresses.py --p1 02f229... --p2 038243... --hrp bc users.txt -o deposits.tsv
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import deriver
+import segwit_addr
+from validate_addresses import REASON_EMPTY, run
+
+# About 1500 lines of 0x-prefixed addresses per task.
+CHUNK_SIZE = 1 << 16
+
+REASON_ETH = "invalid eth address"
+
+
+def derive_lines(data, p1, p2, hrp):
+    """Derive addresses for newline separated eth addresses, return (output, nlines, nvalid)."""
+    lines = []
+    rows = data.split(b"\n")
+    if not rows[-1]:
+        rows.pop()
+    for line in rows:
+        line = line.strip()
+        if not line:
+            lines.append(("", None))
+            continue
+        text = line.decode("utf-8", "surrogateescape")
+        try:
+            lines.append((text, deriver.parse_eth_address(text)))
+        except ValueError:
+            lines.append((text, None))
+    eth_addrs = [eth_addr for _, eth_addr in lines if eth_addr is not None]
+    programs = iter(deriver.eth_programs(*p1, *p2, eth_addrs))
+    encode = segwit_addr.make_encoder(hrp)
+    out = []
+    for text, eth_addr in lines:
+        if not text:
+            out.append(f"\t\t{REASON_EMPTY}\n")
+        elif eth_addr is None:
+            out.append(f"{text}\t\t{REASON_ETH}\n")
+        else:
+            out.append(f"{text}\t{encode(1, next(programs))}\t\n")
+    return "".join(out).encode("utf-8", "surrogateescape"), len(lines), len(eth_addrs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Derive BTC deposit addresses for Ethereum addresses.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, '-' for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--p1", required=True, help="first validator pubkey, hex, compressed or uncompressed")
+    parser.add_argument("--p2", required=True, help="second validator pubkey, hex, compressed or uncompressed")
+    parser.add_argument("--hrp", required=True, help="network HRP, e.g. bc, tb, bcrt")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes per task")
+    args = parser.parse_args(argv)
+
+    p1 = deriver.parse_pubkey(bytes.fromhex(args.p1))
+    p2 = deriver.parse_pubkey(bytes.fromhex(args.p2))
+    started = time.perf_counter()
+    if args.output == "-":
+        nlines, nvalid = run(derive_lines, (p1, p2, args.hrp), args.input, sys.stdout.buffer, args.workers,
+                             args.chunk_size)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as out:
+            nlines, nvalid = run(derive_lines, (p1, p2, args.hrp), args.input, out, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    rate = nvalid / elapsed if elapsed > 0 else 0.0
+    print(f"{nlines} lines, {nvalid} derived, {nlines - nvalid} invalid "
+          f"in {elapsed:.2f}s ({rate:.0f} addresses/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
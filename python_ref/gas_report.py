@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""Gas cost curves and regression checks from forge output.
+
+Reads `forge snapshot` files (lines "Contract:test() (gas: N)") and the
+tables printed by `forge test --gas-report`. Tests named
+testGas_<function>_<parameter>_<value>, as generated by gen_gas_bench.py,
+are grouped into per-function cost curves over the swept parameter, with
+a least squares line base + slope * value for each.
+
+Usage:
+    forge snapshot --match-contract GasBenchTest --snap temp/gas.snapshot
+    forge test --match-contract GasBenchTest --gas-report > temp/gas-report.txt
+    python3 gas_report.py --snapshot temp/gas.snapshot --gas-report temp/gas-report.txt \\
+        --compare gas_baseline.json
+The comparison exits with status 1 if any test or harness function got
+more than threshold percent more expensive than in the baseline, and
+lists tests and functions that are new or missing against the baseline.
+Write a new baseline with -o.
+"""
+
+import argparse
+import json
+import re
+import sys
+
+THRESHOLD = 0.0
+
+SNAPSHOT_LINE = re.compile(r"^(?P<contract>[^:\s]+):(?P<test>\w+)\([^)]*\)\s+\((?P<stats>[^)]*)\)\s*$")
+BENCH_NAME = re.compile(r"^testGas_(?P<function>[A-Za-z0-9]+)_(?P<parameter>[A-Za-z0-9]+)_(?P<value>\d+)$")
+
+GAS_REPORT_COLUMNS = ("min", "avg", "median", "max", "calls")
+
+
+def parse_snapshot(text):
+    """{"Contract:test": gas} of a snapshot, the median of fuzz and invariant runs."""
+    result = {}
+    for line in text.splitlines():
+        match = SNAPSHOT_LINE.match(line.strip())
+        if match is None:
+            continue
+        stats = dict(item.split(":", 1) for item in match["stats"].replace(" ", "").split(","))
+        gas = stats.get("gas", stats.get("~"))
+        if gas is not None:
+            result[f"{match['contract']}:{match['test']}"] = int(gas)
+    return result
+
+
+def parse_gas_report(text):
+    """{"Contract.function": {min, avg, median, max, calls}} from forge test --gas-report."""
+    result = {}
+    contract = None
+    in_functions = False
+    for line in text.splitlines():
+        cells = [cell.strip() for cell in re.split(r"[|│]", line.strip())[1:-1]]
+        if not cells or not cells[0] or set(cells[0]) <= set("-=+:─═╞╡├┤┼"):
+            continue
+        # "Contract" in newer forge versions
+        if cells[0].lower().endswith(" contract"):
+            contract = cells[0][:-len(" contract")].rsplit(":", 1)[-1]
+            in_functions = False
+        elif cells[0] == "Function Name":
+            in_functions = True
+        elif in_functions and contract is not None and len(cells) >= len(GAS_REPORT_COLUMNS) + 1:
+            try:
+                values = [int(cell) for cell in cells[1:len(GAS_REPORT_COLUMNS) + 1]]
+            except ValueError:
+                continue
+            result[f"{contract}.{cells[0]}"] = dict(zip(GAS_REPORT_COLUMNS, values))
+    return result
+
+
+def fit_line(points):
+    """Least squares (base, slope) of gas over value for [(value, gas)]."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var if var else 0.0
+    return mean_y - slope * mean_x, slope
+
+
+def curves(snapshot):
+    """{"function/parameter": [(value, gas)]} of the benchmark tests of a snapshot, sorted by value."""
+    result = {}
+    for name, gas in snapshot.items():
+        match = BENCH_NAME.match(name.rsplit(":", 1)[-1])
+        if match is not None:
+            key = f"{match['function']}/{match['parameter']}"
+            result.setdefault(key, []).append((int(match["value"]), gas))
+    return {key: sorted(points) for key, points in sorted(result.items())}
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Lines describing gas increases of more than threshold percent against baseline."""
+    regressions = []
+    limit = 1 + threshold / 100
+
+    def check(name, before, now):
+        if before and now > before * limit:
+            regressions.append(f"{name}: {before} -> {now} (+{(now / before - 1) * 100:.2f}%)")
+
+    for name, gas in current.get("snapshot", {}).items():
+        check(name, baseline.get("snapshot", {}).get(name), gas)
+    for name, stats in current.get("gas_report", {}).items():
+        before = baseline.get("gas_report", {}).get(name)
+        if before is not None:
+            for column in ("median", "max"):
+                check(f"{name} {column}", before[column], stats[column])
+    return regressions
+
+
+def added_and_removed(baseline, current):
+    """(names only in current, names only in baseline) of the snapshot and gas report entries."""
+    added = []
+    removed = []
+    for section in ("snapshot", "gas_report"):
+        before = baseline.get(section, {})
+        now = current.get(section, {})
+        added += sorted(name for name in now if name not in before)
+        removed += sorted(name for name in before if name not in now)
+    return added, removed
+
+
+def _read(path):
+    """Contents of a file, or stdin for "-"."""
+    if path == "-":
+        return sys.stdin.read()
+    with open(path) as f:
+        return f.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gas cost curves and regressions from forge output.")
+    parser.add_argument("--snapshot", help="forge snapshot file, '-' for stdin")
+    parser.add_argument("--gas-report", help="saved output of forge test --gas-report, '-' for stdin")
+    parser.add_argument("-o", "--output", help="write results as JSON, e.g. a new baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="fail on gas increases against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed increase in percent")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every point of the curves")
+    args = parser.parse_args(argv)
+    if args.snapshot is None and args.gas_report is None:
+        parser.error("give --snapshot and/or --gas-report")
+
+    current = {
+        "snapshot": parse_snapshot(_read(args.snapshot)) if args.snapshot else {},
+        "gas_report": parse_gas_report(_read(args.gas_report)) if args.gas_report else {},
+    }
+
+    print(f"{'curve':32} {'points':>6} {'first':>10} {'last':>10} {'base':>10} {'per unit':>9}")
+    for key, points in curves(current["snapshot"]).items():
+        base, slope = fit_line(points)
+        print(f"{key:32} {len(points):6} {points[0][1]:10} {points[-1][1]:10} {base:10.0f} {slope:9.1f}")
+        if args.verbose:
+            for value, gas in points:
+                print(f"    {value:6} {gas:10}")
+    if current["gas_report"]:
+        print(f"\n{'function':40} " + " ".join(f"{column:>9}" for column in GAS_REPORT_COLUMNS))
+        for name, stats in sorted(current["gas_report"].items()):
+            print(f"{name:40} " + " ".join(f"{stats[column]:9}" for column in GAS_REPORT_COLUMNS))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        added, removed = added_and_removed(baseline, current)
+        for name in added:
+            print(f"NEW {name}, not in the baseline", file=sys.stderr)
+        for name in removed:
+            print(f"REMOVED {name}, only in the baseline", file=sys.stderr)
+        regressions = compare(baseline, current, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+"""Generate a labeled differential fuzz corpus for Bech32m.decodeSegwitAddress.
+
+Cases are random segwit addresses and mutations of them:
+    valid        correctly encoded, any witness version and length 1..41
+    flip         one character replaced
+    case         upper case or randomly mixed case
+    padding      non-zero padding bits or an extra padding group
+    wrong_const  bech32 checksum for v1+ or bech32m checksum for v0
+Every case is labeled with the result of segwit_addr (through the
+vectorized decode_many, which matches decode row for row).
+
+The corpus is written as chunk files bech32m_corpus_NNNNN.bin that
+test/Bech32mFuzzCorpus.t.sol reads with vm.readFileBinary. Layout, all
+integers big-endian:
+    header:  magic "B32FUZZ1" | uint32 number of records
+    record:  uint8 kind | uint8 hrp length | hrp | uint8 address length | address
+             | uint8 valid | uint8 witver | uint8 program length | program
+Chunks are generated in parallel with numpy and each chunk only depends
+on (seed, chunk index), so a corpus is reproducible.
+
+Usage:
+    python3 gen_fuzz_corpus.py -n 10000000 -o ../temp/fuzz
+    BECH32M_FUZZ_CORPUS=temp/fuzz/bech32m_corpus_00000.bin forge test --mt testFuzzCorpus
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import segwit_addr
+
+MAGIC = b"B32FUZZ1"
+HEADER = struct.Struct(">8sI")
+
+KINDS = ("valid", "flip", "case", "padding", "wrong_const")
+KIND_VALID, KIND_FLIP, KIND_CASE, KIND_PADDING, KIND_WRONG_CONST = range(len(KINDS))
+
+# HRPs from BitcoinNetworkEncoder.getNetworkPrefix
+HRPS = ("bc", "tb", "bcrt", "sb")
+
+CHUNK_SIZE = 1 << 16
+
+
+def chunk_path(out_dir, index):
+    return os.path.join(out_dir, f"bech32m_corpus_{index:05d}.bin")
+
+
+def _random_cases(np, rng, n):
+    """Kinds, HRP indexes, witness versions and program lengths for n cases."""
+    kinds = rng.integers(0, len(KINDS), n)
+    hrps = rng.integers(0, len(HRPS), n)
+    witvers = rng.choice(np.array([0, 1, 2], dtype=np.int64), n, p=[0.4, 0.4, 0.2])
+    other = witvers == 2
+    witvers[other] = rng.integers(2, 17, int(other.sum()))
+    # Mostly the lengths that are valid for the version, sometimes any of 1..41.
+    lengths = np.where(witvers == 0, rng.choice(np.array([20, 32]), n), 32)
+    anything = other | (rng.random(n) < 0.15)
+    lengths[anything] = rng.integers(1, 42, int(anything.sum()))
+    return kinds, hrps, witvers, lengths
+
+
+def _to_5bit(np, programs):
+    """Programs (m, L) of bytes to (m, ceil(8L/5)) 5-bit groups, zero padded."""
+    m, length = programs.shape
+    ngroups = (length * 8 + 4) // 5
+    bits = np.zeros((m, ngroups * 5), dtype=np.uint8)
+    bits[:, :length * 8] = np.unpackbits(programs, axis=1)
+    return bits.reshape(m, ngroups, 5) @ np.array([16, 8, 4, 2, 1], dtype=np.uint8)
+
+
+def _checksums(np, chk0, data, const):
+    """Checksum symbols (m, 6) for 5-bit data rows starting from per-row HRP states chk0."""
+    table = np.array(segwit_addr.POLYMOD_TABLE, dtype=np.uint32)
+    chk = chk0.astype(np.uint32)
+    for j in range(data.shape[1] + 6):
+        value = data[:, j] if j < data.shape[1] else 0
+        chk = ((chk & 0x1ffffff) << 5) ^ value ^ table[chk >> 25]
+    chk ^= const.astype(np.uint32)
+    return np.stack([(chk >> 5 * (5 - i)) & 31 for i in range(6)], axis=1).astype(np.uint8)
+
+
+def _encode_group(np, rng, kinds, hrps, witvers, length, extra):
+    """Data part characters (m, D) of the cases in one (length, extra group) group."""
+    m = len(kinds)
+    programs = rng.integers(0, 256, (m, length), dtype=np.uint8)
+    groups = _to_5bit(np, programs)
+    padbits = groups.shape[1] * 5 - length * 8
+    if padbits:
+        pad = kinds == KIND_PADDING
+        groups[pad, -1] |= rng.integers(1, 1 << padbits, int(pad.sum()), dtype=np.uint8)
+    if extra:
+        groups = np.concatenate([groups, np.zeros((m, 1), dtype=np.uint8)], axis=1)
+    data = np.concatenate([witvers[:, None].astype(np.uint8), groups], axis=1).astype(np.uint32)
+
+    bech32m = witvers != 0
+    bech32m ^= kinds == KIND_WRONG_CONST
+    const = np.where(bech32m, segwit_addr.BECH32M_CONST, 1)
+    chk0 = np.array([segwit_addr.bech32_hrp_polymod(hrp) for hrp in HRPS], dtype=np.uint32)[hrps]
+    symbols = np.concatenate([data.astype(np.uint8), _checksums(np, chk0, data, const)], axis=1)
+    return np.frombuffer(segwit_addr.CHARSET.encode(), dtype=np.uint8)[symbols]
+
+
+def _mutate(np, rng, kinds, addresses):
+    """Apply the flip and case mutations to full addresses in place."""
+    m, width = addresses.shape
+    charset = np.frombuffer(segwit_addr.CHARSET.encode(), dtype=np.uint8)
+    reverse = np.zeros(256, dtype=np.int64)
+    reverse[charset] = np.arange(32)
+
+    flip = np.flatnonzero(kinds == KIND_FLIP)
+    pos = rng.integers(0, width, len(flip))
+    old = addresses[flip, pos]
+    # Mostly another charset character, sometimes any printable byte.
+    new = charset[(reverse[old] + rng.integers(1, 32, len(flip))) % 32]
+    anything = rng.random(len(flip)) < 0.125
+    new[anything] = rng.integers(33, 127, int(anything.sum()), dtype=np.uint8)
+    addresses[flip, pos] = new
+
+    case = np.flatnonzero(kinds == KIND_CASE)
+    letters = (addresses[case] >= ord("a")) & (addresses[case] <= ord("z"))
+    upper = np.where(rng.random(len(case)) < 0.5, 1.0, 0.5)
+    letters &= rng.random(letters.shape) < upper[:, None]
+    addresses[case] -= (letters * 32).astype(np.uint8)
+
+
+def _records(np, kinds, hrp, addresses, valid, witver, programs, lengths):
+    """Serialized records for rows that share an HRP and address width."""
+    out = []
+    m, width = addresses.shape
+    hrp_bytes = hrp.encode()
+    for plen in np.unique(lengths):
+        rows = lengths == plen
+        k = int(rows.sum())
+        columns = [
+            kinds[rows].astype(np.uint8)[:, None],
+            np.full((k, 1), len(hrp_bytes), dtype=np.uint8),
+            np.tile(np.frombuffer(hrp_bytes, dtype=np.uint8), (k, 1)),
+            np.full((k, 1), width, dtype=np.uint8),
+            addresses[rows],
+            valid[rows].astype(np.uint8)[:, None],
+            witver[rows][:, None],
+            np.full((k, 1), plen, dtype=np.uint8),
+            programs[rows, :plen],
+        ]
+        out.append(np.concatenate(columns, axis=1).tobytes())
+    return b"".join(out)
+
+
+def generate_chunk(seed, index, n):
+    """Return (chunk bytes, counts) for chunk index of a corpus.
+
+    counts[2 * kind + valid] is the number of cases of a kind by label.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng([seed, index])
+    kinds, hrps, witvers, lengths = _random_cases(np, rng, n)
+    extras = (kinds == KIND_PADDING) & (lengths * 8 % 5 == 0)
+    out = [HEADER.pack(MAGIC, n)]
+    counts = np.zeros(2 * len(KINDS), dtype=np.int64)
+    for length, extra in sorted(set(zip(lengths.tolist(), extras.tolist()))):
+        rows = np.flatnonzero((lengths == length) & (extras == extra))
+        data = _encode_group(np, rng, kinds[rows], hrps[rows], witvers[rows], length, extra)
+        for h, hrp in enumerate(HRPS):
+            sub = hrps[rows] == h
+            if not sub.any():
+                continue
+            sub_kinds = kinds[rows][sub]
+            prefix = np.frombuffer(hrp.encode() + b"1", dtype=np.uint8)
+            addresses = np.concatenate([np.tile(prefix, (len(sub_kinds), 1)), data[sub]], axis=1)
+            _mutate(np, rng, sub_kinds, addresses)
+            strings = [row.decode("ascii") for row in map(bytes, addresses)]
+            valid, witver, programs, plen = segwit_addr.decode_many(hrp, strings)
+            out.append(_records(np, sub_kinds, hrp, addresses, valid, witver, programs, plen))
+            counts += np.bincount(2 * sub_kinds + valid, minlength=len(counts))
+    return b"".join(out), counts.tolist()
+
+
+def read_chunk(data):
+    """Yield (kind, hrp, address, witver, program) records of a chunk, witver None when invalid."""
+    magic, n = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a bech32m fuzz corpus chunk")
+    pos = HEADER.size
+    for _ in range(n):
+        kind, hrp_len = data[pos], data[pos + 1]
+        pos += 2
+        hrp = data[pos:pos + hrp_len].decode()
+        pos += hrp_len
+        addr_len = data[pos]
+        address = data[pos + 1:pos + 1 + addr_len].decode()
+        pos += 1 + addr_len
+        valid, witver, plen = data[pos], data[pos + 1], data[pos + 2]
+        program = data[pos + 3:pos + 3 + plen]
+        pos += 3 + plen
+        yield kind, hrp, address, witver if valid else None, program
+
+
+def _write_chunk(out_dir, seed, index, n):
+    """Worker: generate one chunk and write it to its file."""
+    data, counts = generate_chunk(seed, index, n)
+    path = chunk_path(out_dir, index)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a Bech32m differential fuzz corpus.")
+    parser.add_argument("-n", "--cases", type=int, default=1 << 20)
+    parser.add_argument("-o", "--out-dir", default=os.path.join("..", "temp", "fuzz"))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="cases per chunk file")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    started = time.perf_counter()
+    totals = [0] * (2 * len(KINDS))
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for index, lo in enumerate(range(0, args.cases, args.chunk_size)):
+            n = min(args.chunk_size, args.cases - lo)
+            pending.append(pool.submit(_write_chunk, args.out_dir, args.seed, index, n))
+            while len(pending) >= 2 * args.workers or (pending and pending[0].done()):
+                totals = [a + b for a, b in zip(totals, pending.popleft().result())]
+        while pending:
+            totals = [a + b for a, b in zip(totals, pending.popleft().result())]
+    elapsed = time.perf_counter() - started
+
+    for kind, name in enumerate(KINDS):
+        print(f"{name:12} {totals[2 * kind + 1]:10} valid {totals[2 * kind]:10} invalid", file=sys.stderr)
+    rate = args.cases / elapsed if elapsed > 0 else 0.0
+    print(f"{args.cases} cases in {elapsed:.2f}s ({rate:.0f} cases/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
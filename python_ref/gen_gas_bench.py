@@ -0,0 +1,125 @@
+"""Foundry gas benchmark contract sweeping the input sizes of Bech32m, Base58 and Hmac.
+
+Every test function calls one library function once through an external
+GasBenchHarness call and checks the result. The test name encodes the
+sweep point as testGas_<function>_<parameter>_<value>, so the gas of
+each test in `forge snapshot` is a point on a cost curve, see
+gas_report.py. The harness functions also show up in `forge test
+--gas-report`.
+
+The contract is written to test/generated/GasBench.t.sol by
+gen_sol_tests.py.
+"""
+
+import hashlib
+import hmac
+import random
+
+import base58check
+import segwit_addr
+
+# 30 is the longest HRP that keeps a 32-byte program address within 90 characters.
+BECH32M_HRP_LENGTHS = (1, 2, 4, 8, 16, 24, 30)
+BECH32M_PROGRAM_LENGTHS = tuple(range(2, 41))
+BASE58_PAYLOAD_LENGTHS = (1, 4, 8, 16, 21, 25, 32, 48, 64)
+# Around the 111/112 byte padding boundary and multiples of the 128 byte block.
+HMAC_MESSAGE_LENGTHS = (1, 37, 64, 111, 112, 128, 239, 240, 256, 512, 1024)
+SHA512_MESSAGE_LENGTHS = (0,) + HMAC_MESSAGE_LENGTHS
+
+HARNESS = """import {Test} from "forge-std/Test.sol";
+import {Bech32m} from "../../src/Bech32m.sol";
+import {decode as decodeBase58} from "../../src/Base58.sol";
+import {Hmac} from "../../src/Hmac.sol";
+import {Sha2Ext} from "../../src/sha2/Sha2Ext.sol";
+
+contract GasBenchHarness {
+    function decodeSegwitAddress(
+        bytes memory hrp,
+        bytes memory addr
+    ) external pure returns (uint8, bytes memory, Bech32m.DecodeError) {
+        return Bech32m.decodeSegwitAddress(hrp, addr);
+    }
+
+    function base58Decode(bytes memory data) external pure returns (bytes memory) {
+        return decodeBase58(data);
+    }
+
+    function hmacSha512(bytes memory key, bytes memory message) external pure returns (bytes32, bytes32) {
+        return Hmac.hmacSha512(key, message);
+    }
+
+    function sha512(bytes memory message) external pure returns (bytes32, bytes32) {
+        return Sha2Ext.sha512(message);
+    }
+}
+
+contract GasBenchTest is Test {
+    GasBenchHarness harness;
+
+    function setUp() public {
+        harness = new GasBenchHarness();
+    }"""
+
+
+def _hrp(rnd, length):
+    return "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(length))
+
+
+def _bench_function(function, parameter, value, body):
+    return [
+        "",
+        f"    function testGas_{function}_{parameter}_{value}() public view {{",
+    ] + [f"        {line}" for line in body] + ["    }"]
+
+
+def _decode_segwit_address(hrp, witver, program):
+    address = segwit_addr.encode(hrp, witver, program)
+    return [
+        f"(uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress(\"{hrp}\", \"{address}\");",
+        "assertEq(uint(err), uint(Bech32m.DecodeError.NoError));",
+        f"assertEq(witver, {witver});",
+        f"assertEq(program, hex\"{bytes(program).hex()}\");",
+    ]
+
+
+def _digest_body(call, expected):
+    return [
+        f"(bytes32 result1, bytes32 result2) = {call};",
+        f"assertEq(result1, hex\"{expected[:32].hex()}\");",
+        f"assertEq(result2, hex\"{expected[32:].hex()}\");",
+    ]
+
+
+def generate(emit=print):
+    """Emit the Solidity benchmark contract line by line."""
+    rnd = random.Random(16)
+    lines = HARNESS.split("\n")
+    for length in BECH32M_HRP_LENGTHS:
+        program = [rnd.randrange(256) for _ in range(32)]
+        lines += _bench_function("decodeSegwitAddress", "hrp", length, _decode_segwit_address(_hrp(rnd, length), 1, program))
+    for length in BECH32M_PROGRAM_LENGTHS:
+        program = [rnd.randrange(256) for _ in range(length)]
+        lines += _bench_function("decodeSegwitAddress", "program", length, _decode_segwit_address("bc", 1, program))
+    for length in BASE58_PAYLOAD_LENGTHS:
+        payload = bytes([rnd.randrange(1, 256)]) + rnd.randbytes(length - 1)
+        lines += _bench_function("base58Decode", "payload", length, [
+            f"bytes memory decoded = harness.base58Decode(\"{base58check.encode(payload)}\");",
+            f"assertEq(decoded, hex\"{payload.hex()}\");",
+        ])
+    key = rnd.randbytes(32)
+    for length in HMAC_MESSAGE_LENGTHS:
+        message = rnd.randbytes(length)
+        expected = hmac.new(key, message, hashlib.sha512).digest()
+        call = f"harness.hmacSha512(hex\"{key.hex()}\", hex\"{message.hex()}\")"
+        lines += _bench_function("hmacSha512", "message", length, _digest_body(call, expected))
+    for length in SHA512_MESSAGE_LENGTHS:
+        message = rnd.randbytes(length)
+        call = f"harness.sha512(hex\"{message.hex()}\")"
+        lines += _bench_function("sha512", "message", length, _digest_body(call, hashlib.sha512(message).digest()))
+    lines.append("}")
+    for line in lines:
+        emit(line)
+
+
+if __name__ == "__main__":
+    generate()
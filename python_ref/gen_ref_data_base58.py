@@ -0,0 +1,31 @@
+import random
+
+import base58check
+
+rnd = random.Random(58)
+
+tests = [
+    bytes.fromhex("00"),
+    bytes.fromhex("0000ff"),
+    bytes.fromhex("61"),
+    bytes.fromhex("626262"),
+    b"Hello World!",
+    bytes.fromhex("00eb15231dfceb60925886b67d065299925915aeb172c06647"),
+] + [bytes(rnd.randrange(3)) + rnd.randbytes(length) for length in (1, 5, 20, 21, 25, 32, 45)]
+
+
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
+    for itest, data in enumerate(tests):
+        encoded = base58check.encode(data)
+        assert base58check.decode(encoded) == data
+
+        emit(f"bytes memory data{itest} = hex\"{data.hex()}\";")
+        emit(f"bytes memory encoded{itest} = \"{encoded}\";")
+        emit(f"assertEq(encodeBase58(data{itest}), encoded{itest});")
+        emit(f"assertEq(decodeBase58(encoded{itest}), data{itest});")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
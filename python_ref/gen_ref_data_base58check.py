@@ -0,0 +1,42 @@
+import random
+
+import base58check
+
+# validateBitcoinAddress is a view function.
+MUTABILITY = "view"
+
+NETWORK_NAMES = ("Mainnet", "Testnet", "Regtest", "Simnet")
+
+rnd = random.Random(5858)
+
+
+def _addresses(network):
+    """Valid addresses of a network and mutations of them."""
+    out = []
+    for version in (base58check.P2PKH_VERSIONS[network], base58check.P2SH_VERSIONS[network]):
+        address = base58check.encode_check(version, rnd.randbytes(20))
+        pos = rnd.randrange(1, len(address))
+        flipped = address[:pos] + rnd.choice(base58check.ALPHABET.replace(address[pos], "")) + address[pos + 1:]
+        out += [address, flipped, address[:-1], address + "1"]
+    # The contract only checks the leading character: a version byte next to the
+    # P2PKH one may still be accepted, the P2PKH version of another network not.
+    out.append(base58check.encode_check(base58check.P2PKH_VERSIONS[network] + 1, rnd.randbytes(20)))
+    out.append(base58check.encode_check(base58check.P2PKH_VERSIONS[(network + 1) % 4], rnd.randbytes(20)))
+    return out
+
+
+tests = [(network, address) for network in range(len(NETWORK_NAMES)) for address in _addresses(network)]
+
+
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
+    for network, address in tests:
+        _, _, reason = base58check.validate_address(network, address)
+        assert_function = "assertFalse" if reason else "assertTrue"
+        emit(f"{assert_function}(BitcoinUtils.validateBitcoinAddress("
+             f"BitcoinNetworkEncoder.Network.{NETWORK_NAMES[network]}, \"{address}\"));")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
@@ -17,7 +17,8 @@ tests = [
 
 # function createChecksum(bytes memory hrp, bytes memory data, BechEncoding spec) public pure returns (bytes memory) {
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for itest, test in enumerate(tests):
         hrp = test[0]
         data = test[1]
@@ -30,12 +31,15 @@ if __name__ == "__main__":
         chk = bech32_create_checksum(hrp, list(data), spec)
         chk_hex = bytes(chk).hex()
 
-        print(f"// bech32_create_checksum(\"\"\"{hrp}\"\"\", {list(data)}, {spec}) == {chk}")
-        print(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
-        print(f"bytes memory data{itest} = hex\"{data_hex}\";")
-        print(f"Bech32m.BechEncoding spec{itest} = {spec_solidity};")
-        print(f"bytes memory chkExpected{itest} = hex\"{chk_hex}\";")
-        print(f"bytes memory chkActual{itest} = Bech32m.createChecksum(hrp{itest}, data{itest}, spec{itest});")
-        print(f"assertEq(chkExpected{itest}, chkActual{itest});")
-        print()
-    
\ No newline at end of file
+        emit(f"// bech32_create_checksum(\"\"\"{hrp}\"\"\", {list(data)}, {spec}) == {chk}")
+        emit(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
+        emit(f"bytes memory data{itest} = hex\"{data_hex}\";")
+        emit(f"Bech32m.BechEncoding spec{itest} = {spec_solidity};")
+        emit(f"bytes memory chkExpected{itest} = hex\"{chk_hex}\";")
+        emit(f"bytes memory chkActual{itest} = Bech32m.createChecksum(hrp{itest}, data{itest}, spec{itest});")
+        emit(f"assertEq(chkExpected{itest}, chkActual{itest});")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
@@ -8,7 +8,8 @@ tests = [
     ("tb", [i for i in range(32)], Encoding.BECH32M),
 ]
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for (itest, test) in enumerate(tests):
         hrp, data, spec = test
         encoded = bech32_encode(hrp, data, spec)
@@ -25,11 +26,15 @@ if __name__ == "__main__":
             raise ValueError("Unknown BECH encoding")
         encoded_hex = encoded.encode("utf-8").hex()
 
-        print(f"// bech32_encode('''{hrp}''', {data}, {spec_str_python}) == '''{encoded}'''")
-        print(f"bytes memory encodedData{itest} = hex\"{encoded_hex}\";")
-        print(f"(bytes memory hrpActual{itest}, bytes memory dataActual{itest}, Bech32m.BechEncoding specActual{itest}, Bech32m.DecodeError err{itest}) =  Bech32m.bech32Decode(encodedData{itest});")
-        print(f"assertEq(hrpActual{itest}, hex\"{hrp_hex}\"); // {hrp}")
-        print(f"assertEq(dataActual{itest}, hex\"{data_hex}\");")
-        print(f"assertTrue(specActual{itest} == {spec_str_solidity});")
-        print(f"assertTrue(err{itest} == Bech32m.DecodeError.NoError);")
-        print()
+        emit(f"// bech32_encode('''{hrp}''', {data}, {spec_str_python}) == '''{encoded}'''")
+        emit(f"bytes memory encodedData{itest} = hex\"{encoded_hex}\";")
+        emit(f"(bytes memory hrpActual{itest}, bytes memory dataActual{itest}, Bech32m.BechEncoding specActual{itest}, Bech32m.DecodeError err{itest}) =  Bech32m.bech32Decode(encodedData{itest});")
+        emit(f"assertEq(hrpActual{itest}, hex\"{hrp_hex}\"); // {hrp}")
+        emit(f"assertEq(dataActual{itest}, hex\"{data_hex}\");")
+        emit(f"assertTrue(specActual{itest} == {spec_str_solidity});")
+        emit(f"assertTrue(err{itest} == Bech32m.DecodeError.NoError);")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
@@ -8,7 +8,8 @@ tests = [
     ["\"12", [12, 31, 0], Encoding.BECH32],
 ]
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for (itest, test) in enumerate(tests):
         hrp, data, spec = test
 
@@ -19,11 +20,15 @@ if __name__ == "__main__":
         encoded = bech32_encode(hrp, data, spec)
         encoded_hex = encoded.encode("utf-8").hex()
 
-        print(f"// bech32_encode(\"\"\"{hrp}\"\"\", {data}, {spec}) == \"\"\"{encoded}\"\"\"")
-        print(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
-        print(f"bytes memory data{itest} = hex\"{data_hex}\";")
-        print(f"Bech32m.BechEncoding spec{itest} = {spec_solidity};")
-        print(f"bytes memory encodedExpected{itest} = hex\"{encoded_hex}\";")
-        print(f"bytes memory encodedActual{itest} = Bech32m.bech32Encode(hrp{itest}, data{itest}, spec{itest});")
-        print(f"assertEq(encodedExpected{itest}, encodedActual{itest});")
-        print()
+        emit(f"// bech32_encode(\"\"\"{hrp}\"\"\", {data}, {spec}) == \"\"\"{encoded}\"\"\"")
+        emit(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
+        emit(f"bytes memory data{itest} = hex\"{data_hex}\";")
+        emit(f"Bech32m.BechEncoding spec{itest} = {spec_solidity};")
+        emit(f"bytes memory encodedExpected{itest} = hex\"{encoded_hex}\";")
+        emit(f"bytes memory encodedActual{itest} = Bech32m.bech32Encode(hrp{itest}, data{itest}, spec{itest});")
+        emit(f"assertEq(encodedExpected{itest}, encodedActual{itest});")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
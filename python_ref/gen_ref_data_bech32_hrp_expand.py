@@ -7,15 +7,20 @@ hrps = [
     "".join(chr(i) for i in range(33, 126+1))
 ]
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for ihrp, hrp in enumerate(hrps):
         hrp_hex = "".join("{:02x}".format(ord(c)) for c in hrp)
         hrp_expand = bech32_hrp_expand(hrp)
         hrp_expand_hex = "".join("{:02x}".format(c) for c in hrp_expand)
         
-        print(f"// bech32_hrp_expand(\"\"\"{hrp}\"\"\") == {hrp_expand}")
-        print(f"bytes memory hrp{ihrp} = hex\"{hrp_hex}\";")
-        print(f"bytes memory hrpExpandExpected{ihrp} = hex\"{hrp_expand_hex}\";")
-        print(f"bytes memory hrpExpandActual{ihrp} = Bech32m.hrpExpand(hrp{ihrp});")
-        print(f"assertEq(hrpExpandExpected{ihrp}, hrpExpandActual{ihrp});")
-        print()
+        emit(f"// bech32_hrp_expand(\"\"\"{hrp}\"\"\") == {hrp_expand}")
+        emit(f"bytes memory hrp{ihrp} = hex\"{hrp_hex}\";")
+        emit(f"bytes memory hrpExpandExpected{ihrp} = hex\"{hrp_expand_hex}\";")
+        emit(f"bytes memory hrpExpandActual{ihrp} = Bech32m.hrpExpand(hrp{ihrp});")
+        emit(f"assertEq(hrpExpandExpected{ihrp}, hrpExpandActual{ihrp});")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
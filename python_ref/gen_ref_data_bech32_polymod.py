@@ -15,16 +15,21 @@ values = [
 polymod_values = [bech32_polymod(v) for v in values]
 
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     # I do not know how to initialize dynamic arrays in Solidity.
     # So here is an automatic Solidity code generation for tests.
     for iv, (v, pv) in enumerate(zip(values, polymod_values)):
-        print(f"// bech32_polymod({v}) == {pv}")
+        emit(f"// bech32_polymod({v}) == {pv}")
         arr_name = f"values{iv}"
-        print(f"uint[] memory {arr_name} = new uint[]({len(v)});")
+        emit(f"uint[] memory {arr_name} = new uint[]({len(v)});")
         for j in range(len(v)):
-            print(f"{arr_name}[{j}] = {v[j]};")
-        print(f"uint256 polymodExpected{iv} = {pv};")
-        print(f"uint256 polymodActual{iv} = Bech32m.polymod({arr_name});")
-        print(f"assertEq(polymodExpected{iv}, polymodActual{iv});")
-        print()
+            emit(f"{arr_name}[{j}] = {v[j]};")
+        emit(f"uint256 polymodExpected{iv} = {pv};")
+        emit(f"uint256 polymodActual{iv} = Bech32m.polymod({arr_name});")
+        emit(f"assertEq(polymodExpected{iv}, polymodActual{iv});")
+        emit("")
+
+
+if __name__ == "__main__":
+    generate()
@@ -11,7 +11,8 @@ def last_bits(s):
     return s[n_blocks*40:]
     
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     data_all = sha256(b"sample data").digest() + sha256(b"sample data 2").digest()
     data_5bit_all = convertbits(data_all, 8, 5)
     for i_test in range(len(data_5bit_all)):
@@ -23,21 +24,24 @@ if __name__ == "__main__":
             data_8bit_expected_hex = "".join(f"{b:02x}" for b in data_8bit_expected)
         else:
             data_8bit_expected_hex = ""
-        print(f"// convertbits({data_5bit}, 5, 8, False) == {data_8bit_expected}")
-        print(f"bytes memory data5Bit{i_test} = hex\"{data_5bit_hex}\";")
-        print(f"bytes memory data8BitExpected{i_test} = hex\"{data_8bit_expected_hex}\";")
-        print(f"(bytes memory data8BitActual{i_test}, Bech32m.DecodeError err{i_test}) = Bech32m.convert5to8(data5Bit{i_test});");
-        print(f"assertEq(data8BitExpected{i_test}, data8BitActual{i_test});")
+        emit(f"// convertbits({data_5bit}, 5, 8, False) == {data_8bit_expected}")
+        emit(f"bytes memory data5Bit{i_test} = hex\"{data_5bit_hex}\";")
+        emit(f"bytes memory data8BitExpected{i_test} = hex\"{data_8bit_expected_hex}\";")
+        emit(f"(bytes memory data8BitActual{i_test}, Bech32m.DecodeError err{i_test}) = Bech32m.convert5to8(data5Bit{i_test});");
+        emit(f"assertEq(data8BitExpected{i_test}, data8BitActual{i_test});")
         if data_8bit_expected is not None:
-            print(f"assertTrue(err{i_test} == Bech32m.DecodeError.NoError);")
+            emit(f"assertTrue(err{i_test} == Bech32m.DecodeError.NoError);")
         else:
-            print(f"assertTrue(err{i_test} != Bech32m.DecodeError.NoError);")
-        print()
+            emit(f"assertTrue(err{i_test} != Bech32m.DecodeError.NoError);")
+        emit("")
 
         # if converted is not None:
         #     data_5bit_bits = iter_to_bin(data_5bit[:i], bin_size=5, sep="")
         #     data_8bit_bits = iter_to_bin(converted, bin_size=8, sep="")
-        #     print(last_bits(data_5bit_bits))
-        #     print(last_bits(data_8bit_bits))
-        #     print()
-   
\ No newline at end of file
+        #     emit(last_bits(data_5bit_bits))
+        #     emit(last_bits(data_8bit_bits))
+        #     emit("")
+
+
+if __name__ == "__main__":
+    generate()
@@ -8,7 +8,8 @@ tests = [
 ]
 
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for itest, test in enumerate(tests):
         hrp, witver, witprog = test
         
@@ -17,12 +18,15 @@ if __name__ == "__main__":
         addr = encode(hrp, witver, witprog)
         addr_hex = addr.encode('utf-8').hex()
 
-        print(f"// encode(\"{hrp}\", {witver}, {witprog}) == \"{addr}\"")
-        print(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
-        print(f"uint8 witver{itest} = {witver};")
-        print(f"bytes memory witprog{itest} = hex\"{witprog_hex}\";")
-        print(f"bytes memory expectedAddr{itest} = hex\"{addr_hex}\";")
-        print(f"bytes memory actualAddr{itest} = Bech32m.encodeSegwitAddress(hrp{itest}, witver{itest}, witprog{itest});")
-        print(f"assertEq(expectedAddr{itest}, actualAddr{itest});")
-        print()
+        emit(f"// encode(\"{hrp}\", {witver}, {witprog}) == \"{addr}\"")
+        emit(f"bytes memory hrp{itest} = hex\"{hrp_hex}\";")
+        emit(f"uint8 witver{itest} = {witver};")
+        emit(f"bytes memory witprog{itest} = hex\"{witprog_hex}\";")
+        emit(f"bytes memory expectedAddr{itest} = hex\"{addr_hex}\";")
+        emit(f"bytes memory actualAddr{itest} = Bech32m.encodeSegwitAddress(hrp{itest}, witver{itest}, witprog{itest});")
+        emit(f"assertEq(expectedAddr{itest}, actualAddr{itest});")
+        emit("")
+
 
+if __name__ == "__main__":
+    generate()
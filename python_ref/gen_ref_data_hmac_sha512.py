@@ -1,30 +1,43 @@
 import hashlib
 import hmac
 
+from hmac_sha512 import HmacSha512
+
 tests = [
     [bytes.fromhex("010203"), bytes.fromhex("040506")],
     [bytes.fromhex("01"*128), bytes.fromhex("04")],
     [bytes.fromhex("01"*150), bytes.fromhex("04")],
 ]
 
+# BIP32 child derivation: the chain code as key, serialized parent pubkey and index as message.
+BIP32_CHAIN_CODE = bytes.fromhex("873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508")
+BIP32_PARENT = bytes.fromhex("0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2")
+BIP32_INDEXES = [0, 1, 2, 1000, 0x7fffffff]
+tests += [[BIP32_CHAIN_CODE, BIP32_PARENT + index.to_bytes(4, "big")] for index in BIP32_INDEXES]
 
-if __name__ == "__main__":
+
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for itest, test in enumerate(tests):
         key, message = test
 
         key_hex = key.hex()
         message_hex = message.hex()
 
-        hmac_result = hmac.new(key, message, hashlib.sha512).digest()
+        hmac_result = HmacSha512(key).digest(message)
+        assert hmac_result == hmac.new(key, message, hashlib.sha512).digest()
         hmac1_hex = hmac_result[:32].hex()
         hmac2_hex = hmac_result[32:].hex()
 
-        print(f"bytes memory key{itest} = hex\"{key_hex}\";")
-        print(f"bytes memory message{itest} = hex\"{message_hex}\";")
-        print(f"bytes32 hmac{itest}_1_expected = hex\"{hmac1_hex}\";")
-        print(f"bytes32 hmac{itest}_2_expected = hex\"{hmac2_hex}\";")
-        print(f"(bytes32 hmac{itest}_1, bytes32 hmac{itest}_2) = Hmac.hmacSha512(key{itest}, message{itest});")
-        print(f"assertEq(hmac{itest}_1, hmac{itest}_1_expected);")
-        print(f"assertEq(hmac{itest}_2, hmac{itest}_2_expected);")
-        print()
+        emit(f"bytes memory key{itest} = hex\"{key_hex}\";")
+        emit(f"bytes memory message{itest} = hex\"{message_hex}\";")
+        emit(f"bytes32 hmac{itest}_1_expected = hex\"{hmac1_hex}\";")
+        emit(f"bytes32 hmac{itest}_2_expected = hex\"{hmac2_hex}\";")
+        emit(f"(bytes32 hmac{itest}_1, bytes32 hmac{itest}_2) = Hmac.hmacSha512(key{itest}, message{itest});")
+        emit(f"assertEq(hmac{itest}_1, hmac{itest}_1_expected);")
+        emit(f"assertEq(hmac{itest}_2, hmac{itest}_2_expected);")
+        emit("")
 
+
+if __name__ == "__main__":
+    generate()
@@ -7,7 +7,8 @@ tests = [
 ]
 
 
-if __name__ == "__main__":
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     for itest, data_hex in enumerate(tests):
         data = bytes.fromhex(data_hex)
 
@@ -16,12 +17,15 @@ if __name__ == "__main__":
         hash1_hex = sha512_hash.digest()[:32].hex()
         hash2_hex = sha512_hash.digest()[32:].hex()
 
-        print(f"bytes memory data{itest} = hex\"{data_hex}\";")
-        print(f"bytes32 hash{itest}_1_expected = hex\"{hash1_hex}\";")
-        print(f"bytes32 hash{itest}_2_expected = hex\"{hash2_hex}\";")
+        emit(f"bytes memory data{itest} = hex\"{data_hex}\";")
+        emit(f"bytes32 hash{itest}_1_expected = hex\"{hash1_hex}\";")
+        emit(f"bytes32 hash{itest}_2_expected = hex\"{hash2_hex}\";")
+
+        emit(f"(bytes32 hash{itest}_1, bytes32 hash{itest}_2) = Sha2Ext.sha512(data{itest});")
+        emit(f"assertEq(hash{itest}_1, hash{itest}_1_expected);")
+        emit(f"assertEq(hash{itest}_2, hash{itest}_2_expected);")
+        emit("")
 
-        print(f"(bytes32 hash{itest}_1, bytes32 hash{itest}_2) = Sha2Ext.sha512(data{itest});")
-        print(f"assertEq(hash{itest}_1, hash{itest}_1_expected);")
-        print(f"assertEq(hash{itest}_2, hash{itest}_2_expected);")
-        print()
 
+if __name__ == "__main__":
+    generate()
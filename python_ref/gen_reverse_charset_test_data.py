@@ -17,7 +17,8 @@ tests = [
     "\xff",
 ]
 
-if __name__ == '__main__':
+def generate(emit=print):
+    """Emit the Solidity test code line by line."""
     itest2 = 0
     for itest, test in enumerate(tests):
         ranges = [(0, len(test))]
@@ -34,11 +35,15 @@ if __name__ == '__main__':
                 data_expected_hex = all_decoded[start:stop].hex()
                 err_expected_solidity = "Bech32m.DecodeError.NoError"
             
-            print(f"bytes memory data{itest2} = hex\"{test.encode().hex()}\";")
-            print(f"bytes memory rezExpected{itest2} = hex\"{data_expected_hex}\";")
-            print(f"Bech32m.DecodeError errExpected{itest2} = {err_expected_solidity};")
-            print(f"(bytes memory rezActual{itest2}, Bech32m.DecodeError errActual{itest2}) = Bech32m.decodeCharactersBech32(data{itest2}, {start}, {stop});")
-            print(f"assertEq(rezExpected{itest2}, rezActual{itest2});")
-            print(f"assertTrue(errExpected{itest2} == errActual{itest2});")
-            print()
+            emit(f"bytes memory data{itest2} = hex\"{test.encode().hex()}\";")
+            emit(f"bytes memory rezExpected{itest2} = hex\"{data_expected_hex}\";")
+            emit(f"Bech32m.DecodeError errExpected{itest2} = {err_expected_solidity};")
+            emit(f"(bytes memory rezActual{itest2}, Bech32m.DecodeError errActual{itest2}) = Bech32m.decodeCharactersBech32(data{itest2}, {start}, {stop});")
+            emit(f"assertEq(rezExpected{itest2}, rezActual{itest2});")
+            emit(f"assertTrue(errExpected{itest2} == errActual{itest2});")
+            emit("")
             itest2 += 1
+
+
+if __name__ == "__main__":
+    generate()
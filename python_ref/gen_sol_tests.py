@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+"""Write the generated Solidity tests in test/generated in one run.
+
+Every file in SOL_TEST_FILES is one test contract whose test functions
+are the output of gen_ref_data_*.py generators, with each test case in
+its own block. The second line of a generated file holds the sha256 of
+the rest of the file. Every run renders all files, and only files whose
+rendered output changed are written, so edits to the reference modules
+that do not change the generated tests leave the files alone.
+
+A generator whose statements are not pure sets MUTABILITY, e.g. "view".
+Generators in SOL_SOURCE_FILES emit a whole source file instead, like
+the gas benchmark contract of gen_gas_bench.py.
+
+The spec_invalid_* generators are not registered, their tests are kept
+in test/Bech32m.t.sol with a comment on every expected error code.
+
+Usage:
+    python3 gen_sol_tests.py            # write changed files
+    python3 gen_sol_tests.py --check    # exit with 1 if a file is stale
+"""
+
+import argparse
+import hashlib
+import importlib
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(ROOT, "..", "test", "generated")
+
+PREAMBLE = """// SPDX-License-Identifier: MIT
+// Generated by python_ref/gen_sol_tests.py, do not edit. sha256:
+
+pragma solidity 0.8.27;
+"""
+
+HEADER = PREAMBLE + """
+import {{Test}} from "forge-std/Test.sol";
+{imports}
+
+contract {contract} is Test {{
+"""
+
+# (file name, contract, imports, [(test function, generator module)])
+SOL_TEST_FILES = [
+    ("Bech32mRefData.t.sol", "Bech32mRefDataTest", ['import {Bech32m} from "../../src/Bech32m.sol";'], [
+        ("testPolymod", "gen_ref_data_bech32_polymod"),
+        ("testHrpExpand", "gen_ref_data_bech32_hrp_expand"),
+        ("testCreateChecksum", "gen_ref_data_bech32_create_checksum"),
+        ("testBech32Encode", "gen_ref_data_bech32_encode"),
+        ("testBech32Decode", "gen_ref_data_bech32_decode"),
+        ("testConvert8To5", "gen_ref_data_convertbits_8_to_5"),
+        ("testConvert5To8", "gen_ref_data_convertbits_5_to_8"),
+        ("testEncodeSegwitAddress", "gen_ref_data_encode"),
+        ("testDecodeCharactersBech32", "gen_reverse_charset_test_data"),
+        ("testBech32DecodeSpecBech32", "gen_ref_data_spec_valid_bech32"),
+        ("testBech32DecodeSpecBech32m", "gen_ref_data_spec_valid_bech32m"),
+        ("testValidAddressDecodeEncode", "gen_ref_data_spec_valid_address"),
+    ]),
+    ("Base58RefData.t.sol", "Base58RefDataTest", [
+        'import {encode as encodeBase58, decode as decodeBase58} from "../../src/Base58.sol";',
+        'import {BitcoinNetworkEncoder} from "../../src/BitcoinNetworkEncoder.sol";',
+        'import {BitcoinUtils} from "../../src/BitcoinUtils.sol";',
+    ], [
+        ("testBase58EncodeDecode", "gen_ref_data_base58"),
+        ("testValidateBitcoinAddressBase58", "gen_ref_data_base58check"),
+    ]),
+    ("HmacSha512RefData.t.sol", "HmacSha512RefDataTest", ['import {Hmac} from "../../src/Hmac.sol";'], [
+        ("testHmacSha512", "gen_ref_data_hmac_sha512"),
+    ]),
+    ("Sha512RefData.t.sol", "Sha512RefDataTest", ['import {Sha2Ext} from "../../src/sha2/Sha2Ext.sol";'], [
+        ("testSha512", "gen_ref_data_sha512"),
+    ]),
+]
+
+# (file name, generator module emitting everything after the pragma)
+SOL_SOURCE_FILES = [
+    ("GasBench.t.sol", "gen_gas_bench"),
+]
+
+
+def with_digest(source):
+    """source with the sha256 of everything after its second line appended to that line."""
+    head, line, body = source.split("\n", 2)
+    return f"{head}\n{line} {hashlib.sha256(body.encode()).hexdigest()}\n{body}"
+
+
+def test_function(name, module):
+    """Solidity source of one test function with the output of a generator."""
+    generator = importlib.import_module(module)
+    lines = []
+    generator.generate(lines.append)
+    out = [f"    function {name}() public {getattr(generator, 'MUTABILITY', 'pure')} {{",
+           f"        // This test was generated automatically by {module}.py"]
+    case = []
+    for line in lines + [""]:
+        if line:
+            case.append(line)
+        elif case:
+            out += ["", "        {"] + [f"            {statement}" for statement in case] + ["        }"]
+            case = []
+    out.append("    }")
+    return "\n".join(out)
+
+
+def render(contract, imports, functions):
+    """Source of a whole generated test file, without the digest."""
+    header = HEADER.format(imports="\n".join(imports), contract=contract)
+    body = "\n\n".join(test_function(name, module) for name, module in functions)
+    return f"{header}{body}\n}}\n"
+
+
+def render_source(module):
+    """Source of a generated file whose body is the whole output of a generator."""
+    lines = []
+    importlib.import_module(module).generate(lines.append)
+    return PREAMBLE + "\n" + "\n".join(lines) + "\n"
+
+
+def read_file(path):
+    """Contents of a generated file, None if missing."""
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def generate_all(out_dir=OUT_DIR, force=False, check=False):
+    """Render every file and write the changed ones, return a list of (path, changed)."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    os.makedirs(out_dir, exist_ok=True)
+    files = [(file_name, lambda args=(contract, imports, functions): render(*args))
+             for file_name, contract, imports, functions in SOL_TEST_FILES]
+    files += [(file_name, lambda module=module: render_source(module))
+              for file_name, module in SOL_SOURCE_FILES]
+    results = []
+    for file_name, render_file in files:
+        path = os.path.join(out_dir, file_name)
+        source = with_digest(render_file())
+        changed = force or read_file(path) != source
+        if changed and not check:
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(source)
+            os.replace(tmp, path)
+        results.append((path, changed))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Solidity tests from the Python reference.")
+    parser.add_argument("--out-dir", default=OUT_DIR)
+    parser.add_argument("--force", action="store_true", help="regenerate all files")
+    parser.add_argument("--check", action="store_true", help="only report stale files, exit with 1 if any")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = generate_all(args.out_dir, args.force, args.check)
+    elapsed = time.perf_counter() - started
+    for path, changed in results:
+        state = ("stale" if args.check else "written") if changed else "unchanged"
+        print(f"{os.path.relpath(path)}: {state}")
+    print(f"{len(results)} files in {elapsed * 1000:.0f} ms", file=sys.stderr)
+    if args.check and any(changed for _, changed in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Keyed HMAC-SHA512 context, same results as Hmac.hmacSha512.
+
+The key is padded and both pad blocks are hashed once, every message
+then starts from copies of the two SHA-512 midstates. A message prefix
+shared by all messages, like the serialized parent pubkey of BIP32
+child derivation, can be absorbed into the inner midstate as well.
+"""
+
+import copy
+import hashlib
+
+# SHA-512 block size in bytes
+BLOCK_SIZE = 128
+
+IPAD = bytes(b ^ 0x36 for b in range(256))
+OPAD = bytes(b ^ 0x5c for b in range(256))
+
+
+class HmacSha512:
+    """HMAC-SHA512 with a fixed key and optional message prefix."""
+
+    def __init__(self, key):
+        if not key:
+            raise ValueError("KeyCannotBeEmpty")
+        if len(key) > BLOCK_SIZE:
+            key = hashlib.sha512(key).digest()
+        key = key.ljust(BLOCK_SIZE, b"\0")
+        self._inner = hashlib.sha512(key.translate(IPAD))
+        self._outer = hashlib.sha512(key.translate(OPAD))
+        self.prefix_length = 0
+
+    def with_prefix(self, prefix):
+        """New context for messages that start with prefix, which is hashed once."""
+        context = copy.copy(self)
+        context._inner = self._inner.copy()
+        context._inner.update(prefix)
+        context.prefix_length += len(prefix)
+        return context
+
+    def digest(self, message):
+        """64-byte HMAC of the prefix followed by message."""
+        if self.prefix_length + len(message) == 0:
+            raise ValueError("MessageCannotBeEmpty")
+        inner = self._inner.copy()
+        inner.update(message)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def digests(self, messages):
+        """digest for every message of an iterable, as a list."""
+        return [self.digest(message) for message in messages]
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""Pregenerate getBTCDepositAddress(index) for an index range, sharded over all cores.
+
+The range is split into shards of shard_size indexes. Each shard is one
+columnar file, written by one worker process:
+    header:    magic "BTCPGEN1" | uint64 start | uint64 count | uint64 rows done
+               | uint8 address width | hrp, 16 bytes NUL padded | 32-byte seed program
+    indexes:   count uint32, big-endian
+    programs:  count 32-byte witness programs
+    addresses: count addresses, address width ASCII bytes each
+All columns are fixed width, so rows are written in place. A shard is
+written to a ".partial" file whose rows done field is the checkpoint: it
+is updated after the rows before it are synced, and a restarted run
+continues every partial shard from there. Finished shards are renamed
+to their final name and skipped.
+
+Usage:
+    python3 pregenerate.py SEED_ADDRESS --stop 100000000 -o deposits/
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import deriver
+import segwit_addr
+
+MAGIC = b"BTCPGEN1"
+HEADER = struct.Struct(">8sQQQB16s32s")
+ROWS_DONE_OFFSET = 24
+PROGRAM_SIZE = 32
+
+SHARD_SIZE = 1 << 20
+CHECKPOINT_ROWS = 1 << 14
+
+
+def shard_name(start, stop):
+    """File name of the shard of range(start, stop), resume skips shards whose file exists."""
+    return f"deposits-{start:010d}-{stop:010d}.col"
+
+
+def _seed_key(seed_address):
+    """(hrp, px, py, seed program) of a seed address."""
+    hrp, _, _ = segwit_addr.bech32_decode(seed_address)
+    if hrp is None:
+        raise ValueError(f"cannot parse btc address {seed_address!r}")
+    _, program = segwit_addr.decode(hrp, seed_address)
+    if program is None or len(program) != PROGRAM_SIZE:
+        raise ValueError(f"not a taproot address {seed_address!r}")
+    px, py = deriver.parse_btc_taproot_address(hrp, seed_address)
+    return hrp, px, py, bytes(program)
+
+
+def _check_header(path, f, start, count, hrp, seed_program):
+    """Rows done of the shard file f, ValueError if its header is not the one of this run."""
+    magic, *fields = HEADER.unpack(f.read(HEADER.size))
+    rows_done = fields[2]
+    fields[2] = 0
+    width = len(hrp) + 1 + 59
+    if (magic, *fields) != (MAGIC, start, count, 0, width, hrp.encode().ljust(16, b"\0"), seed_program):
+        raise ValueError(f"{path} belongs to another run")
+    return rows_done
+
+
+def _check_shard(path, start, stop, hrp, seed_program):
+    """Raise ValueError unless path is the finished shard of range(start, stop) of this run."""
+    with open(path, "rb") as f:
+        if _check_header(path, f, start, stop - start, hrp, seed_program) != stop - start:
+            raise ValueError(f"{path} is not finished")
+
+
+def _open_partial(path, start, count, hrp, seed_program):
+    """Open or create a partial shard, return (file, rows done)."""
+    width = len(hrp) + 1 + 59
+    header = (MAGIC, start, count, 0, width, hrp.encode(), seed_program)
+    if os.path.exists(path):
+        f = open(path, "r+b")
+        try:
+            return f, _check_header(path, f, start, count, hrp, seed_program)
+        except ValueError:
+            f.close()
+            raise
+    f = open(path, "w+b")
+    f.write(HEADER.pack(*header))
+    f.truncate(HEADER.size + count * (4 + PROGRAM_SIZE + width))
+    return f, 0
+
+
+def generate_shard(seed_address, directory, start, stop, checkpoint_rows=CHECKPOINT_ROWS):
+    """Worker: write the shard for range(start, stop), return (rows derived, seconds).
+
+    Rows before the checkpoint of an existing partial file are kept.
+    """
+    started = time.perf_counter()
+    hrp, px, py, seed_program = _seed_key(seed_address)
+    chain_code = deriver.derive_chain_code(px, py)
+    count = stop - start
+    width = len(hrp) + 1 + 59
+    path = os.path.join(directory, shard_name(start, stop))
+    f, rows_done = _open_partial(path + ".partial", start, count, hrp, seed_program)
+    derived = 0
+    with f:
+        programs_offset = HEADER.size + count * 4
+        addresses_offset = programs_offset + count * PROGRAM_SIZE
+        checkpoint = rows_done
+        for lo in range(start + rows_done, stop, deriver.DERIVE_BATCH_SIZE):
+            indexes = range(lo, min(stop, lo + deriver.DERIVE_BATCH_SIZE))
+            programs = deriver.derive_receiving_programs(px, py, indexes, chain_code)
+            addresses = list(segwit_addr.encode_many(hrp, 1, programs))
+            row = lo - start
+            f.seek(HEADER.size + row * 4)
+            f.write(struct.pack(f">{len(indexes)}I", *indexes))
+            f.seek(programs_offset + row * PROGRAM_SIZE)
+            f.write(b"".join(programs))
+            f.seek(addresses_offset + row * width)
+            f.write("".join(addresses).encode())
+            derived += len(indexes)
+            rows_done = row + len(indexes)
+            if rows_done - checkpoint >= checkpoint_rows or rows_done == count:
+                f.flush()
+                os.fsync(f.fileno())
+                f.seek(ROWS_DONE_OFFSET)
+                f.write(rows_done.to_bytes(8, "big"))
+                f.flush()
+                os.fsync(f.fileno())
+                checkpoint = rows_done
+    os.replace(path + ".partial", path)
+    return derived, time.perf_counter() - started
+
+
+def read_shard(path):
+    """Yield (index, program, address) of the finished rows of a shard file."""
+    with open(path, "rb") as f:
+        magic, _, count, rows_done, width, _, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pregenerated shard")
+        indexes = struct.unpack(f">{count}I", f.read(4 * count))
+        programs = f.read(PROGRAM_SIZE * count)
+        addresses = f.read(width * count).decode()
+    for row in range(rows_done):
+        yield (indexes[row], programs[row * PROGRAM_SIZE:(row + 1) * PROGRAM_SIZE],
+               addresses[row * width:(row + 1) * width])
+
+
+def shards(start, stop, shard_size=SHARD_SIZE):
+    """(start, stop) of every shard, aligned to multiples of shard_size."""
+    lo = start
+    while lo < stop:
+        hi = min(stop, (lo // shard_size + 1) * shard_size)
+        yield lo, hi
+        lo = hi
+
+
+def pregenerate(seed_address, directory, start, stop, shard_size=SHARD_SIZE, workers=None,
+                checkpoint_rows=CHECKPOINT_ROWS, progress=None):
+    """Write all missing shards of range(start, stop), return (rows derived, worker seconds).
+
+    progress, if given, is called with (start, stop, rows, seconds) for every finished shard.
+    Existing shards are skipped after checking that their header matches this run.
+    """
+    hrp, _, _, seed_program = _seed_key(seed_address)
+    os.makedirs(directory, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    total_rows = 0
+    total_seconds = 0.0
+    pending = deque()
+
+    def collect():
+        nonlocal total_rows, total_seconds
+        lo, hi, future = pending.popleft()
+        rows, seconds = future.result()
+        total_rows += rows
+        total_seconds += seconds
+        if progress is not None:
+            progress(lo, hi, rows, seconds)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for lo, hi in shards(start, stop, shard_size):
+            path = os.path.join(directory, shard_name(lo, hi))
+            if os.path.exists(path):
+                _check_shard(path, lo, hi, hrp, seed_program)
+                continue
+            pending.append((lo, hi, pool.submit(generate_shard, seed_address, directory, lo, hi,
+                                                checkpoint_rows)))
+            if len(pending) >= 2 * workers:
+                collect()
+        while pending:
+            collect()
+    return total_rows, total_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pregenerate deposit addresses by index range.")
+    parser.add_argument("seed_address", help="seed taproot address passed to setSeed")
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, required=True)
+    parser.add_argument("-o", "--output", required=True, help="directory of the shard files")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--checkpoint-rows", type=int, default=CHECKPOINT_ROWS)
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    def progress(lo, hi, rows, seconds):
+        rate = rows / seconds if seconds > 0 else 0.0
+        print(f"shard {lo}-{hi}: {rows} indexes in {seconds:.1f}s ({rate:.0f}/s per core)", file=sys.stderr)
+
+    started = time.perf_counter()
+    rows, seconds = pregenerate(args.seed_address, args.output, args.start, args.stop, args.shard_size,
+                                args.workers, args.checkpoint_rows, progress)
+    elapsed = time.perf_counter() - started
+    per_core = rows / seconds if seconds > 0 else 0.0
+    total = rows / elapsed if elapsed > 0 else 0.0
+    print(f"{rows} indexes in {elapsed:.1f}s: {total:.0f}/s total, {per_core:.0f}/s per core "
+          f"with {args.workers} workers", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
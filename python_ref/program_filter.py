@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+"""Xor filter over 32-byte witness programs, to prefilter outputs before an exact lookup.
+
+A program is hashed to three slots, one in each third of a fingerprint
+array, and is in the filter if the XOR of the three fingerprints equals
+its own 8-bit fingerprint. That takes about 1.23 bytes per program and
+gives false positives for 1 in 256 other programs, so outputs are
+checked with three byte reads and only the hits go to the exact set or
+DepositIndex.
+
+File layout (all integers big-endian):
+    header:       magic "BTCXOR81" | uint64 seed | uint32 block length | uint64 number of programs
+    fingerprints: 3 * block length bytes
+The fingerprints are read in place through mmap.
+
+Usage:
+    python3 program_filter.py SEED_ADDRESS --stop 1000000 -o deposits.xor
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+
+import deposit_index
+
+MAGIC = b"BTCXOR81"
+HEADER = struct.Struct(">8sQIQ")
+PROGRAM_SIZE = 32
+
+# Slots per program, with the 32 extra slots of the xor filter paper.
+LOAD_FACTOR = 1.23
+EXTRA_SLOTS = 32
+MAX_ATTEMPTS = 64
+
+M32 = 0xffffffff
+
+
+def _hasher(seed):
+    """Function of a program returning its 128-bit keyed hash as an int."""
+    salt = seed.to_bytes(16, "little")
+    blake2b = hashlib.blake2b
+
+    def digest(program):
+        return int.from_bytes(blake2b(program, digest_size=16, salt=salt).digest(), "little")
+
+    return digest
+
+
+def _slots(h, block_length):
+    """The three slots of a hash, one per block."""
+    return ((h & M32) * block_length >> 32,
+            ((h >> 32 & M32) * block_length >> 32) + block_length,
+            ((h >> 64 & M32) * block_length >> 32) + 2 * block_length)
+
+
+def _construct(hashes, block_length):
+    """Fingerprints for distinct hashes, or None if the slots cannot be peeled."""
+    capacity = 3 * block_length
+    slots = [_slots(h, block_length) for h in hashes]
+    count = [0] * capacity
+    keys = [0] * capacity
+    for k, key_slots in enumerate(slots):
+        for s in key_slots:
+            count[s] += 1
+            keys[s] ^= k
+    stack = [s for s in range(capacity) if count[s] == 1]
+    order = []
+    while stack:
+        s = stack.pop()
+        if count[s] != 1:
+            continue
+        k = keys[s]
+        order.append((k, s))
+        for t in slots[k]:
+            count[t] -= 1
+            keys[t] ^= k
+            if count[t] == 1:
+                stack.append(t)
+    if len(order) != len(hashes):
+        return None
+    fingerprints = bytearray(capacity)
+    for k, s in reversed(order):
+        s0, s1, s2 = slots[k]
+        fingerprints[s] = (hashes[k] >> 96 & 0xff) ^ fingerprints[s0] ^ fingerprints[s1] ^ fingerprints[s2]
+    return fingerprints
+
+
+class ProgramFilter:
+    """Approximate set of witness programs, see the module docstring."""
+
+    def __init__(self, fingerprints, seed, size):
+        self.fingerprints = fingerprints
+        self.seed = seed
+        self.size = size
+        self._block_length = len(fingerprints) // 3
+        self._digest = _hasher(seed)
+        self._mm = None
+        self._file = None
+
+    @classmethod
+    def build(cls, programs):
+        """Filter of an iterable of programs, duplicates are allowed."""
+        programs = {bytes(program) for program in programs}
+        block_length = (int(LOAD_FACTOR * len(programs)) + EXTRA_SLOTS) // 3
+        for seed in range(MAX_ATTEMPTS):
+            digest = _hasher(seed)
+            hashes = [digest(program) for program in programs]
+            fingerprints = _construct(hashes, block_length)
+            if fingerprints is not None:
+                return cls(fingerprints, seed, len(programs))
+        raise ValueError("could not construct the filter")
+
+    @classmethod
+    def open(cls, path):
+        """Filter of a file written by save, the fingerprints stay in the file."""
+        f = open(path, "rb")
+        magic, seed, block_length, size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            f.close()
+            raise ValueError(f"{path} is not a program filter")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) != HEADER.size + 3 * block_length:
+            mm.close()
+            f.close()
+            raise ValueError(f"{path} is truncated")
+        self = cls(memoryview(mm)[HEADER.size:], seed, size)
+        self._mm = mm
+        self._file = f
+        return self
+
+    def save(self, path):
+        """Write the filter to path atomically."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.seed, self._block_length, self.size))
+            f.write(self.fingerprints)
+        os.replace(tmp, path)
+
+    def close(self):
+        if self._mm is not None:
+            self.fingerprints.release()
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Size of the fingerprint array."""
+        return len(self.fingerprints)
+
+    def __contains__(self, program):
+        """True for every program of the filter and about 1 in 256 others."""
+        h = self._digest(program)
+        n = self._block_length
+        fingerprints = self.fingerprints
+        return (fingerprints[(h & M32) * n >> 32]
+                ^ fingerprints[((h >> 32 & M32) * n >> 32) + n]
+                ^ fingerprints[((h >> 64 & M32) * n >> 32) + 2 * n]) == h >> 96 & 0xff
+
+    def filter_outputs(self, outputs, exact, key=None):
+        """Outputs whose program is in exact, consulted only for filter hits.
+
+        exact is a set of programs or a DepositIndex. key returns the program of an output, by default outputs are programs.
+        """
+        for output in outputs:
+            program = output if key is None else key(output)
+            if len(program) == PROGRAM_SIZE and program in self and program in exact:
+                yield output
+
+
+def build_from_seed(seed_address, start, stop):
+    """Filter of the programs of getBTCDepositAddress(index) for index in range(start, stop)."""
+    _, entries = deposit_index.derived_entries(seed_address, start, stop)
+    return ProgramFilter.build(program for _, program in entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a deposit program filter.")
+    parser.add_argument("seed_address", help="seed taproot address passed to setSeed")
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, required=True)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+    program_filter = build_from_seed(args.seed_address, args.start, args.stop)
+    program_filter.save(args.output)
+    print(f"{len(program_filter)} programs, {program_filter.nbytes} bytes, "
+          f"{program_filter.nbytes * 8 / max(1, len(program_filter)):.2f} bits per program")
+
+
+if __name__ == "__main__":
+    main()
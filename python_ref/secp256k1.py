@@ -0,0 +1,317 @@
+"""secp256k1 arithmetic mirroring EllipticCurve.sol as used by src/Deriver.sol.
+
+Points are affine (x, y) tuples of ints and the point at infinity is
+(0, 0), the same convention EllipticCurve.sol uses.
+"""
+
+import os
+from functools import lru_cache
+
+# Constants from Deriver.sol
+GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+AA = 0
+BB = 7
+PP = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+NN = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+G = (GX, GY)
+INFINITY = (0, 0)
+
+
+def ec_add(x1, y1, x2, y2):
+    """Add two points, same as EllipticCurve.ecAdd."""
+    if (x1, y1) == INFINITY:
+        return (x2, y2)
+    if (x2, y2) == INFINITY:
+        return (x1, y1)
+    if x1 == x2:
+        if (y1 + y2) % PP == 0:
+            return INFINITY
+        lam = 3 * x1 * x1 * pow(2 * y1, -1, PP) % PP
+    else:
+        lam = (y2 - y1) * pow(x2 - x1, -1, PP) % PP
+    x3 = (lam * lam - x1 - x2) % PP
+    return (x3, (lam * (x1 - x3) - y1) % PP)
+
+
+def ec_mul(k, x, y):
+    """Multiply a point by a scalar, same as EllipticCurve.ecMul."""
+    if k == 0 or (x, y) == INFINITY:
+        return INFINITY
+    result = INFINITY
+    addend = (x, y)
+    while k:
+        if k & 1:
+            result = ec_add(*result, *addend)
+        addend = ec_add(*addend, *addend)
+        k >>= 1
+    return result
+
+
+def derive_y(prefix, x):
+    """Compute y from x and a 0x02/0x03 parity prefix, same as EllipticCurve.deriveY."""
+    y = pow((x * x * x + AA * x + BB) % PP, (PP + 1) // 4, PP)
+    return y if (y + prefix) % 2 == 0 else PP - y
+
+
+def lift_x(x):
+    """Even y coordinate for x, same as Deriver.liftX."""
+    return derive_y(0x02, x)
+
+
+# Fixed-base multiplication of G. Window i of the table holds
+# j * 2^(G_WINDOW * i) * G for j = 0..2^G_WINDOW-1, so k*G is one table
+# lookup and one addition per window and needs no doublings.
+G_WINDOW = 8
+G_WINDOWS = (256 + G_WINDOW - 1) // G_WINDOW
+
+_G_TABLE_MAGIC = b"SECPG" + bytes([G_WINDOW])
+_g_table = None
+
+
+def _build_g_table():
+    """Compute the fixed-base table for G."""
+    table = []
+    base = G
+    for _ in range(G_WINDOWS):
+        row = [INFINITY, base]
+        for _ in range(2, 1 << G_WINDOW):
+            row.append(ec_add(*row[-1], *base))
+        table.append(row)
+        base = ec_add(*row[-1], *base)
+    return table
+
+
+def _load_g_table(path):
+    """Read a table written by _save_g_table, None if missing or invalid."""
+    size = len(_G_TABLE_MAGIC) + G_WINDOWS * (1 << G_WINDOW) * 64
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) != size or not data.startswith(_G_TABLE_MAGIC):
+        return None
+    points = [(int.from_bytes(data[i:i + 32], "big"), int.from_bytes(data[i + 32:i + 64], "big"))
+              for i in range(len(_G_TABLE_MAGIC), size, 64)]
+    return [points[i:i + (1 << G_WINDOW)] for i in range(0, len(points), 1 << G_WINDOW)]
+
+
+def _save_g_table(path, table):
+    """Write the table atomically as raw 64-byte points."""
+    data = b"".join(x.to_bytes(32, "big") + y.to_bytes(32, "big") for row in table for x, y in row)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_G_TABLE_MAGIC + data)
+    os.replace(tmp, path)
+
+
+def g_table(cache_path=None):
+    """Return the fixed-base table for G, building it on first use.
+
+    cache_path (default: $SECP256K1_G_TABLE_CACHE) is a file the table is
+    loaded from, or written to after it was built.
+    """
+    global _g_table
+    if _g_table is None:
+        cache_path = cache_path or os.environ.get("SECP256K1_G_TABLE_CACHE")
+        table = _load_g_table(cache_path) if cache_path else None
+        if table is None:
+            table = _build_g_table()
+            if cache_path:
+                _save_g_table(cache_path, table)
+        _g_table = table
+    return _g_table
+
+
+def g_mul(k):
+    """k * G using the fixed-base table, same result as ec_mul(k, GX, GY)."""
+    k %= NN
+    table = g_table()
+    mask = (1 << G_WINDOW) - 1
+    result = INFINITY
+    i = 0
+    while k:
+        digit = k & mask
+        if digit:
+            result = ec_add(*result, *table[i][digit])
+        k >>= G_WINDOW
+        i += 1
+    return result
+
+
+# Jacobian coordinates: (X, Y, Z) is the affine point (X/Z^2, Y/Z^3), Z == 0
+# is the point at infinity. Additions need no inversion; converting a
+# whole batch back to affine costs a single inversion (batch_to_affine).
+JACOBIAN_INFINITY = (1, 1, 0)
+
+
+def to_jacobian(x, y):
+    """Affine point to Jacobian coordinates."""
+    if (x, y) == INFINITY:
+        return JACOBIAN_INFINITY
+    return (x, y, 1)
+
+
+def jac_double(p):
+    """Double a Jacobian point."""
+    x, y, z = p
+    if z == 0 or y == 0:
+        return JACOBIAN_INFINITY
+    a = x * x % PP
+    b = y * y % PP
+    c = b * b % PP
+    d = 2 * ((x + b) * (x + b) - a - c) % PP
+    e = 3 * a % PP
+    x3 = (e * e - 2 * d) % PP
+    y3 = (e * (d - x3) - 8 * c) % PP
+    return (x3, y3, 2 * y * z % PP)
+
+
+def jac_add_affine(p, x2, y2):
+    """Add an affine point to a Jacobian point."""
+    if (x2, y2) == INFINITY:
+        return p
+    x1, y1, z1 = p
+    if z1 == 0:
+        return (x2, y2, 1)
+    z1z1 = z1 * z1 % PP
+    h = (x2 * z1z1 - x1) % PP
+    r = (y2 * z1 * z1z1 - y1) % PP
+    if h == 0:
+        return jac_double(p) if r == 0 else JACOBIAN_INFINITY
+    hh = h * h % PP
+    hhh = h * hh % PP
+    v = x1 * hh % PP
+    x3 = (r * r - hhh - 2 * v) % PP
+    y3 = (r * (v - x3) - y1 * hhh) % PP
+    return (x3, y3, z1 * h % PP)
+
+
+def jac_add(p, q):
+    """Add two Jacobian points."""
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    if z1 == 0:
+        return q
+    if z2 == 0:
+        return p
+    z1z1 = z1 * z1 % PP
+    z2z2 = z2 * z2 % PP
+    u1 = x1 * z2z2 % PP
+    s1 = y1 * z2 * z2z2 % PP
+    h = (x2 * z1z1 - u1) % PP
+    r = (y2 * z1 * z1z1 - s1) % PP
+    if h == 0:
+        return jac_double(p) if r == 0 else JACOBIAN_INFINITY
+    hh = h * h % PP
+    hhh = h * hh % PP
+    v = u1 * hh % PP
+    x3 = (r * r - hhh - 2 * v) % PP
+    y3 = (r * (v - x3) - s1 * hhh) % PP
+    return (x3, y3, z1 * z2 * h % PP)
+
+
+def jac_mul(k, x, y):
+    """k * (x, y) as a Jacobian point, double-and-add without inversions."""
+    k %= NN
+    result = JACOBIAN_INFINITY
+    for bit in bin(k)[2:] if k else "":
+        result = jac_double(result)
+        if bit == "1":
+            result = jac_add_affine(result, x, y)
+    return result
+
+
+def g_mul_jacobian(k):
+    """k * G as a Jacobian point using the fixed-base table."""
+    k %= NN
+    table = g_table()
+    mask = (1 << G_WINDOW) - 1
+    result = JACOBIAN_INFINITY
+    i = 0
+    while k:
+        digit = k & mask
+        if digit:
+            result = jac_add_affine(result, *table[i][digit])
+        k >>= G_WINDOW
+        i += 1
+    return result
+
+
+# Joint multiplication k1*P1 + k2*P2 (Strauss/Shamir): one shared chain of
+# doublings with a lookup in each point's window table per window, about
+# half the doublings of two separate multiplications.
+JOINT_WINDOW = 5
+JOINT_WINDOWS = (256 + JOINT_WINDOW - 1) // JOINT_WINDOW
+
+# Points whose window tables are kept, e.g. the validator pubkeys of a few seeds.
+POINT_TABLE_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=POINT_TABLE_CACHE_SIZE)
+def point_table(x, y):
+    """Affine j * (x, y) for j = 0..2^JOINT_WINDOW-1, built once per point."""
+    multiples = [JACOBIAN_INFINITY, to_jacobian(x, y)]
+    for _ in range(2, 1 << JOINT_WINDOW):
+        multiples.append(jac_add_affine(multiples[-1], x, y))
+    return tuple(batch_to_affine(multiples))
+
+
+def jac_mul_joint(k1, x1, y1, k2, x2, y2):
+    """k1 * (x1, y1) + k2 * (x2, y2) as a Jacobian point."""
+    k1 %= NN
+    k2 %= NN
+    table1 = point_table(x1, y1)
+    table2 = point_table(x2, y2)
+    mask = (1 << JOINT_WINDOW) - 1
+    result = JACOBIAN_INFINITY
+    for shift in range((JOINT_WINDOWS - 1) * JOINT_WINDOW, -1, -JOINT_WINDOW):
+        if result[2]:
+            for _ in range(JOINT_WINDOW):
+                result = jac_double(result)
+        d1 = k1 >> shift & mask
+        if d1:
+            result = jac_add_affine(result, *table1[d1])
+        d2 = k2 >> shift & mask
+        if d2:
+            result = jac_add_affine(result, *table2[d2])
+    return result
+
+
+def batch_inverse(values):
+    """Modular inverses of non-zero values with a single inversion (Montgomery's trick)."""
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % PP
+    inv = pow(acc, -1, PP)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = inv * prefix[i] % PP
+        inv = inv * values[i] % PP
+    return out
+
+
+def batch_to_affine(points):
+    """Convert Jacobian points to affine with a single inversion."""
+    finite = [i for i, p in enumerate(points) if p[2] != 0]
+    inverses = batch_inverse([points[i][2] for i in finite])
+    out = [INFINITY] * len(points)
+    for i, zinv in zip(finite, inverses):
+        x, y, _ = points[i]
+        zinv2 = zinv * zinv % PP
+        out[i] = (x * zinv2 % PP, y * zinv2 * zinv % PP)
+    return out
+
+
+def lift_x_many(xs):
+    """Even y coordinates for many x, same as lift_x for each."""
+    exponent = (PP + 1) // 4
+    out = []
+    for x in xs:
+        y = pow((x * x * x + BB) % PP, exponent, PP)
+        out.append(y if y % 2 == 0 else PP - y)
+    return out
@@ -22,16 +22,103 @@
 """Reference implementation for Bech32/Bech32m and segwit addresses."""
 
 
-from enum import Enum
+import os
+import threading
+import time
+from contextlib import contextmanager
+from enum import Enum, IntEnum
+from functools import lru_cache, reduce, wraps
+from itertools import islice
+from operator import getitem, xor
 
 class Encoding(Enum):
     """Enumeration type to list the various supported encodings."""
     BECH32 = 1
     BECH32M = 2
 
+class DecodeError(IntEnum):
+    """Error codes of Bech32m.DecodeError, same names and values."""
+    NoError = 0
+    IncorrectPadding = 1
+    IncorrectLength = 2
+    CharacterOutOfRange = 3
+    MixedCase = 4
+    IncorrectChecksum = 5
+    TooShortChecksum = 6
+    InputIsTooLong = 7
+    NotBech32Character = 8
+    HRPIsEmpty = 9
+    NoDelimiter = 10
+    HRPMismatch = 11
+    EmptyData = 12
+    WitnessProgramTooSmall = 13
+    WitnessProgramTooLarge = 14
+    SegwitVersionTooLarge = 15
+    IncorrectSegwitV0Program = 16
+    IncorrectEncodingForSegwitV0 = 17
+    IncorrectEncodingForSegwitVn = 18
+
+# Messages of Bech32m.explainDecodeError
+DECODE_ERROR_MESSAGES = {
+    DecodeError.NoError: "No error",
+    DecodeError.IncorrectPadding: "Incorrect Padding",
+    DecodeError.IncorrectLength: "Incorrect address length",
+    DecodeError.CharacterOutOfRange: "Address contain character out of range",
+    DecodeError.MixedCase: "Address consists of both capital and small letters",
+    DecodeError.IncorrectChecksum: "Address checksum does not match",
+    DecodeError.TooShortChecksum: "Address checksum is too short",
+    DecodeError.InputIsTooLong: "Address is too long",
+    DecodeError.NotBech32Character: "Address contains character which is not in bech32 encoding",
+    DecodeError.HRPIsEmpty: "Network prefix is empty",
+    DecodeError.NoDelimiter: "No prefix delimiter in the address",
+    DecodeError.HRPMismatch: "Network prefix is different from expected",
+    DecodeError.EmptyData: "Witness program is empty",
+    DecodeError.WitnessProgramTooSmall: "Witness program should be at least 2 bytes",
+    DecodeError.WitnessProgramTooLarge: "Witness program should be maximum 40 bytes",
+    DecodeError.SegwitVersionTooLarge: "Segwit version should be from 0 to 16 (including). Got some larger number.",
+    DecodeError.IncorrectSegwitV0Program: "Length of segwit v0 program should be either 20 or 32 bytes",
+    DecodeError.IncorrectEncodingForSegwitV0: "Segwit v0 should be encoded using Bech32",
+    DecodeError.IncorrectEncodingForSegwitVn: "Segwit with versions 1-16 should be encoded with Bech32m",
+}
+
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 BECH32M_CONST = 0x2bc830a3
 
+# Bech32m.REVERSE_CHARSET: value of every ASCII character, 0x7f if not in CHARSET.
+REVERSE_CHARSET = bytes(CHARSET.find(chr(c)) & 0x7f for c in range(128))
+
+
+def _char_classes():
+    """Value and flags of every byte for bech32_decode_with_error.
+
+    The low 5 bits are the CHARSET value of the lowercased character,
+    the flags mark characters that are no data character, upper and lower
+    case letters, the separator and bytes out of the 33..126 range.
+    """
+    classes = []
+    for c in range(256):
+        if c < 33 or c > 126:
+            classes.append(_OUT_OF_RANGE)
+            continue
+        char = chr(c).lower()
+        flags = _UPPER if char != chr(c) else _LOWER if char != char.upper() else 0
+        if char == '1':
+            flags |= _SEPARATOR
+        value = CHARSET.find(char)
+        classes.append(flags | _NOT_DATA if value < 0 else flags | value)
+    return tuple(classes)
+
+_NOT_DATA = 0x20
+_UPPER = 0x40
+_LOWER = 0x80
+_SEPARATOR = 0x100
+_OUT_OF_RANGE = 0x200
+# Flags of the bytes that are not a data character, checked first for every byte
+_REJECT = _NOT_DATA | _SEPARATOR | _OUT_OF_RANGE
+_CHAR_CLASSES = _char_classes()
+# Lowercase ASCII, for the HRP of bytes input
+_LOWERCASE = bytes(range(65)) + bytes(range(97, 123)) + bytes(range(91, 256))
+
 def bech32_polymod(values):
     """Internal function that computes the Bech32 checksum."""
     generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
@@ -44,14 +131,65 @@ def bech32_polymod(values):
     return chk
 
 
+def _polymod_table():
+    """Precompute the generator XOR for every possible top 5 bits."""
+    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+    table = []
+    for top in range(32):
+        mask = 0
+        for i in range(5):
+            mask ^= generator[i] if ((top >> i) & 1) else 0
+        table.append(mask)
+    return tuple(table)
+
+POLYMOD_TABLE = _polymod_table()
+
+
+def bech32_polymod_table(values, chk=1):
+    """Table-driven bech32_polymod, one lookup per symbol."""
+    table = POLYMOD_TABLE
+    for value in values:
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
+    return chk
+
+
+class PolymodState:
+    """Resumable Bech32 checksum state that can be fed symbols incrementally."""
+
+    __slots__ = ("chk",)
+
+    def __init__(self, chk=1):
+        self.chk = chk
+
+    def update(self, values):
+        """Feed 5-bit values into the checksum."""
+        self.chk = bech32_polymod_table(values, self.chk)
+        return self
+
+    def copy(self):
+        """Return an independent copy of the current state."""
+        return PolymodState(self.chk)
+
+    def finalize(self, const):
+        """Return the 6 checksum values for the data fed so far."""
+        polymod = bech32_polymod_table((0, 0, 0, 0, 0, 0), self.chk) ^ const
+        return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
 def bech32_hrp_expand(hrp):
     """Expand the HRP into values for checksum computation."""
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache(maxsize=64)
+def bech32_hrp_polymod(hrp):
+    """Checksum state after the expanded HRP, cached per HRP."""
+    return bech32_polymod_table(bech32_hrp_expand(hrp))
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    const = bech32_polymod(bech32_hrp_expand(hrp) + data)
+    const = bech32_polymod_table(data, bech32_hrp_polymod(hrp))
     if const == 1:
         return Encoding.BECH32
     if const == BECH32M_CONST:
@@ -60,10 +198,8 @@ def bech32_verify_checksum(hrp, data):
 
 def bech32_create_checksum(hrp, data, spec):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
     const = BECH32M_CONST if spec == Encoding.BECH32M else 1
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ const
-    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return PolymodState(bech32_hrp_polymod(hrp)).update(data).finalize(const)
 
 
 def bech32_encode(hrp, data, spec):
@@ -112,12 +248,64 @@ def convertbits(data, frombits, tobits, pad=True):
     return ret
 
 
+@lru_cache(maxsize=128)
+def _spread_masks(ngroups):
+    """Masks that move 5-bit group k of an integer from bit 5k to bit 8k.
+
+    Group k has to move by 3k bits. That is done in one mask-and-shift step
+    per bit of k, highest bit first, so groups never overlap on the way.
+    Returns the steps and the mask of bits 5-7 of every byte lane.
+    """
+    steps = []
+    for j in reversed(range(max(1, ngroups - 1).bit_length())):
+        mask = 0
+        for k in range(ngroups):
+            if (k >> j) & 1:
+                mask |= 31 << (5 * k + 3 * (k >> (j + 1) << (j + 1)))
+        steps.append((3 << j, mask))
+    high = sum(0xe0 << (8 * k) for k in range(ngroups))
+    return tuple(steps), high
+
+
+def bytes_to_5bit(data):
+    """Same as convertbits(data, 8, 5), but returns bytes."""
+    ngroups = (len(data) * 8 + 4) // 5
+    acc = int.from_bytes(bytes(data), 'big') << (ngroups * 5 - len(data) * 8)
+    for shift, mask in _spread_masks(ngroups)[0]:
+        moved = acc & mask
+        acc = (acc ^ moved) | (moved << shift)
+    return acc.to_bytes(ngroups, 'big')
+
+
+def fivebit_to_bytes(data):
+    """Same as convertbits(data, 5, 8, False), but returns bytes."""
+    ngroups = len(data)
+    nbytes, padbits = divmod(ngroups * 5, 8)
+    if padbits >= 5:
+        return None
+    acc = int.from_bytes(bytes(data), 'big')
+    steps, high = _spread_masks(ngroups)
+    if acc & high:
+        return None
+    for shift, mask in reversed(steps):
+        moved = acc & (mask << shift)
+        acc = (acc ^ moved) | (moved >> shift)
+    if acc & ((1 << padbits) - 1):
+        return None
+    return (acc >> padbits).to_bytes(nbytes, 'big')
+
+
 def decode(hrp, addr):
     """Decode a segwit address."""
     hrpgot, data, spec = bech32_decode(addr)
     if hrpgot != hrp:
         return (None, None)
-    decoded = convertbits(data[1:], 5, 8, False)
+    return decode_segwit_data(data, spec)
+
+
+def decode_segwit_data(data, spec):
+    """Apply the segwit rules to decoded data values."""
+    decoded = fivebit_to_bytes(data[1:])
     if decoded is None or len(decoded) < 2 or len(decoded) > 40:
         return (None, None)
     if data[0] > 16:
@@ -126,13 +314,572 @@ def decode(hrp, addr):
         return (None, None)
     if data[0] == 0 and spec != Encoding.BECH32 or data[0] != 0 and spec != Encoding.BECH32M:
         return (None, None)
-    return (data[0], decoded)
+    return (data[0], list(decoded))
 
 
 def encode(hrp, witver, witprog):
     """Encode a segwit address."""
     spec = Encoding.BECH32 if witver == 0 else Encoding.BECH32M
-    ret = bech32_encode(hrp, [witver] + convertbits(witprog, 8, 5), spec)
+    ret = bech32_encode(hrp, [witver] + list(bytes_to_5bit(witprog)), spec)
     if decode(hrp, ret) == (None, None):
         return None
-    return ret
\ No newline at end of file
+    return ret
+
+
+def bech32_decode_with_error(bech, expected_hrp=None):
+    """Bech32m.bech32Decode: return (hrp, data, spec, DecodeError) in one pass.
+
+    bech is a str or bytes. Range, case, separator, charset and checksum
+    are checked in a single loop with one table lookup per byte, and
+    errors are reported in the order of the Solidity checks. That includes
+    its separator search: a '1' at index 2 is the separator, otherwise the
+    last '1' before the final character. The checksum starts from the
+    cached state of expected_hrp, it is only recomputed if the HRP differs.
+    """
+    if isinstance(bech, str):
+        bech = bech.encode('utf-8', 'surrogateescape')
+    failed = (None, None, None)
+    if len(bech) > 90:
+        return failed + (DecodeError.InputIsTooLong,)
+    if expected_hrp is None:
+        expected_hrp = ''
+    classes = _CHAR_CLASSES
+    reject = _REJECT
+    table = POLYMOD_TABLE
+    chk0 = bech32_hrp_polymod(expected_hrp)
+    chk = chk0
+    seen = 0
+    not_data = False
+    for c in bech:
+        v = classes[c]
+        if not v & reject:
+            chk = (chk & 0x1ffffff) << 5 ^ (v & 31) ^ table[chk >> 25]
+        elif v & _OUT_OF_RANGE:
+            return failed + (DecodeError.CharacterOutOfRange,)
+        elif v & _SEPARATOR:
+            # Checksum and charset of what follows the last '1'
+            chk = chk0
+            not_data = False
+        else:
+            not_data = True
+        seen |= v
+    if seen & _UPPER and seen & _LOWER:
+        return failed + (DecodeError.MixedCase,)
+    last = len(bech) - 1
+    if last > 1 and bech[2] == 49:
+        pos = 2
+    else:
+        pos = bech.rfind(b'1', 0, max(last, 0))
+    if pos < 0:
+        return failed + (DecodeError.NoDelimiter,)
+    if pos < 1:
+        return failed + (DecodeError.HRPIsEmpty,)
+    if pos + 7 > len(bech):
+        return failed + (DecodeError.TooShortChecksum,)
+    # A '1' after the separator is no data character
+    if not_data or bech.find(b'1', pos + 1) >= 0:
+        return failed + (DecodeError.NotBech32Character,)
+    hrp = bech[:pos].translate(_LOWERCASE).decode('ascii')
+    data = [classes[c] & 31 for c in bech[pos+1:]]
+    if hrp != expected_hrp:
+        chk = bech32_polymod_table(data, bech32_hrp_polymod(hrp))
+    if chk == 1:
+        spec = Encoding.BECH32
+    elif chk == BECH32M_CONST:
+        spec = Encoding.BECH32M
+    else:
+        return failed + (DecodeError.IncorrectChecksum,)
+    return (hrp, data[:-6], spec, DecodeError.NoError)
+
+
+def decode_segwit_address(hrp, addr):
+    """Bech32m.decodeSegwitAddress: return (witver, witprog, DecodeError).
+
+    Same checks and error codes as the Solidity decoder, witver and
+    witprog are None on failure.
+    """
+    hrpgot, data, spec, err = bech32_decode_with_error(addr, hrp)
+    if err:
+        return (None, None, err)
+    if hrpgot != hrp:
+        return (None, None, DecodeError.HRPMismatch)
+    if not data:
+        return (None, None, DecodeError.EmptyData)
+    if data[0] > 16:
+        return (None, None, DecodeError.SegwitVersionTooLarge)
+    nrest = (len(data) - 1) % 8
+    if nrest in (1, 3, 6):
+        return (None, None, DecodeError.IncorrectLength)
+    decoded = fivebit_to_bytes(data[1:])
+    if decoded is None:
+        return (None, None, DecodeError.IncorrectPadding)
+    if len(decoded) < 2:
+        return (None, None, DecodeError.WitnessProgramTooSmall)
+    if len(decoded) > 40:
+        return (None, None, DecodeError.WitnessProgramTooLarge)
+    if data[0] == 0 and len(decoded) != 20 and len(decoded) != 32:
+        return (None, None, DecodeError.IncorrectSegwitV0Program)
+    if data[0] == 0 and spec != Encoding.BECH32:
+        return (None, None, DecodeError.IncorrectEncodingForSegwitV0)
+    if data[0] != 0 and spec != Encoding.BECH32M:
+        return (None, None, DecodeError.IncorrectEncodingForSegwitVn)
+    return (data[0], list(decoded), DecodeError.NoError)
+
+
+# Longest data part (with checksum) of a 90 character string with a 1 character HRP
+MAX_DATA_LENGTH = 88
+# Substitutions that can always be located: the checksum has distance 5 up to this length
+MAX_CORRECTABLE = 2
+
+
+@lru_cache(maxsize=1)
+def _syndrome_table():
+    """{residue: (i, e)} of a single error e at the i-th symbol from the end.
+
+    The polymod is linear, so the residue of a string with errors is the
+    XOR of the residues of its errors, and e followed by i zeros is the
+    residue of one error. They are all distinct, or the checksum would
+    miss two errors.
+    """
+    table = {}
+    residues = list(range(1, 32))
+    for i in range(MAX_DATA_LENGTH):
+        for e, chk in enumerate(residues, 1):
+            table[chk] = (i, e)
+        residues = [(chk & 0x1ffffff) << 5 ^ POLYMOD_TABLE[chk >> 25] for chk in residues]
+    return table
+
+
+def bech32_locate_errors(hrp, data, spec):
+    """Locate up to MAX_CORRECTABLE substituted values of a Bech32 data part.
+
+    data are the 5-bit values after the separator, with the checksum.
+    Returns a list of (index, corrected value), empty if the checksum
+    matches, or None if more errors than that would be needed. One error
+    is a single lookup of the residue in the syndrome table. Two errors
+    are found with one lookup per entry of that table, whose size does
+    not depend on the input.
+    """
+    const = BECH32M_CONST if spec == Encoding.BECH32M else 1
+    residue = bech32_polymod_table(data, bech32_hrp_polymod(hrp)) ^ const
+    if residue == 0:
+        return []
+    n = len(data)
+    table = _syndrome_table()
+    found = table.get(residue)
+    if found is not None:
+        i, e = found
+        return [(n - 1 - i, data[n - 1 - i] ^ e)] if i < n else None
+    for syndrome, (i, e) in islice(table.items(), 31 * (n - 1)):
+        other = table.get(residue ^ syndrome)
+        if other is not None and i < other[0] < n:
+            j, f = other
+            return [(n - 1 - j, data[n - 1 - j] ^ f), (n - 1 - i, data[n - 1 - i] ^ e)]
+    return None
+
+
+def suggest_corrections(hrp, addr):
+    """Valid addresses that differ from addr in at most MAX_CORRECTABLE data characters.
+
+    Returns a list of (address, positions) with the changed string
+    positions, fewest changes first. Characters that are not in CHARSET
+    count as substitutions. Both checksum constants are tried, and every
+    suggestion is checked with decode(hrp, address). The suggestions are
+    lowercase, and the HRP and separator are not corrected.
+    """
+    bech = addr.lower()
+    start = len(hrp) + 1
+    if not hrp or not bech.startswith(hrp + '1') or len(bech) > 90 or len(bech) < start + 6:
+        return []
+    data = [CHARSET.find(x) for x in bech[start:]]
+    erased = {i for i, value in enumerate(data) if value < 0}
+    if len(erased) > MAX_CORRECTABLE:
+        return []
+    data = [max(value, 0) for value in data]
+    suggestions = {}
+    for spec in Encoding:
+        errors = bech32_locate_errors(hrp, data, spec)
+        if errors is None:
+            continue
+        corrected = list(data)
+        for i, value in errors:
+            corrected[i] = value
+        positions = erased | {i for i, _ in errors}
+        if len(positions) > MAX_CORRECTABLE:
+            continue
+        address = bech[:start] + ''.join(CHARSET[value] for value in corrected)
+        if decode(hrp, address) != (None, None):
+            suggestions[address] = sorted(start + i for i in positions)
+    return sorted(suggestions.items(), key=lambda item: len(item[1]))
+
+
+def make_decoder(hrp):
+    """Return a decode(addr) function for a fixed HRP.
+
+    The checksum starts from the cached state after the HRP, so the
+    per-address work only depends on the data part.
+    """
+    chk0 = bech32_hrp_polymod(hrp)
+    prefix = hrp + '1'
+    charset_rev = {x: i for i, x in enumerate(CHARSET)}
+
+    def decode_hrp(addr):
+        """Decode a segwit address, same as decode(hrp, addr)."""
+        if ((any(ord(x) < 33 or ord(x) > 126 for x in addr)) or
+                (addr.lower() != addr and addr.upper() != addr)):
+            return (None, None)
+        bech = addr.lower()
+        pos = bech.rfind('1')
+        if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
+            return (None, None)
+        if pos != len(hrp) or not bech.startswith(prefix):
+            return (None, None)
+        try:
+            data = [charset_rev[x] for x in bech[pos+1:]]
+        except KeyError:
+            return (None, None)
+        const = bech32_polymod_table(data, chk0)
+        if const == 1:
+            spec = Encoding.BECH32
+        elif const == BECH32M_CONST:
+            spec = Encoding.BECH32M
+        else:
+            return (None, None)
+        return decode_segwit_data(data[:-6], spec)
+
+    return decode_hrp
+
+
+def make_encoder(hrp):
+    """Return an encode(witver, witprog) function for a fixed HRP."""
+    chk0 = bech32_hrp_polymod(hrp)
+    decode_hrp = make_decoder(hrp)
+
+    def encode_hrp(witver, witprog):
+        """Encode a segwit address, same as encode(hrp, witver, witprog)."""
+        const = 1 if witver == 0 else BECH32M_CONST
+        data = [witver] + list(bytes_to_5bit(witprog))
+        chk = PolymodState(chk0).update(data).finalize(const)
+        ret = hrp + '1' + ''.join([CHARSET[d] for d in data + chk])
+        if decode_hrp(ret) == (None, None):
+            return None
+        return ret
+
+    return encode_hrp
+
+# bytes.translate table from 5-bit values to CHARSET
+_SYMBOL_TO_CHARSET = bytes.maketrans(bytes(range(32)), CHARSET.encode())
+
+
+@lru_cache(maxsize=64)
+def _program_checksum_tables(length):
+    """Checksum residue of every byte value at every position of a program.
+
+    The polymod is linear, so the residue of an address is the residue of
+    its HRP, witness version and an all-zero program, XOR the entry of
+    each program byte in these tables.
+    """
+    tables = []
+    for j in range(length):
+        basis = []
+        for k in range(8):
+            program = bytearray(length)
+            program[j] = 1 << k
+            basis.append(bech32_polymod_table(bytes_to_5bit(program) + bytes(6), 0))
+        table = [0] * 256
+        for b in range(1, 256):
+            low = b & -b
+            table[b] = table[b ^ low] ^ basis[low.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def encode_many(hrp, witver, programs):
+    """Encode witness programs with one HRP and witness version.
+
+    Yields the same as encode(hrp, witver, program) for every program,
+    without decoding the result again: the witness version, program
+    lengths and address length are checked up front, and the checksum
+    is a table lookup per program byte instead of a polymod step per
+    character.
+    """
+    if (not hrp or hrp != hrp.lower() or any(ord(x) < 33 or ord(x) > 126 for x in hrp)
+            or not isinstance(witver, int) or not 0 <= witver <= 16):
+        # Uppercase HRPs only make valid addresses without letters in the data part.
+        if hrp != hrp.lower() and isinstance(witver, int) and 0 <= witver <= 16:
+            for program in programs:
+                yield encode(hrp, witver, program)
+        else:
+            for _ in programs:
+                yield None
+        return
+    const = 1 if witver == 0 else BECH32M_CONST
+    chk0 = bech32_polymod_table((witver,), bech32_hrp_polymod(hrp))
+    prefix = hrp + '1' + CHARSET[witver]
+    bases = {}
+    for program in programs:
+        program = bytes(program)
+        length = len(program)
+        base = bases.get(length)
+        if base is None:
+            nsymbols = (length * 8 + 4) // 5
+            if (length < 2 or length > 40 or witver == 0 and length != 20 and length != 32
+                    or len(prefix) + nsymbols + 6 > 90):
+                base = bases[length] = False
+            else:
+                base = bases[length] = (bech32_polymod_table(bytes(nsymbols + 6), chk0) ^ const,
+                                        _program_checksum_tables(length))
+        if not base:
+            yield None
+            continue
+        residue = reduce(xor, map(getitem, base[1], program), base[0])
+        data = bytes_to_5bit(program) + bytes((residue >> 25, residue >> 20 & 31, residue >> 15 & 31,
+                                               residue >> 10 & 31, residue >> 5 & 31, residue & 31))
+        yield prefix + data.translate(_SYMBOL_TO_CHARSET).decode('ascii')
+
+
+def _decode_many_chunk(np, hrp_bytes, chk0, addresses):
+    """Vectorized decode of one chunk of addresses, see decode_many."""
+    n = len(addresses)
+    raw = [a.encode('utf-8', 'surrogatepass') for a in addresses]
+    lengths = np.fromiter((len(r) for r in raw), dtype=np.int64, count=n)
+    width = max(1, min(90, int(lengths.max()) if n else 1))
+    mat = np.frombuffer(b''.join(r[:width].ljust(width, b'\0') for r in raw),
+                        dtype=np.uint8).reshape(n, width)
+    cols = np.arange(width)
+    inside = cols < lengths[:, None]
+
+    # Range and mixed-case checks, then lowercase.
+    valid = lengths <= 90
+    valid &= ~(inside & ((mat < 33) | (mat > 126))).any(axis=1)
+    is_upper = (mat >= 65) & (mat <= 90)
+    is_lower = (mat >= 97) & (mat <= 122)
+    valid &= ~(is_upper.any(axis=1) & is_lower.any(axis=1))
+    mat = np.where(is_upper, mat + 32, mat).astype(np.uint8)
+
+    # The HRP is fixed, so the separator must be at len(hrp) and the data
+    # part starts at the same column in every row.
+    pos = np.where(inside & (mat == ord('1')), cols, -1).max(axis=1)
+    start = len(hrp_bytes) + 1
+    valid &= pos == len(hrp_bytes)
+    valid &= pos + 7 <= lengths
+    if start > width:
+        valid[:] = False
+        return valid, np.zeros(n, np.uint8), np.zeros((n, 40), np.uint8), np.zeros(n, np.int64)
+    if hrp_bytes:
+        valid &= (mat[:, :len(hrp_bytes)] == np.frombuffer(hrp_bytes, np.uint8)).all(axis=1)
+
+    # Charset lookup of the data part.
+    reverse = np.full(256, 0xff, dtype=np.uint8)
+    reverse[np.frombuffer(CHARSET.encode(), np.uint8)] = np.arange(32, dtype=np.uint8)
+    data = reverse[mat[:, start:]]
+    data_inside = inside[:, start:]
+    valid &= ~(data_inside & (data == 0xff)).any(axis=1)
+    data = np.where(data_inside, data, 0).astype(np.uint32)
+
+    # Polymod with one uint32 lane per row, resuming from the HRP state.
+    table = np.array(POLYMOD_TABLE, dtype=np.uint32)
+    chk = np.full(n, chk0, dtype=np.uint32)
+    for j in range(data.shape[1]):
+        step = ((chk & 0x1ffffff) << 5) ^ data[:, j] ^ table[chk >> 25]
+        chk = np.where(data_inside[:, j], step, chk)
+    is_bech32 = chk == 1
+    is_bech32m = chk == BECH32M_CONST
+    valid &= is_bech32 | is_bech32m
+
+    # 5 -> 8 conversion of the program, without padding.
+    ndata = lengths - start - 6
+    valid &= ndata >= 1
+    nprog5 = np.clip(ndata - 1, 0, 64)
+    witver = data[:, 0].astype(np.uint8) if data.shape[1] else np.zeros(n, np.uint8)
+    prog5 = np.zeros((n, 64), dtype=np.uint8)
+    avail = min(64, max(0, data.shape[1] - 1))
+    prog5[:, :avail] = data[:, 1:1 + avail]
+    prog5[np.arange(64) >= nprog5[:, None]] = 0
+    bits = ((prog5[:, :, None] >> np.arange(4, -1, -1, dtype=np.uint8)) & 1).reshape(n, 320)
+    nbytes = nprog5 * 5 // 8
+    nbits = nprog5 * 5
+    bitcols = np.arange(320)
+    valid &= nbits - nbytes * 8 < 5
+    valid &= ~((bitcols >= nbytes[:, None] * 8) & bits.astype(bool)).any(axis=1)
+    valid &= ndata - 1 <= 64
+    programs = np.packbits(bits.reshape(n, 40, 8), axis=-1).reshape(n, 40)
+
+    # Segwit policy checks.
+    valid &= (nbytes >= 2) & (nbytes <= 40)
+    valid &= witver <= 16
+    v0 = witver == 0
+    valid &= ~v0 | (nbytes == 20) | (nbytes == 32)
+    valid &= np.where(v0, is_bech32, is_bech32m)
+
+    witver = np.where(valid, witver, 0).astype(np.uint8)
+    nbytes = np.where(valid, nbytes, 0)
+    programs[~valid] = 0
+    return valid, witver, programs, nbytes
+
+
+def decode_many(hrp, addresses, chunk_size=1 << 16):
+    """Decode many segwit addresses at once using numpy.
+
+    Returns (valid, witver, programs, lengths): a boolean mask, the witness
+    versions, an (n, 40) uint8 matrix of zero-padded witness programs and the
+    program lengths. Row i is valid exactly when decode(hrp, addresses[i])
+    succeeds, in which case it holds the same witness version and program.
+    """
+    import numpy as np
+
+    addresses = list(addresses)
+    n = len(addresses)
+    valid = np.zeros(n, dtype=bool)
+    witver = np.zeros(n, dtype=np.uint8)
+    programs = np.zeros((n, 40), dtype=np.uint8)
+    lengths = np.zeros(n, dtype=np.int64)
+    hrp_bytes = hrp.encode('utf-8', 'surrogatepass')
+    if not hrp or hrp != hrp.lower() or any(ord(x) < 33 or ord(x) > 126 for x in hrp):
+        return valid, witver, programs, lengths
+    chk0 = bech32_hrp_polymod(hrp)
+    for lo in range(0, n, chunk_size):
+        hi = min(n, lo + chunk_size)
+        rows = _decode_many_chunk(np, hrp_bytes, chk0, addresses[lo:hi])
+        valid[lo:hi], witver[lo:hi], programs[lo:hi], lengths[lo:hi] = rows
+    return valid, witver, programs, lengths
+
+
+# Opt-in profiling. enable_profiling() rebinds the module functions below
+# to timing wrappers and disable_profiling() puts the originals back, so
+# while it is off the hot paths run the unmodified functions. Calls
+# through names bound before enabling, e.g. "from segwit_addr import
+# decode", are not seen. Setting SEGWIT_ADDR_PROFILE=1 enables it at
+# import.
+
+PROFILE_ENV = "SEGWIT_ADDR_PROFILE"
+
+# Every stage counts calls, input length (characters, 5-bit values or
+# bytes) and nanoseconds spent in the stage itself, without the nested
+# stages, so the stages add up. encode_roundtrip is the decode check that
+# encode runs on its output: its nanoseconds include the nested stages,
+# which are counted in those stages too.
+PROFILE_STAGES = ("bech32_decode", "bech32_verify_checksum", "convertbits", "decode", "encode",
+                  "encode_roundtrip")
+
+_PROFILED = {  # function name: (stage, input length of the arguments)
+    "bech32_decode": ("bech32_decode", lambda bech: len(bech)),
+    "bech32_verify_checksum": ("bech32_verify_checksum", lambda hrp, data: len(hrp) + len(data)),
+    "convertbits": ("convertbits", lambda data, *args, **kwargs: len(data)),
+    "bytes_to_5bit": ("convertbits", lambda data: len(data)),
+    "fivebit_to_bytes": ("convertbits", lambda data: len(data)),
+    "decode": ("decode", lambda hrp, addr: len(addr)),
+    "decode_segwit_data": ("decode", lambda data, spec: len(data)),
+    "encode": ("encode", lambda hrp, witver, witprog: len(witprog)),
+}
+
+PROFILED_FUNCTIONS = tuple(_PROFILED)
+
+_profile = {stage: [0, 0, 0] for stage in PROFILE_STAGES}
+_profile_originals = {}
+_profile_depth = 0
+_profile_local = threading.local()
+
+
+def _profiled(func, stage, size):
+    """Wrapper of func that adds its calls and time to the stage counters."""
+    counters = _profile[stage]
+    roundtrip = _profile["encode_roundtrip"] if func.__name__ == "decode" else None
+    perf_counter_ns = time.perf_counter_ns
+
+    @wraps(func)
+    def timed(*args, **kwargs):
+        try:
+            frames = _profile_local.frames
+        except AttributeError:
+            frames = _profile_local.frames = []
+        parent = frames[-1] if frames else None
+        frame = [stage, 0]  # stage, nanoseconds of nested stages
+        frames.append(frame)
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            frames.pop()
+            counters[2] += elapsed - frame[1]
+            # decode_segwit_data called by decode is the same call of the decode stage
+            if parent is None or parent[0] != stage:
+                counters[0] += 1
+                counters[1] += size(*args, **kwargs)
+            if parent is not None:
+                parent[1] += elapsed
+                if roundtrip is not None and parent[0] == "encode":
+                    roundtrip[0] += 1
+                    roundtrip[1] += size(*args, **kwargs)
+                    roundtrip[2] += elapsed
+
+    return timed
+
+
+def enable_profiling():
+    """Start counting, calls nest with disable_profiling."""
+    global _profile_depth
+    _profile_depth += 1
+    if _profile_depth == 1:
+        module = globals()
+        for name, (stage, size) in _PROFILED.items():
+            _profile_originals[name] = module[name]
+            module[name] = _profiled(module[name], stage, size)
+
+
+def disable_profiling():
+    """Undo one enable_profiling, the counters are kept."""
+    global _profile_depth
+    if _profile_depth == 0:
+        return
+    _profile_depth -= 1
+    if _profile_depth == 0:
+        globals().update(_profile_originals)
+        _profile_originals.clear()
+
+
+def profiling_enabled():
+    """True while the profiled functions are bound to their wrappers."""
+    return _profile_depth > 0
+
+
+@contextmanager
+def profiling():
+    """Context manager that enables profiling inside the block."""
+    enable_profiling()
+    try:
+        yield
+    finally:
+        disable_profiling()
+
+
+def reset_profile():
+    """Set all counters to zero."""
+    for counters in _profile.values():
+        counters[:] = [0, 0, 0]
+
+
+def profile_snapshot():
+    """{stage: {"calls": int, "bytes": int, "ns": int}} of every stage in PROFILE_STAGES."""
+    return {stage: dict(zip(("calls", "bytes", "ns"), counters)) for stage, counters in _profile.items()}
+
+
+def profile_prometheus(prefix="segwit_addr"):
+    """The counters in the Prometheus text exposition format."""
+    lines = []
+    snapshot = profile_snapshot()
+    for metric, key, help_text in (
+            ("calls_total", "calls", "Calls per stage."),
+            ("bytes_total", "bytes", "Input length processed per stage."),
+            ("seconds_total", "ns", "Time spent in the stage itself.")):
+        name = f"{prefix}_stage_{metric}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for stage, counters in snapshot.items():
+            value = counters[key] / 1e9 if key == "ns" else counters[key]
+            lines.append(f'{name}{{stage="{stage}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+if os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+    enable_profiling()
@@ -24,9 +24,34 @@
 
 """Reference tests for segwit adresses"""
 
+import asyncio
+import base58check
 import binascii
+import blk_parser
+import hashlib
+import json
+import os
+import random
+import tempfile
 import unittest
+import deposit_index
+import derivation_server
+import deriver
+import eth_deposit_addresses
+import gas_report
+import gen_fuzz_corpus
+import gen_sol_tests
+import hmac_sha512
+import pregenerate
+import program_filter
+import secp256k1
 import segwit_addr
+import validate_addresses
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 def segwit_scriptpubkey(witver, witprog):
     """Construct a Segwit scriptPubKey for a given witness program."""
@@ -194,5 +219,956 @@ class TestSegwitAddress(unittest.TestCase):
             code = segwit_addr.encode(hrp, version, [0] * length)
             self.assertIsNone(code)
 
+class TestPolymod(unittest.TestCase):
+    """Unit test class for the table-driven checksum engine."""
+
+    def test_polymod_table_matches_reference(self):
+        """Test that the table-driven polymod is bit-identical to the reference."""
+        rnd = random.Random(0)
+        for length in range(100):
+            values = [rnd.randrange(32) for _ in range(length)]
+            self.assertEqual(segwit_addr.bech32_polymod(values),
+                             segwit_addr.bech32_polymod_table(values))
+
+    def test_polymod_state_incremental(self):
+        """Test that feeding symbols in pieces gives the same checksum."""
+        rnd = random.Random(1)
+        for length in range(1, 60):
+            values = [rnd.randrange(32) for _ in range(length)]
+            split = rnd.randrange(length)
+            state = segwit_addr.PolymodState().update(values[:split])
+            fork = state.copy()
+            state.update(values[split:])
+            self.assertEqual(state.chk, segwit_addr.bech32_polymod(values))
+            self.assertEqual(fork.chk, segwit_addr.bech32_polymod(values[:split]))
+            for spec in segwit_addr.Encoding:
+                const = segwit_addr.BECH32M_CONST if spec == segwit_addr.Encoding.BECH32M else 1
+                polymod = segwit_addr.bech32_polymod(values + [0] * 6) ^ const
+                expected = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+                self.assertEqual(state.finalize(const), expected)
+
+class TestConvertbitsFastPath(unittest.TestCase):
+    """Unit test class for the bytes based 8 <-> 5 bit conversions."""
+
+    def test_bytes_to_5bit(self):
+        """Test that bytes_to_5bit matches convertbits with padding."""
+        rnd = random.Random(4)
+        for length in range(65):
+            data = bytes(rnd.randrange(256) for _ in range(length))
+            self.assertEqual(list(segwit_addr.bytes_to_5bit(data)),
+                             segwit_addr.convertbits(data, 8, 5))
+
+    def test_fivebit_to_bytes(self):
+        """Test that fivebit_to_bytes matches convertbits without padding."""
+        rnd = random.Random(5)
+        for length in range(105):
+            for _ in range(20):
+                data = [rnd.randrange(32) for _ in range(length)]
+                if length and rnd.random() < 0.5:
+                    data[-1] &= 0x18
+                expected = segwit_addr.convertbits(data, 5, 8, False)
+                actual = segwit_addr.fivebit_to_bytes(data)
+                self.assertEqual(None if actual is None else list(actual), expected)
+        self.assertIsNone(segwit_addr.fivebit_to_bytes([32, 0]))
+
+class TestHrpCodecs(unittest.TestCase):
+    """Unit test class for the HRP-specialized encoders and decoders."""
+
+    def test_make_decoder(self):
+        """Test that make_decoder agrees with decode."""
+        addresses = [address for address, _ in VALID_ADDRESS] + INVALID_ADDRESS
+        addresses += VALID_BECH32 + VALID_BECH32M + INVALID_BECH32 + INVALID_BECH32M
+        for hrp in ["bc", "tb", "bcrt", "sb", "a", "?"]:
+            decode_hrp = segwit_addr.make_decoder(hrp)
+            for address in addresses:
+                self.assertEqual(decode_hrp(address), segwit_addr.decode(hrp, address))
+
+    def test_make_encoder(self):
+        """Test that make_encoder agrees with encode."""
+        rnd = random.Random(3)
+        for hrp in ["bc", "tb", "bcrt", "sb", "BC"]:
+            encode_hrp = segwit_addr.make_encoder(hrp)
+            for witver in [0, 1, 16, 17]:
+                for length in [1, 2, 20, 32, 40, 41]:
+                    witprog = [rnd.randrange(256) for _ in range(length)]
+                    self.assertEqual(encode_hrp(witver, witprog),
+                                     segwit_addr.encode(hrp, witver, witprog))
+
+    def test_encode_many(self):
+        """Test that encode_many agrees with encode."""
+        rnd = random.Random(20)
+        for hrp in ["bc", "tb", "bcrt", "a", "x" * 50, "a1", "?", "BC", "", " b"]:
+            for witver in [0, 1, 2, 16, 17, -1]:
+                witprogs = [[rnd.randrange(256) for _ in range(length)]
+                            for length in [0, 1, 2, 20, 20, 32, 32, 33, 40, 41]]
+                witprogs += [rnd.randbytes(32) for _ in range(20)]
+                self.assertEqual(list(segwit_addr.encode_many(hrp, witver, witprogs)),
+                                 [segwit_addr.encode(hrp, witver, witprog) for witprog in witprogs])
+
+class TestDecodeSegwitAddress(unittest.TestCase):
+    """Unit test class for the single pass decoder with Bech32m.DecodeError codes."""
+
+    def test_error_codes(self):
+        """Test error codes of invalid vectors, as expected in test/Bech32m.t.sol."""
+        DecodeError = segwit_addr.DecodeError
+        for bech, err in [(' 1nwldj5', DecodeError.CharacterOutOfRange),
+                          ('\x801eym55h', DecodeError.CharacterOutOfRange),
+                          (INVALID_BECH32[3], DecodeError.InputIsTooLong),
+                          ('pzry9x0s0muk', DecodeError.NoDelimiter),
+                          ('1pzry9x0s0muk', DecodeError.HRPIsEmpty),
+                          ('x1b4n0q5v', DecodeError.NotBech32Character),
+                          ('li1dgmt3', DecodeError.TooShortChecksum),
+                          ('A1G7SGD8', DecodeError.IncorrectChecksum)]:
+            self.assertEqual(segwit_addr.bech32_decode_with_error(bech), (None, None, None, err))
+        for address, err in [(INVALID_ADDRESS[0], DecodeError.HRPMismatch),
+                             (INVALID_ADDRESS[1], DecodeError.IncorrectEncodingForSegwitVn),
+                             (INVALID_ADDRESS[4], DecodeError.IncorrectEncodingForSegwitV0),
+                             (INVALID_ADDRESS[7], DecodeError.SegwitVersionTooLarge),
+                             (INVALID_ADDRESS[8], DecodeError.WitnessProgramTooSmall),
+                             (INVALID_ADDRESS[9], DecodeError.WitnessProgramTooLarge),
+                             (INVALID_ADDRESS[10], DecodeError.IncorrectSegwitV0Program),
+                             (INVALID_ADDRESS[11], DecodeError.MixedCase),
+                             (INVALID_ADDRESS[12], DecodeError.IncorrectLength),
+                             (INVALID_ADDRESS[14], DecodeError.EmptyData)]:
+            self.assertEqual(segwit_addr.decode_segwit_address("bc", address), (None, None, err))
+        self.assertEqual(segwit_addr.decode_segwit_address("tb", INVALID_ADDRESS[13]),
+                         (None, None, DecodeError.IncorrectPadding))
+
+    def test_separator_position(self):
+        """Test that a '1' at index 2 is the separator, like in Bech32m.bech32Decode."""
+        address = segwit_addr.bech32_encode("ab1", [1, 2, 3], segwit_addr.Encoding.BECH32M)
+        self.assertEqual(segwit_addr.bech32_decode(address)[0], "ab1")
+        self.assertEqual(segwit_addr.bech32_decode_with_error(address)[3],
+                         segwit_addr.DecodeError.NotBech32Character)
+
+    def test_agrees_with_decode(self):
+        """Test that valid addresses and random mutations decode the same as with decode."""
+        rnd = random.Random(19)
+        addresses = [address for address, _ in VALID_ADDRESS] + INVALID_ADDRESS
+        for _ in range(2000):
+            chars = list(rnd.choice(addresses))
+            for _ in range(rnd.randrange(3)):
+                chars[rnd.randrange(len(chars))] = rnd.choice(segwit_addr.CHARSET + "1BI ")
+            addresses.append("".join(chars))
+        for hrp in ["bc", "tb"]:
+            for address in addresses:
+                witver, witprog, err = segwit_addr.decode_segwit_address(hrp, address)
+                self.assertEqual((witver, witprog), segwit_addr.decode(hrp, address))
+                self.assertEqual(err == segwit_addr.DecodeError.NoError, witver is not None)
+
+class TestSuggestCorrections(unittest.TestCase):
+    """Unit test class for locating and correcting substituted characters."""
+
+    def test_valid_has_no_errors(self):
+        """Test that valid strings have no errors to locate."""
+        for spec, tests in [(segwit_addr.Encoding.BECH32, VALID_BECH32),
+                            (segwit_addr.Encoding.BECH32M, VALID_BECH32M)]:
+            for test in tests:
+                hrp, data, _ = segwit_addr.bech32_decode(test)
+                checksum = segwit_addr.bech32_create_checksum(hrp, data, spec)
+                self.assertEqual(segwit_addr.bech32_locate_errors(hrp, data + checksum, spec), [])
+
+    def test_corrects_substitutions(self):
+        """Test that one or two substituted data characters are corrected."""
+        rnd = random.Random(21)
+        for _ in range(300):
+            hrp = rnd.choice(["bc", "tb", "bcrt"])
+            witver = rnd.choice([0, 1, 16])
+            length = rnd.choice([20, 32]) if witver == 0 else rnd.randrange(2, 41)
+            address = segwit_addr.encode(hrp, witver, [rnd.randrange(256) for _ in range(length)])
+            chars = list(address)
+            positions = sorted(rnd.sample(range(len(hrp) + 1, len(address)), rnd.randrange(1, 3)))
+            for pos in positions:
+                chars[pos] = rnd.choice([x for x in segwit_addr.CHARSET + "bio" if x != address[pos]])
+            suggestions = segwit_addr.suggest_corrections(hrp, "".join(chars).upper())
+            self.assertEqual(suggestions[0], (address, positions))
+            for suggestion, changed in suggestions:
+                self.assertNotEqual(segwit_addr.decode(hrp, suggestion), (None, None))
+                self.assertLessEqual(len(changed), segwit_addr.MAX_CORRECTABLE)
+
+    def test_no_suggestions(self):
+        """Test that wrong HRPs and too many invalid characters give no suggestions."""
+        address = VALID_ADDRESS[1][0]
+        self.assertEqual(segwit_addr.suggest_corrections("bc", address), [])
+        self.assertEqual(segwit_addr.suggest_corrections("tb", "tb1bbb" + address[6:]), [])
+        self.assertEqual(segwit_addr.suggest_corrections("tb", address), [(address, [])])
+
+
+class TestProfiling(unittest.TestCase):
+    """Unit test class for the opt-in segwit_addr stage counters."""
+
+    def setUp(self):
+        segwit_addr.reset_profile()
+
+    def test_disabled_restores_functions(self):
+        """Test that the original functions are bound again and nothing is counted when off."""
+        originals = {name: getattr(segwit_addr, name) for name in segwit_addr.PROFILED_FUNCTIONS}
+        with segwit_addr.profiling():
+            with segwit_addr.profiling():
+                self.assertIsNot(segwit_addr.decode, originals["decode"])
+            self.assertTrue(segwit_addr.profiling_enabled())
+        self.assertFalse(segwit_addr.profiling_enabled())
+        for name, func in originals.items():
+            self.assertIs(getattr(segwit_addr, name), func)
+        segwit_addr.decode("bc", VALID_ADDRESS[0][0].lower())
+        self.assertTrue(all(counters["calls"] == 0 for counters in segwit_addr.profile_snapshot().values()))
+
+    def test_stage_counters(self):
+        """Test calls and input lengths per stage for one encode and decode."""
+        program = bytes(range(32))
+        with segwit_addr.profiling():
+            address = segwit_addr.encode("tb", 1, program)
+            self.assertEqual(segwit_addr.decode("tb", address), (1, list(program)))
+            self.assertEqual(segwit_addr.decode("bc", address), (None, None))
+        snapshot = segwit_addr.profile_snapshot()
+        self.assertEqual({stage: counters["calls"] for stage, counters in snapshot.items()},
+                         {"bech32_decode": 3, "bech32_verify_checksum": 3, "convertbits": 3, "decode": 3,
+                          "encode": 1, "encode_roundtrip": 1})
+        self.assertEqual(snapshot["bech32_decode"]["bytes"], 3 * len(address))
+        self.assertEqual(snapshot["encode"]["bytes"], 32)
+        self.assertEqual(snapshot["encode_roundtrip"]["bytes"], len(address))
+        self.assertTrue(all(counters["ns"] > 0 for counters in snapshot.values()))
+        self.assertGreaterEqual(snapshot["encode_roundtrip"]["ns"], snapshot["bech32_verify_checksum"]["ns"] // 3)
+
+    def test_prometheus(self):
+        """Test that the text export has one sample per stage and metric."""
+        with segwit_addr.profiling():
+            segwit_addr.bech32_decode(VALID_ADDRESS[0][0])
+        lines = segwit_addr.profile_prometheus().splitlines()
+        samples = [line for line in lines if not line.startswith("#")]
+        self.assertEqual(len(samples), 3 * len(segwit_addr.PROFILE_STAGES))
+        self.assertIn('segwit_addr_stage_calls_total{stage="bech32_decode"} 1', samples)
+        self.assertIn("# TYPE segwit_addr_stage_seconds_total counter", lines)
+
+class TestValidateAddresses(unittest.TestCase):
+    """Unit test class for the address validation CLI helpers."""
+
+    def test_validate_lines(self):
+        """Test per-line results and failure reasons."""
+        lines = [address for address, _ in VALID_ADDRESS] + INVALID_ADDRESS
+        data = "\n".join(lines).encode() + b"\n\r\n"
+        out, nlines, nvalid = validate_addresses.validate_lines(data, {"bc", "tb"})
+        rows = [row.split("\t") for row in out.decode().splitlines()]
+        self.assertEqual(nlines, len(lines) + 1)
+        self.assertEqual(rows.pop(), ["", "", "", "", validate_addresses.REASON_EMPTY])
+        self.assertEqual(nvalid, len(VALID_ADDRESS))
+        for address, (got, hrp, witver, program, reason) in zip(lines, rows):
+            self.assertEqual(got, address)
+            expected_witver, expected_witprog = segwit_addr.decode(hrp, address)
+            if expected_witver is None or hrp not in ("bc", "tb"):
+                self.assertEqual((witver, program), ("", ""))
+                self.assertNotEqual(reason, "")
+            else:
+                self.assertEqual(int(witver), expected_witver)
+                self.assertEqual(bytes.fromhex(program), bytes(expected_witprog))
+                self.assertEqual(reason, "")
+
+    def test_file_ranges(self):
+        """Test that file chunks are line aligned and cover the file."""
+        with tempfile.NamedTemporaryFile("wb", delete=False) as f:
+            f.write(b"".join(b"line%d\n" % i for i in range(1000)) + b"tail")
+        try:
+            ranges = list(validate_addresses.file_ranges(f.name, chunk_size=100))
+            with open(f.name, "rb") as f2:
+                data = f2.read()
+            self.assertEqual(b"".join(data[a:b] for a, b in ranges), data)
+            for _, stop in ranges[:-1]:
+                self.assertEqual(data[stop - 1:stop], b"\n")
+        finally:
+            os.unlink(f.name)
+
+    def test_run(self):
+        """Test that the process pool writes chunk outputs in file order."""
+        lines = [address for address, _ in VALID_ADDRESS] + INVALID_ADDRESS
+        data = ("\n".join(lines * 20) + "\n").encode()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "addresses.txt")
+            with open(path, "wb") as f:
+                f.write(data)
+            with open(os.path.join(tmp, "out.tsv"), "w+b") as out:
+                totals = validate_addresses.run(validate_addresses.validate_lines, ({"bc", "tb"},), path, out, 2,
+                                                chunk_size=300)
+                out.seek(0)
+                self.assertEqual(out.read(), validate_addresses.validate_lines(data, {"bc", "tb"})[0])
+        self.assertEqual(totals, (20 * len(lines), 20 * len(VALID_ADDRESS)))
+
+# Vectors from test/Deriver.t.sol::testDeriveReceivingAddressFromIndex
+DERIVE_RECEIVING_ADDRESS = [
+    (92827281731274008954803586629051298518909571261423619289955380343486580347456,
+     73102114537722655223140831762751126960901222634499698479313524413007101409342,
+     2, "bcrt1pnxsxys8vd0zyznm8hrzukyh9dkvhvalxg9fk6mgd4e4awur2v7uqgrq4sc"),
+    (42043242194725732014842968116051319138334003633183842263306037194578700909017,
+     105821727192811762117189587761380553359906792616517208870399232874956654784394,
+     33, "bcrt1pqmenx5decj6z7w0flwdlapuyqran78w0jq44sk7wkf7s37x3pp7s0yv6qp"),
+    (64704383364590153413480446292465727728387599614170842002472827633593419784476,
+     100573695907478917642263950404364417572064838031945548826282911915821399827971,
+     514, "bcrt1pgpqxw0dagcsxlyae2hj34a0538jnmtvarpwtqm5txwnusnmygpqqucvsvt"),
+    (52672097719492178455192603747575185348778895943012542362274508865272077582372,
+     22715561287017813787869506730496377822788860365548411913263474592148236937818,
+     8195, "bcrt1p97yvrl0dc67l3l42q3894k5x8nx7vt0z7jcjfwxzp066vqm5uk5ssszat7"),
+    (7762222604264485911983061564766040050645982976758130076669678366079793347684,
+     77842275810050337275361784865384886754506198694389874207460975687961431123894,
+     131076, "bcrt1ph246t99e89ruellljuqnekwuf2p523lsmugw2kqu4u4uk32dmsasz086s8"),
+]
+
+# Vectors from test/BTCDepositAddressDeriver.t.sol, getBTCDepositAddress(0)
+BTC_DEPOSIT_ADDRESS_0 = [
+    ("bc1pw7mg62ewhyap63q33n8zhaq2suxp8veukt7rfl63a4r5uarlxeaqdvrymq",
+     "bc1pumqte9t3vr0rsafpr95qscvk4cvtwrjfrqsvwaa8l3r6fz378hwsm4zc89"),
+    ("tb1pw7mg62ewhyap63q33n8zhaq2suxp8veukt7rfl63a4r5uarlxeaq6y4tp0",
+     "tb1pumqte9t3vr0rsafpr95qscvk4cvtwrjfrqsvwaa8l3r6fz378hwsva5ha2"),
+    ("bcrt1pw7mg62ewhyap63q33n8zhaq2suxp8veukt7rfl63a4r5uarlxeaqhald54",
+     "bcrt1pumqte9t3vr0rsafpr95qscvk4cvtwrjfrqsvwaa8l3r6fz378hwspy73gs"),
+    ("sb1pw7mg62ewhyap63q33n8zhaq2suxp8veukt7rfl63a4r5uarlxeaqa4lvc2",
+     "sb1pumqte9t3vr0rsafpr95qscvk4cvtwrjfrqsvwaa8l3r6fz378hwstv7sy0"),
+    ("bc1pqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqs5pgpxg",
+     "bc1pf720tezjlcxv5w0s7cvyhn97y6hr6gy7u78jtq5htcn2ja9vl28qfdqgf2"),
+    ("sb1pqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqsyc5f9z",
+     "sb1pf720tezjlcxv5w0s7cvyhn97y6hr6gy7u78jtq5htcn2ja9vl28qe5uq2q"),
+]
+
+# test/Deriver.t.sol::testCoefficientDerivation_2: (x, y, eth address, coefficient)
+GET_COEFFICIENT = [
+    (1, 29896722852569046015560700294576055776214335159245303116488692907525646231534,
+     "0x95222290DD7278Aa3Ddd389Cc1E1d165CC4BAfe5",
+     0x8e42e5c13f5cbeb86d71b7da134e17815a8d2679b58ac62bf77c0bcda88af048),
+    (100000001, 6187697718246333927483135664988668927828752610007079514140924362238612640234,
+     "0x4675C7e5BaAFBFFbca748158bEcBA61ef3b0a263",
+     0xe57b99b605b15585b06b5111e5bf25f625fa0883a5a5dbe39630e09fa0333fc7),
+    (10000000000000001, 19058164647355796972794349987072136692774271288946368805784800428345550206840,
+     "0x9c595f9518b11b2876B2A5E89996B1Fd2c748726",
+     0x836fc7d9c5288be60128dda0a3f5b6b48d5aac1eff1b248b259fd19caaa78192),
+    (49638490350653890404049973095656032488753139080487109443386992570973932368088,
+     55561757371571341431703784879667865348336433843616233757864721735452092825326,
+     "0x36A35fB10d9d273da615f4b658829901326e0d00",
+     0x5d36326d019bc25f9f3119b630890fc745d72fdff1928f858194ce87b2be57a1),
+]
+
+# test/Deriver.t.sol::testGetBtcAddressTaprootNoScriptFromEth: (p1x, p1y, p2x, p2y, eth address, bcrt address)
+BTC_ADDRESS_FROM_ETH = [
+    (54147769457631533710022564500742536038246727812137618871549590227497793828474,
+     96091192197178033512370658560500964796461556892477693557977072200584849793968,
+     67261561909726473286993603243929025817028541803191223835743288887468871643510,
+     49473559344142397756767891385407723329456329883991697784595543981689192800614,
+     "0x388C818CA8B9251b393131C08a736A67ccB19297",
+     "bcrt1paz50paqaeph7xecyt8hzc9ly3sfyuaw0nmaaahat8mn37hrlhcjq5cm0kq"),
+    (1, 29896722852569046015560700294576055776214335159245303116488692907525646231534,
+     109425434543890623006875089384956782646038918384464063743018502921509251658712,
+     105040070358470594764068890032032104493554430042352852644935734267919855545570,
+     "0x5e17BFfaD9f5D57Bcc17071aec4249C9176A728d",
+     "bcrt1pc5ydppgpkeg5nrcetqu8g0rjeytsqww3j6xq50tlulqvwnfhhxcslync0s"),
+    (1004, 50566750680002108827280051043316308483979214535572331408301622620618248094164,
+     59175011958650668134192622663723128104568439824145117716282659597024212199440,
+     80820378799967249230036383627285913857484256274800501889702018267851848282858,
+     "0x5e17BFfaD9f5D57Bcc17071aec4249C9176A728d",
+     "bcrt1pu8e52ej8y50hdmnpzmusnxp8dxxa4nkp80l6n9k6vt2jm9matxaqtseyv9"),
+    (12, 31068864722486242021761838950999795945745157936084027215252040495978276421796,
+     1, 29896722852569046015560700294576055776214335159245303116488692907525646231534,
+     "0x5e17BFfaD9f5D57Bcc17071aec4249C9176A728d",
+     "bcrt1pfufcg3vafamdnfgtl95r7fwxln0457n8dlrz0crw99swzkp0ddms7z2lqx"),
+]
+
+
+class TestBase58Check(unittest.TestCase):
+    """Unit test class for the Base58Check mirror of Base58.sol and BitcoinUtils."""
+
+    # (network, address, valid) from test/BitcoinUtils_*.t.sol
+    ADDRESSES = [
+        (0, "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH", True),
+        (0, "15hPYnf4qXCbDBi96DsUPdZ34RyZ5Lou1a", True),
+        (0, "7SeEnXWPaCCALbVrTnszCVGfRU8cGfx", False),
+        (1, "2NByiBUaEXrhmqAsg7BbLpcQSAQs1EDwt5w", True),
+        (1, "mrCDrCybB6J1vRfbwM5hemdJz73FwDBC8r", True),
+        (2, "j9ywUkWg2fTQrouxxh5rSZhRvrjMkEUfuiKe", False),
+        (3, "ScuV2eqXfQCPcpxqqVSFtMVwkfqcwnQKB1", True),
+        (3, "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4", False),
+    ]
+
+    def test_encode_decode(self):
+        """Test known vectors and round trips with leading zeros."""
+        self.assertEqual(base58check.encode(b"Hello World!"), "2NEpo7TZRRrLZSi2U")
+        self.assertEqual(base58check.decode("115Q"), bytes.fromhex("0000ff"))
+        rnd = random.Random(58)
+        for _ in range(200):
+            data = bytes(rnd.randrange(3)) + rnd.randbytes(rnd.randrange(40))
+            self.assertEqual(base58check.decode(base58check.encode(data)), data)
+        self.assertRaises(ValueError, base58check.decode, "1BgGZ9tcN4rm0KBzDn7")
+        version, payload = base58check.decode_check("1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH")
+        self.assertEqual(base58check.encode_check(version, payload), "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH")
+        self.assertRaises(ValueError, base58check.decode_check, "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMh")
+
+    def test_validate(self):
+        """Test validation against the Solidity vectors and the strict version check."""
+        for network, address, valid in self.ADDRESSES:
+            _, _, reason = base58check.validate_address(network, address)
+            self.assertEqual(reason == "", valid, address)
+        self.assertEqual(base58check.validate_address(0, "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMh")[2],
+                         base58check.REASON_CHECKSUM)
+        address = base58check.encode_check(0x00, bytes(range(20)))
+        self.assertEqual(base58check.validate_address(0, address), (0, bytes(range(20)), ""))
+        addresses = [address, "15hPYnf4qXCbDBi96DsUPdZ34RyZ5Lou1a", address]
+        results = base58check.validate_many(0, addresses, strict=True)
+        self.assertEqual([reason for _, _, reason in results], ["", "", ""])
+        self.assertIs(results[0], results[2])
+        # The contract only checks the leading character 'S'
+        simnet = base58check.encode_check(base58check.P2PKH_VERSIONS[3] + 1, bytes(20))
+        self.assertEqual(base58check.validate_address(3, simnet)[2], "")
+        self.assertEqual(base58check.validate_address(3, simnet, strict=True)[2], base58check.REASON_VERSION)
+
+
+class TestHmacSha512(unittest.TestCase):
+    """Unit test class for the keyed HMAC-SHA512 context."""
+
+    def test_matches_hmac(self):
+        """Test that contexts with and without a prefix agree with hmac for all key sizes."""
+        import hashlib
+        import hmac
+        rnd = random.Random(512)
+        for key_length in [1, 32, 127, 128, 129, 300]:
+            key = rnd.randbytes(key_length)
+            context = hmac_sha512.HmacSha512(key)
+            prefix = rnd.randbytes(33)
+            prefixed = context.with_prefix(prefix)
+            messages = [rnd.randbytes(n) for n in [1, 4, 111, 112, 200]]
+            for message, digest in zip(messages, context.digests(messages)):
+                self.assertEqual(digest, hmac.new(key, message, hashlib.sha512).digest())
+                self.assertEqual(prefixed.digest(message), hmac.new(key, prefix + message, hashlib.sha512).digest())
+            self.assertEqual(prefixed.digest(b""), hmac.new(key, prefix, hashlib.sha512).digest())
+            self.assertRaises(ValueError, context.digest, b"")
+        self.assertRaises(ValueError, hmac_sha512.HmacSha512, b"")
+
+
+class TestDeriver(unittest.TestCase):
+    """Unit test class for the off-chain Deriver.sol mirror."""
+
+    def test_derive_receiving_address_from_index(self):
+        """Test against the Solidity test vectors."""
+        for px, py, index, expected in DERIVE_RECEIVING_ADDRESS:
+            address = deriver.derive_receiving_address_from_index(px, py, index, "bcrt")
+            self.assertEqual(address, expected)
+
+    def test_derive_child_pubkey_bip32(self):
+        """Test against test/Deriver.t.sol::testDeriveChildPubkeyBip32."""
+        child = deriver.derive_child_pubkey_bip32(
+            57074945586406715334625111669072956770253198967468104181021882430082100612963,
+            23142750304142828437953232435448444948300648252183245674679985556457305450420,
+            bytes.fromhex("93071d00a68b251e2556974c5a9cba5fd3ceebfdf3d6b083978cb3f3072bdc6b"),
+            2)
+        self.assertEqual(child, (
+            74070375407870803772383716147851670902687590661570579425410879994591649090379,
+            22360565704915606957816728902241275983499976804656018213898267138481100992100))
+        with self.assertRaises(ValueError):
+            deriver.derive_child_pubkey_bip32(1, 2, b"\0" * 32, deriver.HARDENED_KEY_START)
+
+    def test_derive_receiving_programs(self):
+        """Test that the batched path matches the single index path."""
+        px, py, _, _ = DERIVE_RECEIVING_ADDRESS[0]
+        indexes = [0, 1, 2, 77, 1000]
+        expected = [deriver.derive_receiving_program(px, py, i) for i in indexes]
+        self.assertEqual(deriver.derive_receiving_programs(px, py, indexes), expected)
+
+    def test_derive_range(self):
+        """Test derive_range against getBTCDepositAddress and the single index path."""
+        for seed, expected in BTC_DEPOSIT_ADDRESS_0:
+            self.assertEqual(list(deriver.derive_range(seed, 0, 1)), [expected])
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        px, py = deriver.parse_btc_taproot_address("tb", seed)
+        expected = [deriver.derive_receiving_address_from_index(px, py, i, "tb") for i in range(5, 9)]
+        self.assertEqual(list(deriver.derive_range(seed, 5, 9)), expected)
+
+    def test_get_coefficient(self):
+        """Test against test/Deriver.t.sol::testCoefficientDerivation_2."""
+        for x, y, eth_addr, expected in GET_COEFFICIENT:
+            self.assertEqual(deriver.get_coefficient(x, y, deriver.parse_eth_address(eth_addr)), expected)
+
+    def test_get_btc_address_taproot_no_script_from_eth(self):
+        """Test against the Solidity test vectors and the batched path."""
+        eth_addrs = [deriver.parse_eth_address(eth_addr) for *_, eth_addr, _ in BTC_ADDRESS_FROM_ETH]
+        for (p1x, p1y, p2x, p2y, _, expected), eth_addr in zip(BTC_ADDRESS_FROM_ETH, eth_addrs):
+            address = deriver.get_btc_address_taproot_no_script_from_eth(p1x, p1y, p2x, p2y, "bcrt", eth_addr)
+            self.assertEqual(address, expected)
+            program = deriver.eth_programs(p1x, p1y, p2x, p2y, [eth_addr])[0]
+            self.assertEqual(segwit_addr.encode("bcrt", 1, program), expected)
+        p1x, p1y, p2x, p2y, _, _ = BTC_ADDRESS_FROM_ETH[0]
+        rnd = random.Random(10)
+        eth_addrs = [bytes(rnd.randrange(256) for _ in range(20)) for _ in range(8)]
+        expected = [deriver.get_btc_address_taproot_no_script_from_eth(p1x, p1y, p2x, p2y, "bcrt", e)
+                    for e in eth_addrs]
+        programs = deriver.eth_programs(p1x, p1y, p2x, p2y, eth_addrs)
+        self.assertEqual([segwit_addr.encode("bcrt", 1, p) for p in programs], expected)
+
+    def test_eth_deposit_addresses(self):
+        """Test the streaming tool keeps line order and reports invalid lines."""
+        p1x, p1y, p2x, p2y, eth_addr, expected = BTC_ADDRESS_FROM_ETH[0]
+        data = f"{eth_addr}\nnot an address\n\n{eth_addr.lower()}\r\n".encode()
+        out, nlines, nvalid = eth_deposit_addresses.derive_lines(data, (p1x, p1y), (p2x, p2y), "bcrt")
+        self.assertEqual((nlines, nvalid), (4, 2))
+        self.assertEqual(out.decode().splitlines(), [
+            f"{eth_addr}\t{expected}\t",
+            f"not an address\t\t{eth_deposit_addresses.REASON_ETH}",
+            f"\t\t{validate_addresses.REASON_EMPTY}",
+            f"{eth_addr.lower()}\t{expected}\t",
+        ])
+
+
+class TestSecp256k1(unittest.TestCase):
+    """Unit test class for the off-chain secp256k1 arithmetic."""
+
+    def test_g_mul(self):
+        """Test that fixed-base multiplication matches double-and-add."""
+        rnd = random.Random(6)
+        scalars = [0, 1, 2, 255, 256, secp256k1.NN - 1, secp256k1.NN, 2**256 - 1]
+        scalars += [rnd.randrange(2**256) for _ in range(20)]
+        for k in scalars:
+            self.assertEqual(secp256k1.g_mul(k), secp256k1.ec_mul(k, secp256k1.GX, secp256k1.GY))
+
+    def test_jacobian_batch_to_affine(self):
+        """Test Jacobian arithmetic and batch conversion against affine results."""
+        rnd = random.Random(7)
+        jacobian, expected = [], []
+        for _ in range(20):
+            k1, k2 = rnd.randrange(secp256k1.NN), rnd.randrange(secp256k1.NN)
+            p1, p2 = secp256k1.g_mul(k1), secp256k1.g_mul(k2)
+            jacobian.append(secp256k1.jac_add(secp256k1.jac_mul(k1, *secp256k1.G),
+                                              secp256k1.g_mul_jacobian(k2)))
+            expected.append(secp256k1.ec_add(*p1, *p2))
+            jacobian.append(secp256k1.jac_add_affine(secp256k1.to_jacobian(*p1), *p1))
+            expected.append(secp256k1.ec_add(*p1, *p1))
+        p = secp256k1.g_mul(3)
+        jacobian.append(secp256k1.jac_add_affine(secp256k1.to_jacobian(*p), p[0], secp256k1.PP - p[1]))
+        expected.append(secp256k1.INFINITY)
+        self.assertEqual(secp256k1.batch_to_affine(jacobian), expected)
+
+    def test_lift_x_many(self):
+        """Test batched lift_x."""
+        xs = [deriver.parse_btc_taproot_address(seed[:seed.rfind("1")], seed)[0]
+              for seed, _ in BTC_DEPOSIT_ADDRESS_0]
+        self.assertEqual(secp256k1.lift_x_many(xs), [secp256k1.lift_x(x) for x in xs])
+
+    def test_g_table_cache(self):
+        """Test that the on-disk table cache round-trips."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "g.table")
+            self.assertIsNone(secp256k1._load_g_table(path))
+            secp256k1._save_g_table(path, secp256k1.g_table())
+            self.assertEqual(secp256k1._load_g_table(path), secp256k1.g_table())
+
+    def test_jac_mul_joint(self):
+        """Test joint multiplication against two separate multiplications."""
+        rnd = random.Random(11)
+        p1 = secp256k1.g_mul(rnd.randrange(secp256k1.NN))
+        p2 = secp256k1.g_mul(rnd.randrange(secp256k1.NN))
+        neg_p1 = (p1[0], secp256k1.PP - p1[1])
+        cases = [(0, p1, 0, p2), (1, p1, 0, p2), (0, p1, 1, p2), (secp256k1.NN - 1, p1, 1, p2),
+                 (3, p1, 7, p1), (5, p1, 5, neg_p1), (9, p1, 4, secp256k1.INFINITY)]
+        cases += [(rnd.randrange(2**256), p1, rnd.randrange(2**256), p2) for _ in range(20)]
+        for k1, q1, k2, q2 in cases:
+            expected = secp256k1.ec_add(*secp256k1.ec_mul(k1, *q1), *secp256k1.ec_mul(k2, *q2))
+            joint = secp256k1.jac_mul_joint(k1, *q1, k2, *q2)
+            self.assertEqual(secp256k1.batch_to_affine([joint]), [expected])
+
+
+class TestDepositIndex(unittest.TestCase):
+    """Unit test class for the deposit address reverse index."""
+
+    def test_build_lookup_append_compact(self):
+        """Test lookups before and after appending and compacting."""
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        addresses = list(deriver.derive_range(seed, 0, 60))
+        px, py = deriver.parse_btc_taproot_address("tb", seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "deposits.idx")
+            deposit_index.build_index_from_seed(path, seed, 0, 50)
+            programs = deriver.derive_receiving_programs(px, py, range(50, 60))
+            with deposit_index.DepositIndex(path) as index:
+                self.assertEqual(index.hrp, "tb")
+                self.assertEqual([index.lookup(a) for a in addresses[:50]], list(range(50)))
+                self.assertRaises(ValueError, index.append, 50, programs[0])
+            with deposit_index.DepositIndex(path, writable=True) as index:
+                self.assertIsNone(index.lookup(addresses[55]))
+                self.assertIsNone(index.lookup(seed))
+                for i, program in zip(range(50, 60), programs):
+                    index.append(i, program)
+                self.assertEqual(index.lookup(addresses[55]), 55)
+            with deposit_index.DepositIndex(path) as index:
+                self.assertEqual(index.lookup(addresses[55]), 55)
+                self.assertRaises(ValueError, index.compact)
+            with deposit_index.DepositIndex(path, writable=True) as index:
+                self.assertEqual(len(index), 60)
+                index.compact()
+                self.assertEqual([index.lookup(a) for a in addresses], list(range(60)))
+
+    def test_build_with_spilled_runs(self):
+        """Test building an index from more entries than fit in one run."""
+        rnd = random.Random(8)
+        entries = [(i, bytes(rnd.randrange(256) for _ in range(32))) for i in range(300)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "deposits.idx")
+            deposit_index.build_index(path, "bc", entries, run_size=64)
+            with deposit_index.DepositIndex(path) as index:
+                for i, program in entries:
+                    self.assertEqual(index.lookup_program(program), i)
+                self.assertIsNone(index.lookup_program(b"\xff" * 32))
+
+class TestProgramFilter(unittest.TestCase):
+    """Unit test class for the xor filter of deposit programs."""
+
+    def test_members_and_false_positives(self):
+        """Test that every program is found and few others are."""
+        rnd = random.Random(22)
+        programs = [rnd.randbytes(32) for _ in range(5000)]
+        xor_filter = program_filter.ProgramFilter.build(programs + programs[:10])
+        self.assertEqual(len(xor_filter), 5000)
+        self.assertLess(xor_filter.nbytes, 1.3 * 5000)
+        self.assertTrue(all(program in xor_filter for program in programs))
+        others = [rnd.randbytes(32) for _ in range(20000)]
+        self.assertLess(sum(program in xor_filter for program in others), 20000 / 100)
+
+    def test_save_open_and_filter_outputs(self):
+        """Test the mmap file and matching outputs against a DepositIndex."""
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        px, py = deriver.parse_btc_taproot_address("tb", seed)
+        programs = deriver.derive_receiving_programs(px, py, range(40))
+        rnd = random.Random(23)
+        outputs = [(i, rnd.randbytes(32)) for i in range(300)] + list(enumerate(programs[::3]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "deposits.xor")
+            program_filter.build_from_seed(seed, 0, 30).save(path)
+            index_path = os.path.join(tmp, "deposits.idx")
+            deposit_index.build_index_from_seed(index_path, seed, 0, 30)
+            with program_filter.ProgramFilter.open(path) as xor_filter, \
+                    deposit_index.DepositIndex(index_path) as index:
+                self.assertEqual(len(xor_filter), 30)
+                self.assertTrue(all(program in xor_filter for program in programs[:30]))
+                hits = list(xor_filter.filter_outputs(outputs, index, key=lambda output: output[1]))
+                self.assertEqual(hits, list(enumerate(programs[:30:3])))
+                self.assertEqual(list(xor_filter.filter_outputs(programs, set(programs[5:8]))), programs[5:8])
+
+def _compact_size(n):
+    """Bitcoin CompactSize encoding of n."""
+    if n < 0xfd:
+        return bytes([n])
+    return b"\xfd" + n.to_bytes(2, "little")
+
+def _regtest_block_file(rnd, nblocks, ntx):
+    """Synthetic regtest block file and its expected blk_parser hits."""
+    records = []
+    expected = []
+    for _ in range(nblocks):
+        txs = []
+        for itx in range(ntx):
+            segwit = itx % 4 != 0
+            nin = rnd.randrange(1, 4)
+            inputs = b"".join(rnd.randbytes(36) + (b"\x00" if segwit else b"\x6b" + rnd.randbytes(107)) +
+                              b"\xff" * 4 for _ in range(nin))
+            outputs = []
+            hits = []
+            for vout in range(rnd.randrange(1, 300 if itx == 1 else 4)):
+                value = rnd.randrange(1 << 50)
+                kind = rnd.randrange(4)
+                if kind < 2:
+                    witver = kind
+                    witprog = list(rnd.randbytes(32 if witver else rnd.choice([20, 32])))
+                    script = segwit_scriptpubkey(witver, witprog)
+                    hits.append((vout, witver, bytes(witprog), value))
+                elif kind == 2:
+                    script = segwit_scriptpubkey(2, list(rnd.randbytes(32)))
+                else:
+                    script = b"\x76\xa9\x14" + rnd.randbytes(20) + b"\x88\xac"
+                outputs.append(value.to_bytes(8, "little") + _compact_size(len(script)) + script)
+            body = _compact_size(nin) + inputs + _compact_size(len(outputs)) + b"".join(outputs)
+            witness = b"".join(b"\x02\x48" + rnd.randbytes(72) + b"\xfd\x00\x01" + rnd.randbytes(256)
+                               for _ in range(nin)) if segwit else b""
+            version = (2).to_bytes(4, "little")
+            locktime = rnd.randbytes(4)
+            txs.append(version + (b"\x00\x01" if segwit else b"") + body + witness + locktime)
+            txid = hashlib.sha256(hashlib.sha256(version + body + locktime).digest()).digest()[::-1]
+            expected += [(txid,) + hit for hit in hits]
+        block = rnd.randbytes(80) + _compact_size(len(txs)) + b"".join(txs)
+        records.append(blk_parser.MAGICS["regtest"] + len(block).to_bytes(4, "little") + block)
+    return b"".join(records), expected
+
+class TestBlkParser(unittest.TestCase):
+    """Unit test class for the block file parser."""
+
+    def test_scan_files(self):
+        """Test hits of synthetic block files, padded, truncated and XORed."""
+        rnd = random.Random(23)
+        data0, expected0 = _regtest_block_file(rnd, 3, 20)
+        data1, expected1 = _regtest_block_file(rnd, 2, 10)
+        key = rnd.randbytes(8)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, f"blk0000{i}.dat") for i in range(3)]
+            with open(paths[0], "wb") as f:
+                f.write(data0 + bytes(1000))
+            with open(paths[1], "wb") as f:
+                f.write(blk_parser._deobfuscate(data1 + data0[:500], key))
+            open(paths[2], "wb").close()
+            self.assertEqual(blk_parser.scan_file(paths[0]), (expected0, len(data0), 3))
+            self.assertEqual(blk_parser.scan_file(paths[1], xor_key=key)[0], expected1)
+            self.assertEqual(blk_parser.scan_file(paths[0], witvers=(1,))[0],
+                             [hit for hit in expected0 if hit[2] == 1])
+            stats = {}
+            hits = list(blk_parser.scan_files(paths[:1] + paths[2:], workers=1, stats=stats))
+            self.assertEqual(hits, expected0)
+            self.assertEqual(stats, {"bytes": len(data0), "blocks": 3})
+
+            taproot = [hit[3] for hit in expected0 if hit[2] == 1]
+            filter_path = os.path.join(tmp, "deposits.xor")
+            program_filter.ProgramFilter.build(taproot[::2]).save(filter_path)
+            hits = blk_parser.scan_file(paths[0], filter_path=filter_path)[0]
+            self.assertTrue(set(taproot[::2]) <= {hit[3] for hit in hits})
+            self.assertLess(len(hits), len(taproot))
+
+    def test_deobfuscate(self):
+        """Test XOR in chunks at file offsets against XOR of the whole file."""
+        rnd = random.Random(230)
+        key = rnd.randbytes(8)
+        data = rnd.randbytes(1000)
+        whole = bytes(b ^ key[i % 8] for i, b in enumerate(data))
+        for offset, stop, chunk_size in [(0, 1000, 64), (3, 997, 64), (13, 600, 5), (500, 1000, 1 << 16)]:
+            self.assertEqual(blk_parser._deobfuscate(data[offset:stop], key, offset, chunk_size), whole[offset:stop])
+
+    def test_with_addresses(self):
+        """Test that hits are turned into addresses."""
+        hit = (bytes(32), 0, 1, bytes.fromhex(VALID_ADDRESS[7][1])[2:], 1000)
+        self.assertEqual(list(blk_parser.with_addresses([hit], "bc")), [hit + (VALID_ADDRESS[7][0],)])
+
+class TestPregenerate(unittest.TestCase):
+    """Unit test class for the sharded bulk pregeneration."""
+
+    def test_shards_and_resume(self):
+        """Test shard contents and resuming a shard from its checkpoint."""
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        addresses = list(deriver.derive_range(seed, 0, 50))
+        with tempfile.TemporaryDirectory() as tmp:
+            finished = []
+            rows, _ = pregenerate.pregenerate(seed, tmp, 0, 50, shard_size=20, workers=1,
+                                              progress=lambda *args: finished.append(args[:3]))
+            self.assertEqual(rows, 50)
+            self.assertEqual(finished, [(0, 20, 20), (20, 40, 20), (40, 50, 10)])
+            paths = [os.path.join(tmp, pregenerate.shard_name(lo, hi)) for lo, hi, _ in finished]
+            rows = [row for path in paths for row in pregenerate.read_shard(path)]
+            self.assertEqual([index for index, _, _ in rows], list(range(50)))
+            self.assertEqual([address for _, _, address in rows], addresses)
+            self.assertEqual([segwit_addr.encode("tb", 1, program) for _, program, _ in rows], addresses)
+
+            # Interrupted after 10 rows, with garbage after the checkpoint.
+            with open(paths[1], "r+b") as f:
+                f.seek(pregenerate.ROWS_DONE_OFFSET)
+                f.write((10).to_bytes(8, "big"))
+                f.seek(pregenerate.HEADER.size + 20 * 4 + 15 * 32)
+                f.write(b"\xff" * 32)
+            os.rename(paths[1], paths[1] + ".partial")
+            rows, _ = pregenerate.pregenerate(seed, tmp, 0, 50, shard_size=20, workers=1)
+            self.assertEqual(rows, 10)
+            self.assertEqual([address for _, _, address in pregenerate.read_shard(paths[1])], addresses[20:40])
+
+            os.rename(paths[2], paths[2] + ".partial")
+            with self.assertRaises(ValueError):
+                pregenerate.generate_shard(BTC_DEPOSIT_ADDRESS_0[0][0], tmp, 40, 50)
+            os.rename(paths[2] + ".partial", paths[2])
+
+            # Resuming into the directory with another seed or HRP.
+            for other in (BTC_DEPOSIT_ADDRESS_0[0][0], BTC_DEPOSIT_ADDRESS_0[4][0]):
+                with self.assertRaises(ValueError):
+                    pregenerate.pregenerate(other, tmp, 0, 50, shard_size=20, workers=1)
+            self.assertEqual(pregenerate.pregenerate(seed, tmp, 0, 50, shard_size=20, workers=1)[0], 0)
+
+class TestDerivationServer(unittest.TestCase):
+    """Unit test class for the local derivation service."""
+
+    def test_coalescing_and_cache(self):
+        """Test that concurrent requests share one derivation and results are cached."""
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        service = derivation_server.DerivationService(cache_size=2)
+
+        async def run():
+            first = await asyncio.gather(*[service.derive(seed, 0) for _ in range(5)])
+            again = await service.derive(seed, 0, "tb")
+            others = [await service.derive(seed, i) for i in (1, 2)]
+            return first, again, others
+
+        first, again, others = asyncio.run(run())
+        self.assertEqual(first, [BTC_DEPOSIT_ADDRESS_0[1][1]] * 5)
+        self.assertEqual(again, first[0])
+        px, py = deriver.parse_btc_taproot_address("tb", seed)
+        self.assertEqual(others, [deriver.derive_receiving_address_from_index(px, py, i, "tb") for i in (1, 2)])
+        stats = service.stats()
+        self.assertEqual((stats["misses"], stats["coalesced"], stats["hits"]), (3, 4, 1))
+        self.assertEqual(stats["cache_size"], 2)
+        self.assertEqual(stats["derive_latency_seconds"]["count"], 3)
+
+    def test_cancelled_first_request(self):
+        """Test that a coalesced request finishes when the request deriving it is cancelled."""
+        seed = BTC_DEPOSIT_ADDRESS_0[1][0]
+        service = derivation_server.DerivationService()
+
+        async def run():
+            first = asyncio.ensure_future(service.derive(seed, 0))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(service.derive(seed, 0))
+            await asyncio.sleep(0)
+            first.cancel()
+            address = await asyncio.wait_for(second, 30)
+            return first.cancelled(), address
+
+        cancelled, address = asyncio.run(run())
+        self.assertTrue(cancelled)
+        self.assertEqual(address, BTC_DEPOSIT_ADDRESS_0[1][1])
+        self.assertEqual(service.stats()["coalesced"], 1)
+
+    def test_http(self):
+        """Test the HTTP endpoints on a loopback port."""
+        seed = BTC_DEPOSIT_ADDRESS_0[0][0]
+        service = derivation_server.DerivationService()
+
+        async def request(port, method, path, body=b""):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode() + body)
+            response = await reader.read()
+            writer.close()
+            head, _, payload = response.partition(b"\r\n\r\n")
+            return int(head.split()[1]), json.loads(payload)
+
+        async def run():
+            server = await derivation_server.serve(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return [
+                    await request(port, "POST", "/derive", json.dumps({"seed": seed, "index": 0}).encode()),
+                    await request(port, "POST", "/derive", json.dumps({"seed": seed, "index": -1}).encode()),
+                    await request(port, "POST", "/derive", b"{"),
+                    await request(port, "GET", "/derive"),
+                    await request(port, "GET", "/stats"),
+                ]
+
+        ok, bad_index, bad_json, bad_method, stats = asyncio.run(run())
+        self.assertEqual(ok, (200, {"address": BTC_DEPOSIT_ADDRESS_0[0][1]}))
+        self.assertEqual([bad_index[0], bad_json[0], bad_method[0]], [400, 400, 405])
+        self.assertEqual(stats[0], 200)
+        self.assertEqual(stats[1]["misses"], 1)
+        self.assertEqual(stats[1]["request_latency_seconds"]["count"], 3)
+
+
+class TestGenSolTests(unittest.TestCase):
+    """Unit test class for the Solidity test generator registry."""
+
+    def test_generate_all(self):
+        """Test that files are written once and rewritten only when their output changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            results = gen_sol_tests.generate_all(tmp)
+            self.assertEqual(len(results), len(gen_sol_tests.SOL_TEST_FILES) + len(gen_sol_tests.SOL_SOURCE_FILES))
+            self.assertTrue(all(changed for _, changed in results))
+            with open(os.path.join(tmp, "Bech32mRefData.t.sol")) as f:
+                source = f.read()
+            self.assertIn("contract Bech32mRefDataTest is Test {", source)
+            self.assertIn("function testValidAddressDecodeEncode() public pure {", source)
+            self.assertEqual(source.count("{"), source.count("}"))
+            with open(os.path.join(tmp, "GasBench.t.sol")) as f:
+                source = f.read()
+            self.assertIn("function testGas_decodeSegwitAddress_program_40() public view {", source)
+            self.assertNotIn("None", source)
+            self.assertEqual(source.count("{"), source.count("}"))
+            self.assertFalse(any(changed for _, changed in gen_sol_tests.generate_all(tmp)))
+            with open(os.path.join(tmp, "GasBench.t.sol"), "a") as f:
+                f.write("// edited\n")
+            self.assertEqual([os.path.basename(path) for path, changed in gen_sol_tests.generate_all(tmp) if changed],
+                             ["GasBench.t.sol"])
+            self.assertTrue(all(changed for _, changed in gen_sol_tests.generate_all(tmp, force=True)))
+
+
+class TestDecodeMany(unittest.TestCase):
+    """Unit test class for the vectorized batch decoder."""
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_decode_many_matches_decode(self):
+        """Test that decode_many agrees with decode row by row."""
+        rnd = random.Random(2)
+        addresses = [address for address, _ in VALID_ADDRESS] + INVALID_ADDRESS
+        for _ in range(500):
+            witver = rnd.choice([0, 1, 2, 16])
+            witprog = [rnd.randrange(256) for _ in range(rnd.choice([20, 32, 2, 40]))]
+            address = segwit_addr.encode(rnd.choice(["bc", "tb"]), witver, witprog)
+            if address is None:
+                continue
+            pos = rnd.randrange(len(address))
+            addresses.append(address)
+            addresses.append(address[:pos] + rnd.choice(segwit_addr.CHARSET) + address[pos+1:])
+            addresses.append(address.upper())
+        for hrp in ["bc", "tb", "bcrt"]:
+            valid, witvers, programs, lengths = segwit_addr.decode_many(hrp, addresses)
+            for i, address in enumerate(addresses):
+                witver, witprog = segwit_addr.decode(hrp, address)
+                self.assertEqual(bool(valid[i]), witver is not None, address)
+                if witver is not None:
+                    self.assertEqual(witvers[i], witver)
+                    self.assertEqual(list(programs[i, :lengths[i]]), witprog)
+
+
+class TestGenFuzzCorpus(unittest.TestCase):
+    """Unit test class for the Bech32m differential fuzz corpus."""
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_labels_match_decode(self):
+        """Test that every record is labeled with the result of decode and chunks are reproducible."""
+        data, counts = gen_fuzz_corpus.generate_chunk(1, 0, 4000)
+        self.assertEqual(gen_fuzz_corpus.generate_chunk(1, 0, 4000)[0], data)
+        self.assertNotEqual(gen_fuzz_corpus.generate_chunk(1, 1, 4000)[0], data)
+        self.assertEqual(sum(counts), 4000)
+        records = list(gen_fuzz_corpus.read_chunk(data))
+        self.assertEqual(len(records), 4000)
+        for kind, hrp, address, witver, program in records:
+            decoded = segwit_addr.decode(hrp, address)
+            self.assertEqual(decoded[0], witver, address)
+            if witver is not None:
+                self.assertEqual(bytes(decoded[1]), program)
+        self.assertEqual({record[0] for record in records}, set(range(len(gen_fuzz_corpus.KINDS))))
+        self.assertGreater(counts[2 * gen_fuzz_corpus.KIND_VALID + 1], 0)
+        self.assertGreater(counts[2 * gen_fuzz_corpus.KIND_FLIP], 0)
+        self.assertEqual(counts[2 * gen_fuzz_corpus.KIND_WRONG_CONST + 1], 0)
+
+
+class TestGasReport(unittest.TestCase):
+    """Unit test class for the forge gas output parser."""
+
+    SNAPSHOT = """GasBenchTest:testGas_base58Decode_payload_1() (gas: 20000)
+GasBenchTest:testGas_base58Decode_payload_25() (gas: 92000)
+GasBenchTest:testGas_base58Decode_payload_4() (gas: 29000)
+Bech32Test:testFuzzEncode(uint8) (runs: 256, \u03bc: 5000, ~: 4900)
+"""
+
+    GAS_REPORT = """| test/generated/GasBench.t.sol:GasBenchHarness contract |                 |       |        |        |         |
+|--------------------------------------------------------|-----------------|-------|--------|--------|---------|
+| Deployment Cost                                        | Deployment Size |       |        |        |         |
+| 1027321                                                | 4585            |       |        |        |         |
+| Function Name                                          | min             | avg   | median | max    | # calls |
+| base58Decode                                           | 2317            | 50000 | 30000  | 150000 | 9       |
+"""
+
+    def test_parse_and_compare(self):
+        """Test parsing, the cost curves and regression detection."""
+        snapshot = gas_report.parse_snapshot(self.SNAPSHOT)
+        self.assertEqual(snapshot["Bech32Test:testFuzzEncode"], 4900)
+        self.assertEqual(gas_report.curves(snapshot),
+                         {"base58Decode/payload": [(1, 20000), (4, 29000), (25, 92000)]})
+        self.assertEqual(gas_report.fit_line([(1, 20000), (4, 29000), (25, 92000)]), (17000.0, 3000.0))
+        report = gas_report.parse_gas_report(self.GAS_REPORT)
+        self.assertEqual(report, {"GasBenchHarness.base58Decode": {
+            "min": 2317, "avg": 50000, "median": 30000, "max": 150000, "calls": 9}})
+        baseline = {"snapshot": snapshot, "gas_report": report}
+        self.assertEqual(gas_report.compare(baseline, baseline), [])
+        current = json.loads(json.dumps(baseline))
+        current["snapshot"]["GasBenchTest:testGas_base58Decode_payload_25"] += 920
+        current["gas_report"]["GasBenchHarness.base58Decode"]["max"] -= 1
+        self.assertEqual(len(gas_report.compare(baseline, current)), 1)
+        self.assertEqual(gas_report.compare(baseline, current, threshold=1.0), [])
+        self.assertEqual(gas_report.added_and_removed(baseline, current), ([], []))
+        current["snapshot"]["GasBenchTest:testGas_base58Decode_payload_64"] = 200000
+        del current["gas_report"]["GasBenchHarness.base58Decode"]
+        self.assertEqual(gas_report.added_and_removed(baseline, current),
+                         (["GasBenchTest:testGas_base58Decode_payload_64"], ["GasBenchHarness.base58Decode"]))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
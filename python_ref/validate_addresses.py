@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""Validate segwit addresses from a file or stdin, one per line, on all cores.
+
+Every output line is tab separated:
+    address  hrp  witver  program_hex  failure_reason
+with empty witver/program for invalid addresses and an empty reason for
+valid ones. Output keeps the input order with one line per input line,
+blank lines get the reason "empty line".
+
+Usage:
+    python3 validate_addresses.py addresses.txt -o result.tsv
+    cat addresses.txt | python3 validate_addresses.py --hrp tb
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import segwit_addr
+
+# HRPs from BitcoinNetworkEncoder.getNetworkPrefix
+NETWORK_HRPS = ("bc", "tb", "bcrt", "sb")
+
+CHUNK_SIZE = 4 << 20
+
+REASON_BECH32 = "invalid bech32 string"
+REASON_HRP = "unexpected hrp"
+REASON_PROGRAM = "invalid segwit program"
+REASON_EMPTY = "empty line"
+
+
+def validate_address(address, hrps):
+    """Return (hrp, witver, witprog, reason) for one address."""
+    hrp, data, spec = segwit_addr.bech32_decode(address)
+    if hrp is None:
+        return (None, None, None, REASON_BECH32)
+    if hrp not in hrps:
+        return (hrp, None, None, REASON_HRP)
+    witver, witprog = segwit_addr.decode_segwit_data(data, spec)
+    if witver is None:
+        return (hrp, None, None, REASON_PROGRAM)
+    return (hrp, witver, witprog, "")
+
+
+def validate_lines(data, hrps):
+    """Validate newline separated addresses, return (output, nlines, nvalid)."""
+    out = []
+    nlines = 0
+    nvalid = 0
+    lines = data.split(b"\n")
+    if not lines[-1]:
+        lines.pop()
+    for line in lines:
+        line = line.rstrip(b"\r")
+        nlines += 1
+        if not line:
+            out.append(f"\t\t\t\t{REASON_EMPTY}\n")
+            continue
+        address = line.decode("utf-8", "surrogateescape")
+        hrp, witver, witprog, reason = validate_address(address, hrps)
+        if witver is None:
+            out.append(f"{address}\t{hrp or ''}\t\t\t{reason}\n")
+        else:
+            nvalid += 1
+            out.append(f"{address}\t{hrp}\t{witver}\t{bytes(witprog).hex()}\t\n")
+    return "".join(out).encode("utf-8", "surrogateescape"), nlines, nvalid
+
+
+def _file_range(path, start, stop, func, args):
+    """Worker: func(lines in bytes [start, stop) of a file, *args)."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return func(mm[start:stop], *args)
+
+
+def file_ranges(path, chunk_size=CHUNK_SIZE):
+    """Split a file into line aligned (start, stop) byte ranges."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            stop = mm.find(b"\n", min(start + chunk_size, size) - 1)
+            stop = size if stop < 0 else stop + 1
+            yield (start, stop)
+            start = stop
+
+
+def stream_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Split a binary stream into line aligned chunks."""
+    rest = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = rest + block
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            rest = block
+            continue
+        rest = block[cut:]
+        yield block[:cut]
+    if rest:
+        yield rest
+
+
+def run(func, args, path, out, workers, chunk_size=CHUNK_SIZE):
+    """Apply func(chunk, *args) to line aligned chunks of a file, or stdin for "-", on workers processes.
+
+    func returns (output bytes, nlines, nvalid) for a chunk. Outputs are
+    written in input order with a bounded queue of chunks in flight.
+    Returns the totals (nlines, nvalid).
+    """
+    if path == "-":
+        tasks = ((func, (chunk, *args)) for chunk in stream_chunks(sys.stdin.buffer, chunk_size))
+    else:
+        path = os.path.abspath(path)
+        tasks = ((_file_range, (path, start, stop, func, args)) for start, stop in file_ranges(path, chunk_size))
+    nlines = 0
+    nvalid = 0
+    pending = deque()
+
+    def collect():
+        nonlocal nlines, nvalid
+        data, n, v = pending.popleft().result()
+        out.write(data)
+        nlines += n
+        nvalid += v
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for task, task_args in tasks:
+            pending.append(pool.submit(task, *task_args))
+            if len(pending) >= 2 * workers:
+                collect()
+        while pending:
+            collect()
+    return nlines, nvalid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate segwit addresses, one per line.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, '-' for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--hrp", action="append",
+                        help="accepted HRP, can be repeated (default: bc, tb, bcrt, sb)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes per task")
+    args = parser.parse_args(argv)
+
+    hrps = frozenset(args.hrp or NETWORK_HRPS)
+    started = time.perf_counter()
+    if args.output == "-":
+        nlines, nvalid = run(validate_lines, (hrps,), args.input, sys.stdout.buffer, args.workers, args.chunk_size)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as out:
+            nlines, nvalid = run(validate_lines, (hrps,), args.input, out, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    rate = nlines / elapsed if elapsed > 0 else 0.0
+    print(f"{nlines} lines, {nvalid} valid, {nlines - nvalid} invalid "
+          f"in {elapsed:.2f}s ({rate:.0f} lines/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
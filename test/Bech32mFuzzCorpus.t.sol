@@ -0,0 +1,54 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.27;
+
+import {Test} from "forge-std/Test.sol";
+import {Bech32m} from "../src/Bech32m.sol";
+
+// Differential test against a corpus written by python_ref/gen_fuzz_corpus.py:
+// BECH32M_FUZZ_CORPUS=temp/fuzz/bech32m_corpus_00000.bin forge test --mt testFuzzCorpus
+contract Bech32mFuzzCorpusTest is Test {
+    bytes8 constant MAGIC = "B32FUZZ1";
+
+    function slice(bytes memory data, uint start, uint length) internal pure returns (bytes memory result) {
+        result = new bytes(length);
+        for (uint i = 0; i < length; i += 1) {
+            result[i] = data[start + i];
+        }
+    }
+
+    function testFuzzCorpus() public view {
+        string memory path = vm.envOr("BECH32M_FUZZ_CORPUS", string(""));
+        if (bytes(path).length == 0) {
+            return;
+        }
+        bytes memory data = vm.readFileBinary(path);
+        assertEq(bytes8(slice(data, 0, 8)), MAGIC);
+        uint count = uint32(bytes4(slice(data, 8, 4)));
+        uint pos = 12;
+        for (uint i = 0; i < count; i += 1) {
+            uint8 kind = uint8(data[pos]);
+            uint hrpLength = uint8(data[pos + 1]);
+            bytes memory hrp = slice(data, pos + 2, hrpLength);
+            pos += 2 + hrpLength;
+            uint addrLength = uint8(data[pos]);
+            bytes memory addr = slice(data, pos + 1, addrLength);
+            pos += 1 + addrLength;
+            bool valid = data[pos] != 0;
+            uint8 witver = uint8(data[pos + 1]);
+            bytes memory program = slice(data, pos + 3, uint8(data[pos + 2]));
+            pos += 3 + program.length;
+
+            (uint8 decodedWitver, bytes memory decodedProgram, Bech32m.DecodeError err) =
+                Bech32m.decodeSegwitAddress(hrp, addr);
+            if (valid) {
+                assertEq(uint(err), uint(Bech32m.DecodeError.NoError), string(addr));
+                assertEq(decodedWitver, witver, string(addr));
+                assertEq(decodedProgram, program, string(addr));
+            } else {
+                assertTrue(err != Bech32m.DecodeError.NoError, string(abi.encodePacked(addr, " kind ", vm.toString(kind))));
+            }
+        }
+        assertEq(pos, data.length);
+    }
+}
@@ -0,0 +1,270 @@
+// SPDX-License-Identifier: MIT
+// Generated by python_ref/gen_sol_tests.py, do not edit. sha256: fbdcce96c0d1c19f599c6286c6878811ee9b39edff63cde68f8dfd04df3abf82
+
+pragma solidity 0.8.27;
+
+import {Test} from "forge-std/Test.sol";
+import {encode as encodeBase58, decode as decodeBase58} from "../../src/Base58.sol";
+import {BitcoinNetworkEncoder} from "../../src/BitcoinNetworkEncoder.sol";
+import {BitcoinUtils} from "../../src/BitcoinUtils.sol";
+
+contract Base58RefDataTest is Test {
+    function testBase58EncodeDecode() public pure {
+        // This test was generated automatically by gen_ref_data_base58.py
+
+        {
+            bytes memory data0 = hex"00";
+            bytes memory encoded0 = "1";
+            assertEq(encodeBase58(data0), encoded0);
+            assertEq(decodeBase58(encoded0), data0);
+        }
+
+        {
+            bytes memory data1 = hex"0000ff";
+            bytes memory encoded1 = "115Q";
+            assertEq(encodeBase58(data1), encoded1);
+            assertEq(decodeBase58(encoded1), data1);
+        }
+
+        {
+            bytes memory data2 = hex"61";
+            bytes memory encoded2 = "2g";
+            assertEq(encodeBase58(data2), encoded2);
+            assertEq(decodeBase58(encoded2), data2);
+        }
+
+        {
+            bytes memory data3 = hex"626262";
+            bytes memory encoded3 = "a3gV";
+            assertEq(encodeBase58(data3), encoded3);
+            assertEq(decodeBase58(encoded3), data3);
+        }
+
+        {
+            bytes memory data4 = hex"48656c6c6f20576f726c6421";
+            bytes memory encoded4 = "2NEpo7TZRRrLZSi2U";
+            assertEq(encodeBase58(data4), encoded4);
+            assertEq(decodeBase58(encoded4), data4);
+        }
+
+        {
+            bytes memory data5 = hex"00eb15231dfceb60925886b67d065299925915aeb172c06647";
+            bytes memory encoded5 = "1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L";
+            assertEq(encodeBase58(data5), encoded5);
+            assertEq(decodeBase58(encoded5), data5);
+        }
+
+        {
+            bytes memory data6 = hex"000032";
+            bytes memory encoded6 = "11s";
+            assertEq(encodeBase58(data6), encoded6);
+            assertEq(decodeBase58(encoded6), data6);
+        }
+
+        {
+            bytes memory data7 = hex"473402bda4";
+            bytes memory encoded7 = "92vrDBR";
+            assertEq(encodeBase58(data7), encoded7);
+            assertEq(decodeBase58(encoded7), data7);
+        }
+
+        {
+            bytes memory data8 = hex"db818c0acacb413174da0b735845c8675d687b5a";
+            bytes memory encoded8 = "44NQgzhnMAr9a8uPgWoXCdqfDv1f";
+            assertEq(encodeBase58(data8), encoded8);
+            assertEq(decodeBase58(encoded8), data8);
+        }
+
+        {
+            bytes memory data9 = hex"0024622fcef71e7ee04da9a242ffad7bf79fee3773cd";
+            bytes memory encoded9 = "13EmDJJH1Z7jDr8uhAhg1P5wNLcik4";
+            assertEq(encodeBase58(data9), encoded9);
+            assertEq(decodeBase58(encoded9), data9);
+        }
+
+        {
+            bytes memory data10 = hex"0000fd96456b425aaf48dbb930df5b587b940aadc71a32932e037d";
+            bytes memory encoded10 = "112m3DAdZdSXq5wPNzcchkvQWjafqaz8zVQmz";
+            assertEq(encodeBase58(data10), encoded10);
+            assertEq(decodeBase58(encoded10), data10);
+        }
+
+        {
+            bytes memory data11 = hex"77544f7852e806c10607cd124737ca735038b48d397be4a8331c6c60ae2ff1a8";
+            bytes memory encoded11 = "92p5gA1pCC4tTP5WqoeFSkZYEzTbJhUHrr67iiHoaR7d";
+            assertEq(encodeBase58(data11), encoded11);
+            assertEq(decodeBase58(encoded11), data11);
+        }
+
+        {
+            bytes memory data12 = hex"001d21d50f55cae4194c0283c8f756ddaa6b9618c76d277b2281f1474df51cdf082237372fbdbd3cde1248274b4f";
+            bytes memory encoded12 = "1iopZNSaS3PZoJoUByjASKLCkqpLpi9Xyncmy4gHQdCL7QHner9a62NZAb3dHG";
+            assertEq(encodeBase58(data12), encoded12);
+            assertEq(decodeBase58(encoded12), data12);
+        }
+    }
+
+    function testValidateBitcoinAddressBase58() public view {
+        // This test was generated automatically by gen_ref_data_base58check.py
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "14jfgzfjb5p8z1RZFeVUdpdWAU7wefo7AW"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "14jfgzfjb5p8z1RZFeVUdpdWAU7befo7AW"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "14jfgzfjb5p8z1RZFeVUdpdWAU7wefo7A"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "14jfgzfjb5p8z1RZFeVUdpdWAU7wefo7AW1"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "3KzT4MxLuSQMTRQb5WmJfLuXJYvu8PHrCa"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "3KzT4MxLuSQMTbQb5WmJfLuXJYvu8PHrCa"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "3KzT4MxLuSQMTRQb5WmJfLuXJYvu8PHrC"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "3KzT4MxLuSQMTRQb5WmJfLuXJYvu8PHrCa1"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "ZSQNtZhevogeXbF1xuo5eJteLyhfWuJXY"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Mainnet, "mxRLEnYsvPY5wP6w7sL3pWPXy2PJUybK3m"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "mhLSqVWjUUbXTTPAJa221SjjGkPnPwd6G8"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "mhLSqVWjUUbXTFPAJa221SjjGkPnPwd6G8"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "mhLSqVWjUUbXTTPAJa221SjjGkPnPwd6G"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "mhLSqVWjUUbXTTPAJa221SjjGkPnPwd6G81"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "2NG68vN5nL5v6D9A9oSpjxHdfBaT1K9FPDp"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "2NG68vN5nL5v6D9A9oSpjxHdfBag1K9FPDp"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "2NG68vN5nL5v6D9A9oSpjxHdfBaT1K9FPD"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "2NG68vN5nL5v6D9A9oSpjxHdfBaT1K9FPDp1"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "nMjGsZocxcCjc4SknTTqPaJPaSzKMLw9wd"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Testnet, "mnPo5gsvUHuyLZzQ2Sc84fcGy4qkhQrDpe"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "mwgRKTuss55mLBv4SWb1xGpubhA2M8decT"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "mwgRKTuss55mLBv4SWW1xGpubhA2M8decT"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "mwgRKTuss55mLBv4SWb1xGpubhA2M8dec"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "mwgRKTuss55mLBv4SWb1xGpubhA2M8decT1"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "2N35jEkoytU2ZskrDTdgxCnWMVwq3dNEHKs"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "2N359EkoytU2ZskrDTdgxCnWMVwq3dNEHKs"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "2N35jEkoytU2ZskrDTdgxCnWMVwq3dNEHK"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "2N35jEkoytU2ZskrDTdgxCnWMVwq3dNEHKs1"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "n8PvFLDvoYzvDHE2j5nXC6P8aCNd4riryx"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Regtest, "SgKwhiYQzbfSuQEvcug89YwzenwrhY6f1a"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "SYgy8cAAHpmFXeCPofwnYc8quBrXjKa94g"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "SYgy8ceAHpmFXeCPofwnYc8quBrXjKa94g"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "SYgy8cAAHpmFXeCPofwnYc8quBrXjKa94"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "SYgy8cAAHpmFXeCPofwnYc8quBrXjKa94g1"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "rXQ8baDZUxHxQyj8uSqsBf38G6foCtzhfi"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "rXQVbaDZUxHxQyj8uSqsBf38G6foCtzhfi"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "rXQ8baDZUxHxQyj8uSqsBf38G6foCtzhf"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "rXQ8baDZUxHxQyj8uSqsBf38G6foCtzhfi1"));
+        }
+
+        {
+            assertTrue(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "SmUnHDP9z18asJTj1cH75LhcWxcAxE6xLE"));
+        }
+
+        {
+            assertFalse(BitcoinUtils.validateBitcoinAddress(BitcoinNetworkEncoder.Network.Simnet, "16jdD1jF8oZSAwwECjhSEPR45E4nRqiRB2"));
+        }
+    }
+}
@@ -0,0 +1,544 @@
+// SPDX-License-Identifier: MIT
+// Generated by python_ref/gen_sol_tests.py, do not edit. sha256: a226cc2317bf802faba5ed5e9c9616f4f806d3af4666c15ae468de062b4c79b4
+
+pragma solidity 0.8.27;
+
+import {Test} from "forge-std/Test.sol";
+import {Bech32m} from "../../src/Bech32m.sol";
+import {decode as decodeBase58} from "../../src/Base58.sol";
+import {Hmac} from "../../src/Hmac.sol";
+import {Sha2Ext} from "../../src/sha2/Sha2Ext.sol";
+
+contract GasBenchHarness {
+    function decodeSegwitAddress(
+        bytes memory hrp,
+        bytes memory addr
+    ) external pure returns (uint8, bytes memory, Bech32m.DecodeError) {
+        return Bech32m.decodeSegwitAddress(hrp, addr);
+    }
+
+    function base58Decode(bytes memory data) external pure returns (bytes memory) {
+        return decodeBase58(data);
+    }
+
+    function hmacSha512(bytes memory key, bytes memory message) external pure returns (bytes32, bytes32) {
+        return Hmac.hmacSha512(key, message);
+    }
+
+    function sha512(bytes memory message) external pure returns (bytes32, bytes32) {
+        return Sha2Ext.sha512(message);
+    }
+}
+
+contract GasBenchTest is Test {
+    GasBenchHarness harness;
+
+    function setUp() public {
+        harness = new GasBenchHarness();
+    }
+
+    function testGas_decodeSegwitAddress_hrp_1() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("z", "z1ph8c0dyw4wnjq95vy09cst9u64dyfuzmssy9yurhdaxth984esntsldgg78");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"b9f0f691d574e402d184797105979aab489e0b70810a4e0eede997729eb984d7");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_2() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("ew", "ew1p9je0mkzcjctfq2srhau05nu7nw3wh6pp2nmqdclmqlena6pglu9ssvwn2p");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"2cb2fdd8589616902a03bf78fa4f9e9ba2ebe82154f606e3fb07f33ee828ff0b");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_4() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("mnbm", "mnbm1pwm8m6yqkej3lgfr55vej70nuqny3wwsce98gy7jmq4a86we4fwysvysyfj");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"76cfbd1016cca3f42474a3332f3e7c04c9173a18c94e827a5b057a7d3b354b89");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_8() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("fngvnapj", "fngvnapj1pahhwhpgnrc8ktk5zcs6xuwk5x7gnh6w7frx8jszremwh8jj7h87skg6p9f");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"edeeeb85131e0f65da82c4346e3ad437913be9de48cc794043cedd73ca5eb9fd");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_16() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("uahkmttgbiuamube", "uahkmttgbiuamube1pjulj088l00ckhcjylv5rdgqaas5lux4t2uem4n5seqshyc0gdvrq4vyhlr");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"973f279cff7bf16be244fb2836a01dec29fe1aab5733bace90c8217261e86b06");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_24() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("seevxyfygnbyldvmnidtmtgl", "seevxyfygnbyldvmnidtmtgl1pw95cjrn078mty30ttqmkzze0h7frzncntu78tvrgmuh96t0v9qgq26xvmr");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"7169890e6ff1f6b245eb5837610b2fbf92314f135f3c75b068df2e5d2dec2810");
+    }
+
+    function testGas_decodeSegwitAddress_hrp_30() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("fxgvsjtvsnabdqraekttcsrjoetnjs", "fxgvsjtvsnabdqraekttcsrjoetnjs1puxla6z9svg5ke3xjr3kd8tske7eq5j740zj9tncucq2ueegjfyqq8qj5w8");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"e1bfdd08b062296cc4d21c6cd3ae16cfb20a4bd578a455cf1cc015cce5124900");
+    }
+
+    function testGas_decodeSegwitAddress_program_2() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p6y4qstj8dg");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"d12a");
+    }
+
+    function testGas_decodeSegwitAddress_program_3() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pfv2esr2mfkw");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"4b1598");
+    }
+
+    function testGas_decodeSegwitAddress_program_4() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ps6d78ggc2hgds");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"869be3a1");
+    }
+
+    function testGas_decodeSegwitAddress_program_5() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1py6zur805r3hp3f");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"2685c19df4");
+    }
+
+    function testGas_decodeSegwitAddress_program_6() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ppvln427d3vqq8sa2");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"0b3f3aabcd8b");
+    }
+
+    function testGas_decodeSegwitAddress_program_7() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pu62xlzc87gpqf269e8");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"e6946f8b07f202");
+    }
+
+    function testGas_decodeSegwitAddress_program_8() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pv54dvnmj4ngnw5r8v6p");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"652ad64f72acd137");
+    }
+
+    function testGas_decodeSegwitAddress_program_9() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p3qz6y44l662t5mg7hk06a");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"8805a256bfd694ba6d");
+    }
+
+    function testGas_decodeSegwitAddress_program_10() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p2pn3g25wqq9r9ztr4qxl0y");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"5067142a8e000a328963");
+    }
+
+    function testGas_decodeSegwitAddress_program_11() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pxc7lal9hpvqjrqwk8sffarj2");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"363dfefcb70b012181d63c");
+    }
+
+    function testGas_decodeSegwitAddress_program_12() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p4rt00srev7w9zujatrrqt2djla");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"a8d6f7c079679c51725d58c6");
+    }
+
+    function testGas_decodeSegwitAddress_program_13() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pksj5krngf8fjapu5mwk2v7txedh");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"b4254b0e6849d32e8794dbaca6");
+    }
+
+    function testGas_decodeSegwitAddress_program_14() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pefj2klltpsymxzlq6rgj6jqd3jn96");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"ca64ab7feb0c09b30be0d0d12d48");
+    }
+
+    function testGas_decodeSegwitAddress_program_15() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p0f7sjkqk27r8pw8cztlyyldpj3y7p6");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"7a7d095816578670b8f812fe427da1");
+    }
+
+    function testGas_decodeSegwitAddress_program_16() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p7rtma2mujhfst5qpdrw56qmdg55lwzrk");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"f0d7beab7c95d305d00168dd4d036d45");
+    }
+
+    function testGas_decodeSegwitAddress_program_17() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ppcckw7xv3sr7k8dyn6s25lnezjgq2dzhes");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"0e316778cc8c07eb1da49ea0aa7e791490");
+    }
+
+    function testGas_decodeSegwitAddress_program_18() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pfwp6tvea0c5lux5e0kyuknujr6evxzan05e");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"4b83a5b33d7e29fe1a997d89cb4f921eb2c3");
+    }
+
+    function testGas_decodeSegwitAddress_program_19() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pqahmg29y4jaah8r789sj7s7mtaqkv5g7wugcu");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"076fb428a4acbbdb9c7e39612f43db5f416651");
+    }
+
+    function testGas_decodeSegwitAddress_program_20() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pdlk876zgmxf3zvt5h7t8w8p4qukrx5ztlgm6g3");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"6fec7f6848d993113174bf96771c35072c33504b");
+    }
+
+    function testGas_decodeSegwitAddress_program_21() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pz8rdlwvuwef9htajett8nxk3f6cn04krlv8z732t");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"11c6dfb99c76525bafb2cad6799ad14eb137d6c3fb");
+    }
+
+    function testGas_decodeSegwitAddress_program_22() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pkeyvzlx6mawxfh3pcrfngptuaksm06eztkgsa6rhrt");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"b648c17cdadf5c64de21c0d334057ceda1b7eb225d91");
+    }
+
+    function testGas_decodeSegwitAddress_program_23() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p9qctmtv0ra4d7dutmeu62fwca97tmrdc583j6v4r2jw");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"2830bdad8f1f6adf378bde79a525d8e97cbd8db8a1e32d");
+    }
+
+    function testGas_decodeSegwitAddress_program_24() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p0kksglevuxvm25d79nz6llzqfucmanvhvqf649quq52pa");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"7dad047f2ce199b551be2cc5affc404f31becd976013aa94");
+    }
+
+    function testGas_decodeSegwitAddress_program_25() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ps9gmp85agldaascq3xwere9ul7d24gvcr0h9fld4djgu5r");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"8151b09e9d47dbdec300899d91e4bcff9aaaa1981bee54fdb5");
+    }
+
+    function testGas_decodeSegwitAddress_program_26() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p64kqkgdv7g9csylel2avylyee7su9zd23fhj2eajn59e9wqp");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"d56c0b21acf20b8813f9fabac27c99cfa1c289aa8a6f2567b29d");
+    }
+
+    function testGas_decodeSegwitAddress_program_27() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pty6sd4v5l2lmuet963gud8pgnmax9eqln37wz87yr57qyynwgy");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"593506d594fabfbe6565d451c69c289efa62e41f9c7ce11fc41d3c");
+    }
+
+    function testGas_decodeSegwitAddress_program_28() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p4gjxzekzunjrnmelpshm9v5d8tugvtmumeh5llcczjgsj77zccr");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"aa246166c2e4e439ef3f0c2fb2b28d3af8862f7cde6f4fff18149109");
+    }
+
+    function testGas_decodeSegwitAddress_program_29() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p2uq9qv6lcmy5fw3kfu4q2fqnrgzwm3q9u2lspem08uak7yqrygpn2");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"570050335fc6c944ba364f2a0524131a04edc405e2bf00e76f3f3b6f10");
+    }
+
+    function testGas_decodeSegwitAddress_program_30() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pez9zq4sznz9z3wqxqydk266y00wwhq8pcxgw48qztfu68eyragcy23");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"c88a205602988a28b806011b656b447bdceb80e1c190ea9c025a79a3e483");
+    }
+
+    function testGas_decodeSegwitAddress_program_31() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ps3zvzdphlnhdv4960m99gtvghet0teg7nka4la4su8535ugpjqz8q7kn");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"8444c13437fceed654ba7eca542d88be56f5e51e9dbb5ff6b0e1e91a710190");
+    }
+
+    function testGas_decodeSegwitAddress_program_32() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ps2k8a7enhgg70vzzj9hzgucl7hm5htgygs3fsv80n5t2dl55df4sapp007");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"82ac7efb33ba11e7b042916e24731ff5f74bad0444229830ef9d16a6fe946a6b");
+    }
+
+    function testGas_decodeSegwitAddress_program_33() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p5yumyuq209lq4kv2v43xl0d2upx8lc2m2zgtyhrz8lt6nu90hlgtwv6znjg");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"a139b2700a797e0ad98a65626fbdaae04c7fe15b5090b25c623fd7a9f0afbfd0b7");
+    }
+
+    function testGas_decodeSegwitAddress_program_34() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p5pdwvf097chex6jw869ksg0trsahkq5am9rsn7qmxxdvdhuwp3ymweqtvscz0");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"a05ae625e5f62f936a4e3e8b6821eb1c3b7b029dd94709f81b319ac6df8e0c49b764");
+    }
+
+    function testGas_decodeSegwitAddress_program_35() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pn5h22vkkzjr5lcdxml3vak965mvuskukwrakwcyuh2974lptc4aeex0dtq05ld");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"9d2ea532d614874fe1a6dfe2ced8baa6d9c85b9670fb67609cba8beafc2bc57b9c99ed");
+    }
+
+    function testGas_decodeSegwitAddress_program_36() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p906g3v0srjf74skk99w7u0gmkd47wle9pag96s8lmx9csrp6yugjkx472yvkkg5n");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"2bf488b1f01c93eac2d6295dee3d1bb36be77f250f505d40ffd98b880c3a27112b1abe51");
+    }
+
+    function testGas_decodeSegwitAddress_program_37() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1p8hsyp62vjg5s7yxz3jte9xw56rhzm8qweaw0fug0clkzkps42vgugqtcymkqr7ek7u");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"3de040e94c92290f10c28c979299d4d0ee2d9c0ecf5cf4f10fc7ec2b06155311c4017826ec");
+    }
+
+    function testGas_decodeSegwitAddress_program_38() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pq7ugsaqdl0w45j3wkmuadld5xugz445vrkchj8eqm4zxv6d4kkuhr7xj7mhjuv0kysh");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"07b888740dfbdd5a4a2eb6f9d6fdb437102ad68c1db1791f20dd446669b5b5b971f8d2f6ef2e");
+    }
+
+    function testGas_decodeSegwitAddress_program_39() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1pympgf4ucqaeyxtp86pk2genepkcklpsaged85xu836l9slgdl2xphq8dkhvltwgmz0vvs");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"26c284d7980772432c27d06ca466790db16f861d465a7a1b878ebe587d0dfa8c1b80edb5d9f5b9");
+    }
+
+    function testGas_decodeSegwitAddress_program_40() public view {
+        (uint8 witver, bytes memory program, Bech32m.DecodeError err) = harness.decodeSegwitAddress("bc", "bc1ptkm0mlnagtjlk9x7k6r57nlz89s5drhn280ptwjy8nlnrcc5jza45hlhghadv70049jh4h");
+        assertEq(uint(err), uint(Bech32m.DecodeError.NoError));
+        assertEq(witver, 1);
+        assertEq(program, hex"5db6fdfe7d42e5fb14deb6874f4fe23961468ef351de15ba443cff31e31490bb5a5ff745fad679ef");
+    }
+
+    function testGas_base58Decode_payload_1() public view {
+        bytes memory decoded = harness.base58Decode("4G");
+        assertEq(decoded, hex"bd");
+    }
+
+    function testGas_base58Decode_payload_4() public view {
+        bytes memory decoded = harness.base58Decode("4HXvPJ");
+        assertEq(decoded, hex"80848011");
+    }
+
+    function testGas_base58Decode_payload_8() public view {
+        bytes memory decoded = harness.base58Decode("Z3WYu8rTG72");
+        assertEq(decoded, hex"bf92fd32318be179");
+    }
+
+    function testGas_base58Decode_payload_16() public view {
+        bytes memory decoded = harness.base58Decode("e7rtYmCTTYK53z4zp9Ygq");
+        assertEq(decoded, hex"052ebf490954617a57678e869b58bb72");
+    }
+
+    function testGas_base58Decode_payload_21() public view {
+        bytes memory decoded = harness.base58Decode("6A9JibQb2URseEaQfP9btQGaj4pa3");
+        assertEq(decoded, hex"53e02778b51dff6173624a2a3e87cfdcf9a09f9410");
+    }
+
+    function testGas_base58Decode_payload_25() public view {
+        bytes memory decoded = harness.base58Decode("2QTSc3CbigFM8ns24veXahCeH77Cru6SWav");
+        assertEq(decoded, hex"ca6f89d98c9b96305420f56f18b1d9cf4339c750bfe68b783b");
+    }
+
+    function testGas_base58Decode_payload_32() public view {
+        bytes memory decoded = harness.base58Decode("AstoTskgL4R8YkGY8Do69FJoE64ZB1dg2qiJGe9cZSmi");
+        assertEq(decoded, hex"92c2cb629381b73d669f3c492fd9f0a488af918e908efa3e1056179bb6728595");
+    }
+
+    function testGas_base58Decode_payload_48() public view {
+        bytes memory decoded = harness.base58Decode("6HTvtd2E3AETFPGcXmU7ifVWsGcZpyiigj2MVoUZryyDh1FbYgEXcsp9i1UA7QNepm");
+        assertEq(decoded, hex"900b169684633a714cf2711ef70de873a62e56d2f7b7edc09a266ed9e6d0b280bd452ae90ac8841441202e503a489a3e");
+    }
+
+    function testGas_base58Decode_payload_64() public view {
+        bytes memory decoded = harness.base58Decode("65XeguGCicsTpH2QVHuxC3WY8zKEWHiDbwEYvc6rJQXKRooEiox8PkneoyGGuypnA4TG53AZFXbKSnGxuQswLyNv");
+        assertEq(decoded, hex"fdfd7a84a0a81a73e9fe88e577ea8cdbf6839b1c95d5819fac32bc1fa64e54902a3590f1cea711fd5dbb8d9da9bf879160b2a5a238477cb7d06c5ac12031db2f");
+    }
+
+    function testGas_hmacSha512_message_1() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"9b");
+        assertEq(result1, hex"7a9d2efeb414fd725e445b8d3a8ba3e9eb66b3726ac9bb069c25c63cde06cac1");
+        assertEq(result2, hex"06509e0bbf94fddc680c312c97877320a623ae97a45a6143771f3c21a7ea2c83");
+    }
+
+    function testGas_hmacSha512_message_37() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"ef2e72c4f6ab57a4a652c8c11525d6e3e4181475fc85f48b91ef9c61b2ad77e6418289833a");
+        assertEq(result1, hex"3b9501f3c52609e462d4a21fd148d67c15502f68e2eb5545128365bdbea7565d");
+        assertEq(result2, hex"2c76a392b57d8b27f934608bb35f0c4dedf058cc4d4a32e9a6b4c8d095454ba7");
+    }
+
+    function testGas_hmacSha512_message_64() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"d7abf6344d2562c3460ebdef460eeadbac5245074757c61f8e234c8e6f7cbf39ed6eb8ee34c3f3a94b582ff39e767d453215363ea11ca27542c729493367ffb2");
+        assertEq(result1, hex"62718af877e7be129f175f111874fb3448cb0bc1dcb228b0fadea61d2ee58f1e");
+        assertEq(result2, hex"86214e4fad3cc3a6084a13efe27b55ee143bf45f90b2399910c449a184a029b3");
+    }
+
+    function testGas_hmacSha512_message_111() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"4c293c3b7f9a88c2d5ef7cfe1cfff2b3c5b0efcd771eb0a2ace02e64e94ad44d94a319fb83d4b15372509f8eac3fbe3d86c53a4a7aee61accb7ac7a5e0fefc70d5d07598679e32596fbb87df57ccd418c1abd1489874d396cf3cf5f95645633d0a8ba7c4e982a690d312343ee4bc2a");
+        assertEq(result1, hex"4269ed157a10b84bb375f89537bd68672cc98a80ec24d110d38f58858d155b1d");
+        assertEq(result2, hex"989f7c257757880fa5aac234e907ce3031447e873f0cea49cec653c7636780a3");
+    }
+
+    function testGas_hmacSha512_message_112() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"1c8b3042b38fffa0345b79182433c7bf9c4e6de1209dbed58987be6b99d94feacea9f3deb98f6e987b519b9da8b5e096611bf309e72b1acc86dc1f20947cba111dc17aacce75fc5ce3b9fb2a34cd3d1dc3715c16318164edca6c82c6a2841b0c8a0b0aff54931318a5cfea64b24c7409");
+        assertEq(result1, hex"4973e8ecf2c1d95dde2d377038be6b3341dd87c3ec3ba9f2d577ba3b860d28b0");
+        assertEq(result2, hex"091738840c426084fa0ad462d935c7623c60a8569702fd4628af9e1fe0c17bb9");
+    }
+
+    function testGas_hmacSha512_message_128() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"e06152fdcaf25a6448979dfeb4c5e0742d6b2e80cf0005e740f4228f3eee284ad87c1843ece97eee74bf49f68e84239a16e74aece6f183323a8810bb4e5ecee64bc5905a5417f488005a944f5ed30b213eb7c80466b266075adf0eefae978fbf7b8d0a9a68257b387ca04855c3d17f3c886bb214377c34fe914de9a5885ec35d");
+        assertEq(result1, hex"cacb01a7e63d47001d4772707fb5c99479d34a69c285fe1a587c1fe51f718a1d");
+        assertEq(result2, hex"259239f07eb050ce29526bdb67381e56c1e33c91671d8a34f4c08562575b26c5");
+    }
+
+    function testGas_hmacSha512_message_239() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"fca57efb47824a74b6653cd1d79778431300f31dc4b65f12e6da75b139641f55360aeb05b2ecbb70c25773f776070152274ba2baa515b8ac7eeca3706fa72bfee66ce79c549c7b0e72140f798eca39487b3c408210da324a77ae13976669582725a335e63409288c1c26aca99e3f3ab35876c9fa54c91303be5a4d7cb6cfe7e81671a5d18dec306b7553c8a66518b97bb1849bbe7ae43a85b4aa18c9897e8c6206add07621b7c3b89e5bebdd76b852a96c01e55ee4ec990d65a4020be5dfbfa8674d1000a44ef888a6f7a8f539017358c125695c1f66ec5fdcf69155fc2b7899d44043fb51d9721b6e8298141a86b1");
+        assertEq(result1, hex"6f71842b4273e853e4675e4b0981c06c62603ebb1be7f0e8167ee2d22933ed96");
+        assertEq(result2, hex"babcfb43a9e9aaaca1e72135719c2a701c4d14fdfac69088b88c399f31f729b7");
+    }
+
+    function testGas_hmacSha512_message_240() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"6a679c421e227f61895e6ac477811ccd1ec5887956e4d18177199398f13da60c1844bf0d81098118879757c6ddb42c7effa40f27182fa2de7b5d197c72a744784def347fcefb0d3c1d11e8fbdf2f45a3ac7ac954b1fda76b2d34234165c54134653e2568a6ce24cdd633817503d093ff37009eb00ccdae575d9e08a4d9ca5e5d0e1e66f54be6f31098330a6c883083fe16ca49ec91addd01b7c4e268f81179529f3084311bbf402cec1ea09695c622999d798c62e2e5b44fe94de03b7e31fd73d51f42b1b9068944eb651ff3bf25b43675a84d56bfa9c6a73e1ae9ed4477b81a4c14bfb615405508b61db646ff1367a2");
+        assertEq(result1, hex"94c22e9bc29c968968d42deb4045cba35870667e1b9fc7211aeba554aa9ca5b2");
+        assertEq(result2, hex"646dfec29126ef9d83f22524c34cd3975525c96933aa074140449b0b1334b4dc");
+    }
+
+    function testGas_hmacSha512_message_256() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"20e8e6039c131cf804fedc70208713aa8922bee68f5f624f9f1fbc908180212893312972b3f0642608b114cb8d9fd8abc5d267a0cc5b94400b7e5bd3c9f65a71cb9c68853048d2934b740da5c8cad2c3f141535b2f1718579d18f6eb82837d74db4f09de726c4c7be78ed73269fffd20083b62656ed2cbe5a393dc026331de3f148f3704d6fa8d9bd7f207e6b0561b096a72bad26ce15db8d4e3b7d9bd424b0b084f6f522d2933c3d106644a02f77d0ba8f5e20c3d95cd605a22048dde59ad8f27fb1f50757164e37558a8907438a059a6a3e28684d1dd7778460e9a0bd942f6f100c78b81d1b5281f8ac8445e2ea49408260e6acb8167b11cec8733407e1594");
+        assertEq(result1, hex"845a4fb418d981e3d8987b98f8030d46f56703a9be095ac41e2802ed1283a741");
+        assertEq(result2, hex"7f7266ae20aec4ae805603d591b32f1727e42ce1e9fb74b96fc7bdfa104b0f60");
+    }
+
+    function testGas_hmacSha512_message_512() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"c562d7b93ab563c709136c37f788455395bea6367f5c2b94fa3a4bf51e84d89f272781f2ce0f878fad0a0af4719bc267ec8bac6e7afcfc96a6e05483017bab9b95c9c29e7bf06f875a0f0db3d2545d0fe9e3e0c90725504b46ae7eac9a335b887f8e8e2f68f31d3c57fb4cd30792a6bfbbac7d65accdf5cf3b84854b842d34feac4b584d23e48c9f4da46b08901e266c712d3fca05f265a35cae90a46e1baed15cb797bf4d5590c60ace90a6c9981b5562e31b1878321bd0fe872413a86f52eb5afefdb83381263367f192f2477a0214c45bb3a207aced912209c0b69ec640bb46eb56f943437093aaeaec404afeffe7c74a5b1be034954ad182710f3c2553aebacc8a0580a1bf93a1fbef1a35314bc02a1cc737f3deb2db921ca3e47bf723685c7160dfcf89e4aa9b7e3b8a8ae110a6ec9d8110f7a3167bea9036744c4c3c703d8355ea235f9181a54a19ffb98a1bf717e6f10acf8ad46e3f19a31210898598b61f7f5105c181df78dc058438df584686961f078f104d69118dd7c354b1781f8d44e158b2722c9643e5fb69ebdad0cbcc9df431f3a1c123b9bfbad042f7cbe70d1d405e67c5e3c26c03db3e7e92b0b1d5c9d7587e8160b31dfa3be32d294125012842e77cb1d7d9ab6b2389fb031ba632adb2cfc68e1102f888daca2cbcb59147356d50dae9a57a63b170d1ab9db7fb8e73a0bb6cb455c0d2013776226f1817");
+        assertEq(result1, hex"1ab785aee6f6be7999a5ee9affca4c2ce3a61b17927ec6d5265be8c35dbcac92");
+        assertEq(result2, hex"e142f4aff04b9791be5345d8547c47cc2f13643c14a69a16b5180ccae5da5c31");
+    }
+
+    function testGas_hmacSha512_message_1024() public view {
+        (bytes32 result1, bytes32 result2) = harness.hmacSha512(hex"5b9426fa31ab89965b1d3daae0c5899221dc811927cbbef24ca804d572abb6c9", hex"8b82d556dab3e4322ee50d8af6164fc9b8c70b947d779d0d4c572a9f62437be8dadf263706bd27ad9f4475ddc1a4a0b1d7263f1b1144e6747ff86b1d1f515ca38d4342fb9e66521221f153066f785c13e7fce1948b64f2816d216a84140f0f74d42346a4327ea2104b0d5bcb14974ae60460a8b510953942e2c527dee3c2453fc120e5126d18c3b960966a51dfb46d9c334609a974c9cfab5bf5af7e18ac25df6b3af3164666988e55d282b5b37dece65c4427ca6882ecb80cf78704ce0fbaaf2aea260d4ad3e7701e82ce2f9bf9380e530034edf7d5813517f88db3018c1f1c3800190b0bf2935830734bd0596ea60a0a9fefcecad413dbf2657fdebf19bc2f14ed0675b40b1613176c34d0c4549b8cff397cce1b3e7964f27a346f1e7c4e4b629d04c176fbf6c609e1ab1bb7cd80c0e4513bda2069a9cdcb6ba92d3b8a6f2d056233d5d4fb42a6cdd577d73e070e11790b1a632309fbc0130a0fde7764ad85e3e273e7172963c107f06ce8c23d5a2066b144ea300ba4e8fa7625e4fd9ce1400d1583fda44c9b9661d7a751f61ba5a8ba85b924f4036a02462707b4a574936390ad99635029d69530dcee68d7af5358fe849de117f187e149c5e8feb7b8b20fb2e5243d17efa5723764e01cbf7a12e8ee01a0e803e5660359bd16d14ec9782018215a5f3ec1d30439f9d989eac310b5d4fe8decc6a2080dfab19568022b7acdbcd10015ef6c4e887f743b84dd0d235bbf6b07af1f8336fe154e3ef9a2a7f22938d4273b5f5ac4824a439066eb2abdf7cf427a8bf6064ee24f1df83e76eddef066014e0c972bf7f74cd947e000814ef1e57f29a74582211d9b7045f3b05859a04c6e583363b40143813a01f1896f4c4387f183dd13e79d5c9c4c01907222d1f1ea036566c982792231726135787412b62d4523453b34a71b9a28952d5385dc74579939e98f24bef1d37631766bbecbad56581cc8e0df3fbae968932e9cd9de6230cb83613749a7b474d2b616809377f7d70776f17bd4d3598fcf5f2df7a6607021925bc88673b51f8ff967fff18d304c1daa44f49df39060b4f3e41a680823fc15d9a73a4c4897ecfe8cc9568b7dc519304965050fb42c60cecfa4ac94b53d81bb1b074443c6101db2db099bfae454f5402e21e19eed57e379df7d2d0ab47c005d24e34cf63bc5aecfcb943e96e7e58aa493d9452b5a18daaa8b5c637a1f313a70065ab2dbcc72c60380acba0bed0666a088dcbd8e2ed4043488f4eb30385ed9fe13810b48aeee7f8e666976dc3ef7167abcd032e23d5668279015a0c5a37e38c849b3c5da92d83b0c79442375d18ba3cbd3f0abc1b97a3d88111ca33ddb05c15c13859a3e017367283c44e1ece32d7c5a563d029b42dd7f72ca36499e23403e77eaa66239ada08c29501f271f3e48744de244aac5c13561ef090ef13828f06a");
+        assertEq(result1, hex"161042db8f058cedbaec23b920a4fe96309ee973da0b3a359203cb6f58de2700");
+        assertEq(result2, hex"38ee0f4e4fcd15f2c68b26a1bc6e400d62c060a5f82d2aeddb62a90577bccbb4");
+    }
+
+    function testGas_sha512_message_0() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"");
+        assertEq(result1, hex"cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce");
+        assertEq(result2, hex"47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e");
+    }
+
+    function testGas_sha512_message_1() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"2f");
+        assertEq(result1, hex"5c86f0344ed249425c8aad3f272b72a2ce0ff388791f31497eaf257fa7262948");
+        assertEq(result2, hex"7faafd7fd27eb0dd6355d5509e2f3faf76711015cd9207d248d550fdea15274f");
+    }
+
+    function testGas_sha512_message_37() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"f03f843fff9f05da5fcf7ae2ebe6b9e792d7bd7aec35a6fd0849f867c319f7ec3c0b302f53");
+        assertEq(result1, hex"c055b298e69bcfbd0f772885825c8c31be43c7a0d24e6947abd2c72d7e9158d4");
+        assertEq(result2, hex"67f00432ffbe3a7810b55cc8a7262fa14cfbd547847a576187afbfbe70ceebc6");
+    }
+
+    function testGas_sha512_message_64() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"31a3bb71c2bf4d0909564a1732b11cb396b383fcbadf74db335d8b215773b1a38fce23b7cb454250172ff174ded1f155a6d2adfa5d2fb489cdd51f67b711fb0a");
+        assertEq(result1, hex"73a805683b767c539fb61f47d75d43c8ce080e79d9d4317ac645d01f597a2fb8");
+        assertEq(result2, hex"db6c067be9f3df1b5051f98ac003cfca4489a1c1808203a17f2a88c8b1dc2e89");
+    }
+
+    function testGas_sha512_message_111() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"f49a4285d2d3cdfe1cbbcd8a0716b5a61f79a3cd878ec0e5de9102ed40f94ceef3bf9082d5443bc733db7ee2e0d1d677ce0965cef57113d0d0fe52dcf227e3d3593ad660da2e1f95c1b9b8a04e07fc5e56ac275fe5aa53e24397f3c6d78b4016295cc954b86ba38775a564ea11de7d");
+        assertEq(result1, hex"8c7bd60f8c2157fc8694ad2d28e856f0a20c8bc37f539d0ea921e549cdbeec71");
+        assertEq(result2, hex"13466f73dc676be8818f738620afb51f6edf3e13e116a2d268615cc6b19effb1");
+    }
+
+    function testGas_sha512_message_112() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"15d7c8d243f8f6bb876ead9e10432197dc2553124ac2b0dbcdcd159469cf087edf7a3a966630e3252eeb4b51b5960bed207b2b89428b32a2e321033d0f0dacf2f6693555867d125398a11e0aa0a0850275a8db2efb50407654a13eecef80d3952848954772314bd712e869a4dbf8a378");
+        assertEq(result1, hex"1797ca0b9ba3b8443c7f649a080c2190fb2a524a13535b9c61fae239f5f9d901");
+        assertEq(result2, hex"d3cc6852c339da8cb4e12b69b32c930f17ffab8c5a1b0aee8402ba73186c14bd");
+    }
+
+    function testGas_sha512_message_128() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"eaabb5225e76a214ca6668ecfe182fd85821a042634d41da7f9001d76441c40effbce8e9acd2f3f4b68703b03af2069c42b6b11d95da401ab3fa5c2d6fb1acf7ed9dc809cfd0c825ad393bdb73712bd51e0b4554385dbb984427e10d5a735af12fa8e8a89a1d1b9a8924cbdb2795ece443e140fdba2764ddb2279c9bfbee99a2");
+        assertEq(result1, hex"28db057ef5ea807b3e67ae23849beb5f158bfffbeefadc1039de84c7f42260b9");
+        assertEq(result2, hex"2669babd7a9804e3db4c999cfe7bc40b21de99991e01f4dbca50841699501dde");
+    }
+
+    function testGas_sha512_message_239() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"9d4b398d125445e9b5ad84fff0ceec9a8b954d999ea32e659591dada2776b4b79f65dd30c5befc02d53951f79082a2a2ff9f3c5f72c97a644e03978bfbff1643609d68286a6f6e38251afeade9656ead0c79bfa94eb3c09886500a3504834c5de70e229ba4e8e808e5c48655b0ec4e0b82a44a26fc68a4e534b07da1ec0b254300bded28eb873bbc05c845bc8a912b943c62f4d5c998f183a098fdcb75b3821f31b2e6c7152aed92d554a32d1efa3407c6d557ffda7cb463838818e11dcaf7affb6630f20ba2bf7901b14a62a9b24e32f0378f36842db915bfd5ce9680359ed5092f2dd3e38db5e25ed08c3f09ac50");
+        assertEq(result1, hex"a2bc9b9ee9901f6bac79ad50031157358e8cebce9621c18b1df8c5ba1f8b792f");
+        assertEq(result2, hex"eef5763077f78c00ef0dadfb6785a66361ee66f678119f56df322140fabb7267");
+    }
+
+    function testGas_sha512_message_240() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"f55b44b72575a89c609f7f5a7e00e62ec5afe827eec82c780da6fc4e7ad960302874db10ae5058206e9cd77e2331a11a9f3579095d489d77691dbe0f9895744646b8661410c501e2bbb5fff2fb73083666d3a902d58b4a8dce8d8daa9eebc66b561ad28bb9ce5f34c3be0518c2ebeaf5039e19dbc0258a25f89398ef87044c48ee2155eee15d93a0307877903285f2b32de3ee477f4da46e259903ef024849b4a1a8f45dcb7a799976359388365a7c3382a35338ff3aa5cfbdd75efdb1b9992b1cb266405b7733d984151daf6fd8b0b6f8701e0587129bb4bcb1fed1017b10bc1f8b4d41127fe4cbc1cf6ed3f019f5c5");
+        assertEq(result1, hex"8c19368374da0c63fea12d9f05e08d0fea48e20ca62961679aeb66f50d9bfe3c");
+        assertEq(result2, hex"8b2a93f2aa50313c12fcc87fcae889d028c865f03eba80a6cc3f8bc490d6c4eb");
+    }
+
+    function testGas_sha512_message_256() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"91d68dfe005ec2e78055488ed143b28165cd97bfa0972bfa47644b5c774a4a055bf68a2e2d92191a448eacf8c6ddd75dae60fea0c483e138b0b3159490745333dba30409b6f57a107d6e3586e4bef2985e679000c126fafee1fb1f47768a0c2bda4db30f6a3551160ec4c7c0524f0ce72181f61a9f1f13ef271be4123b246de46cc6bc81a3d71901942cea54b1c743677bdb4a55fc7be9ba95c53ccef5ea985fa05ebbfaeca7d130b2aa24ed7a0b8dd2594271755f871cca04de487fef9d19b0de6c4a47cad965399e9e510503aff0b2ed26e70ca3cf587482370410cc1bf82be0d92a05e4079a8639a51ff8f109f0d458927dffb38059359f7bcccc982dc0ab");
+        assertEq(result1, hex"9e88ed35108fa383b351e477ad9bd6964f06a103115c373b5131758afcb4a8b4");
+        assertEq(result2, hex"a310c2a478eb8867b14639572e261c8394af26544d4f10eb6b78f689a2d8fe1f");
+    }
+
+    function testGas_sha512_message_512() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"2a27a66502c0da50c40c0c34a9c8df458748035c86e88f734212523746b46113701ad35e1285575783fe91cdee204227f85b33ab1889e8361097bdcaedae4cbf11cc1228534cf3ba8d958b74a546213698ba54d2375488c7d6d8556b4ffc5ef966ddffba2337cd1ea78f85752a0eb4a93e2ddda46be0ea34c6df0f64fe82bd1dbb36138ca242e70e1a2eb54e51c304eaff6cc19a7f97465e03da21c68141506c31d60d5c3b5299c97a0294453352c5935f4e4a805dfcbf5117a3e0b3810164f2b8da508b9079a6d2dc8dfd8e0ee960b7401e6ea7079d0aeb97bf5ef3e703a68e5eac741b1b3d62793d9e90f6b870886e2467ca5a3f655719c74cabb421df8531b307dcc2ff801c8d5a25882b3c1185d514a3706b3a1219c6616f51ae3deedb35bd7ff29a9d39ef7d1cd9ce3a96484f785123d34c14feb8da9f4ff9c970c7b125831ceac2cccb1c140ce70b401a2dfddd5c8c5471808fc5d387d31f20563840557ce993d1d56b8bc7dcf11fb7aa2f7d3189b03f634346520ce77b4c7de0a5e6f0fcb0a1c90cbd18fc6700f250e59bf9a86eff54454d4ef8be10806215dccb6b14bdce2a5b02efde0e72d6375366f8e34a6018ba12c81d0f9ffbf20ed599a02a9faff7f6046927484c212fd47e580824963079ec83db78b4a1b7b610bc02f65d4c065043833b81f7d35f6a5458b2a6d29078cb24291f81b2a35ce8ac9d5331270e");
+        assertEq(result1, hex"85cea70b3d4fdca1f13c4517fe4f4805b2f7633c375ef09f8a4c1e9ca690f9d0");
+        assertEq(result2, hex"2b6aa931b2c4e37bdb0eabedd6642a8ff7e2bc70efd4c204eedc8ff4dc6ad40e");
+    }
+
+    function testGas_sha512_message_1024() public view {
+        (bytes32 result1, bytes32 result2) = harness.sha512(hex"df3ea69d5a627da8d9425c101fb5cb038f893bf447d1850ab5d897cf58016f341e6eaf1bf9995adc7621ba028cc8f27190505ce028e3a2d172c84c19017b7caacfa7bc419e7d82089df4906919eadb29b10f2b20157251de54bf09b58a2de3985e125b5d1e10680bcb160167c49ad533634d529fadb103714f26114953d9d5b7726089d6f24eb771bc2f06a5ed0af6d360ec989f4a5640044fc5d91d4738a05f3a7568fda3f8201a20fa9a172b58c98e7e30b88fe67d4bdea693406b77df1d6fd688be296ae3b666a12e71dd7d822b2a166129b10b04b52b6fd6c37bbc676db16a6ad97d51c068b0df63b7de9c9d2cc91814053881fec9fdf8031cf1c4cb3d4ae2b708b22cfee6143b7ef7d94ec18ef9506b0bfae6fafd3101e545e3b0104cd996e4bf31af87f12dcaecd3f5aaaa0af2fbb94bd9a940b2034501aea96ebfa6ab5b802d87770a6be2ef47ded94f418d92dee2df2409cefd5c4c2f76a4fce521fcad861a0e407532c155a1081ba26b6f8b1b2352425a60d787f9a25034cbf985fd044249d559b2bf3f5f8de76d43a30d4e4cb12107d305d8861fcaf2051224ada99ebf00374c42ea95d040c6f1536796fe58dc68b06ae2f46fd4e2152e62fd6a8a7085e80276c6dcdf57bd1ba725c09539e4d28e36211205b4fa51ee951ba8c7444ee75eaa51025502a92975f7cda78c424cd41d645af180d07c0f6523eb9b5562030376c6a31bcec6eea0e6faaff282926530a68bb235e172264a43b98f58d21b89e369a960688306723f5339a877dfa21bd66c7e6dd7e2414b05e011b658b34fbf5a27e6a00fab688f1d345932b353d0dabe46443126c6c6f78252f2d1ac75404062b2c12253f6e87d35358710ba86c231dc231b847add0cfd1ecc2a7df89e1912976b9c193da71f1541e038b3ef37ccd14499a923ce2c83befca681f0a306aa516d289cc7ff00815ad624d346b98c5d13a79d52fbad09f5b3c747a7324f564c061bb85ea2cf16e620a76c11be7bc0a9a92273af83b6d78049294335109f8ef72202e61d0e00e2b056653c2621cff816b1f182c8cfa27176c6c511cd00e002e248fee0fcc5e3d42e551d4f886e87e0f675ab29c176f2b33c2dfa035e4b0e667a30e0073c520a131bac2f84c0a2c1bb305e5e50780d320c661424547c858590cce8adaf352c68c01fad603484933768ab00c306bdb51102aa402f15db612903966dcbfecaa80f389ffd03e5b0ddbf36617a18b4c92b5fb6424d423fa4880e89b852aa6162c07481fb8ecd0720e3a9b8a2a68b474203380a38c4102617e9980c58f0c24b680ee32142afa7bcf7c0205dd66c77ef9c92cb87abe9ed5495f2ab297882c6151082f251b643adb1f6b9e17f6d0382172361c8bbf5804317019a369690c02f81384655bf9355ed2913eed5f1f60e445640201fd3a369f4f6c103796419");
+        assertEq(result1, hex"1d80ec2183b33f554b8c0b69f0093b7a1e3be1c530fd388e41e51f8aaf01d15a");
+        assertEq(result2, hex"20526d49876756b504d9fe656925e5007ab2432f8a80d9a6415e8ac700b41265");
+    }
+}
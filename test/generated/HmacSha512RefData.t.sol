@@ -0,0 +1,93 @@
+// SPDX-License-Identifier: MIT
+// Generated by python_ref/gen_sol_tests.py, do not edit. sha256: a49893880b12da5e28b92fd670ec4dab79f86a754f99e032ca4fdc0d8d53e890
+
+pragma solidity 0.8.27;
+
+import {Test} from "forge-std/Test.sol";
+import {Hmac} from "../../src/Hmac.sol";
+
+contract HmacSha512RefDataTest is Test {
+    function testHmacSha512() public pure {
+        // This test was generated automatically by gen_ref_data_hmac_sha512.py
+
+        {
+            bytes memory key0 = hex"010203";
+            bytes memory message0 = hex"040506";
+            bytes32 hmac0_1_expected = hex"d397d5a94c4f9b1ad5bd483f38d382c965c89e8129c2998d7202c530bf492c60";
+            bytes32 hmac0_2_expected = hex"a14ee3202d4bbab087dc9af4aacaede0f4b32dfdfc707756a12a7a750b79b5eb";
+            (bytes32 hmac0_1, bytes32 hmac0_2) = Hmac.hmacSha512(key0, message0);
+            assertEq(hmac0_1, hmac0_1_expected);
+            assertEq(hmac0_2, hmac0_2_expected);
+        }
+
+        {
+            bytes memory key1 = hex"0101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101";
+            bytes memory message1 = hex"04";
+            bytes32 hmac1_1_expected = hex"c68f8756a0235a67f4f3a1c563025bc6c84389ffb80e4fe3a77344b14104c6d9";
+            bytes32 hmac1_2_expected = hex"7816a5522ce5c018d8ef7e8133eaa98579690f49d7e38038fbf13ce51898300e";
+            (bytes32 hmac1_1, bytes32 hmac1_2) = Hmac.hmacSha512(key1, message1);
+            assertEq(hmac1_1, hmac1_1_expected);
+            assertEq(hmac1_2, hmac1_2_expected);
+        }
+
+        {
+            bytes memory key2 = hex"010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101010101";
+            bytes memory message2 = hex"04";
+            bytes32 hmac2_1_expected = hex"4440366771063083654ba2bc822768a9e16210b9443910c77a6fb5ef4978c0a9";
+            bytes32 hmac2_2_expected = hex"4c4cbf7bf68e3cd18acb16e3c98bdf6be1efdcb2519ee9c4d66eb8f92eac5838";
+            (bytes32 hmac2_1, bytes32 hmac2_2) = Hmac.hmacSha512(key2, message2);
+            assertEq(hmac2_1, hmac2_1_expected);
+            assertEq(hmac2_2, hmac2_2_expected);
+        }
+
+        {
+            bytes memory key3 = hex"873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508";
+            bytes memory message3 = hex"0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c200000000";
+            bytes32 hmac3_1_expected = hex"6539ae80b3618c22f5f8cc4171d04835570bda8db11b5bf1779afae7ec7c79c3";
+            bytes32 hmac3_2_expected = hex"d323f1be5af39a2d2f08f5e8f664633849653dbe329802e9847cfc85f8d7b52a";
+            (bytes32 hmac3_1, bytes32 hmac3_2) = Hmac.hmacSha512(key3, message3);
+            assertEq(hmac3_1, hmac3_1_expected);
+            assertEq(hmac3_2, hmac3_2_expected);
+        }
+
+        {
+            bytes memory key4 = hex"873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508";
+            bytes memory message4 = hex"0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c200000001";
+            bytes32 hmac4_1_expected = hex"6505fd0f948587ff19ecb8d9b3892125897eb445e28e0ba23086a888daeb00aa";
+            bytes32 hmac4_2_expected = hex"8dd96414ff4d5b4750be3af7fecce207173f86d6b5f58f9366297180de8e109b";
+            (bytes32 hmac4_1, bytes32 hmac4_2) = Hmac.hmacSha512(key4, message4);
+            assertEq(hmac4_1, hmac4_1_expected);
+            assertEq(hmac4_2, hmac4_2_expected);
+        }
+
+        {
+            bytes memory key5 = hex"873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508";
+            bytes memory message5 = hex"0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c200000002";
+            bytes32 hmac5_1_expected = hex"3e22e6808c5779f1c68e921b0118fd4313fe0c6e1a9138c5d0468d069264b196";
+            bytes32 hmac5_2_expected = hex"6da671c6fba4fe2ff713350cc6c90dd429c24722cfe91ef118e549617ed6664a";
+            (bytes32 hmac5_1, bytes32 hmac5_2) = Hmac.hmacSha512(key5, message5);
+            assertEq(hmac5_1, hmac5_1_expected);
+            assertEq(hmac5_2, hmac5_2_expected);
+        }
+
+        {
+            bytes memory key6 = hex"873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508";
+            bytes memory message6 = hex"0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c2000003e8";
+            bytes32 hmac6_1_expected = hex"2cf8e6d02a5a6680bc8d24b4588e132d59dffbd673718122c9d32a374d8dae7a";
+            bytes32 hmac6_2_expected = hex"894c5e77f78676dc18125da0e5bbe595523034cb6477951171451596958b77ba";
+            (bytes32 hmac6_1, bytes32 hmac6_2) = Hmac.hmacSha512(key6, message6);
+            assertEq(hmac6_1, hmac6_1_expected);
+            assertEq(hmac6_2, hmac6_2_expected);
+        }
+
+        {
+            bytes memory key7 = hex"873dff81c02f525623fd1fe5167eac3a55a049de3d314bb42ee227ffed37d508";
+            bytes memory message7 = hex"0339a36013301597daef41fbe593a02cc513d0b55527ec2df1050e2e8ff49c85c27fffffff";
+            bytes32 hmac7_1_expected = hex"eba1a3ae30ec7732468480504cc12730a8f3d9835ed31e27dc31081f37d20ccb";
+            bytes32 hmac7_2_expected = hex"9417286b9e6afe15702f17bab9bc0f6cb7d257e8438d7710cd5a4769e0895e0c";
+            (bytes32 hmac7_1, bytes32 hmac7_2) = Hmac.hmacSha512(key7, message7);
+            assertEq(hmac7_1, hmac7_1_expected);
+            assertEq(hmac7_2, hmac7_2_expected);
+        }
+    }
+}